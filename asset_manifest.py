@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Indexed manifest of the images the document generators use
+
+The generators used to probe hardcoded paths such as
+/home/ubuntu/upload/LOGOCASCADIA2025.jpg.jpeg with os.path.exists() and
+silently left the logo out when the file was missing. Assets are now looked
+up by logical name in a manifest built from one scan of the repository root
+and client/public. Each entry records the path, size, SHA-256 and pixel
+dimensions. An unknown name or a missing file raises MissingAssetError.
+
+Logical names are file paths relative to their asset directory, without
+extension, lowercased, with anything that is not a letter, digit or / turned
+into _. So cascadia-logo.jpg is "cascadia_logo" and
+client/public/gallery/patio-door-before.jpg is "gallery/patio_door_before".
+When one name exists in several formats, every file is also indexed as
+name_ext (e.g. "gallery/patio_door_1_webp") and the bare name refers to the
+first one in PREFERRED_EXTENSIONS order. ALIASES adds the short names the
+brand books use.
+
+Hashes and dimensions are kept in .cache/assets.json and reused while a
+file's size and mtime are unchanged, so a build only hashes files it has not
+seen before.
+
+    python asset_manifest.py             # list the manifest
+"""
+
+import difflib
+import json
+import os
+import re
+from collections import namedtuple
+
+import image_cache
+import image_probe
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(ROOT, 'client', 'public')
+CACHE_FILE = os.path.join(ROOT, '.cache', 'assets.json')
+# Generated output under client/public, never scanned: its images are not
+# assets of their own, and rebuilding them must not change the manifest
+RESPONSIVE_DIR = os.path.join(PUBLIC_DIR, 'responsive')      # responsive_images.py
+COMPOSITES_DIR = os.path.join(PUBLIC_DIR, 'composites')      # before_after_composites.py
+GENERATED_DIRS = {RESPONSIVE_DIR, COMPOSITES_DIR}
+
+# (directory, scan subdirectories too)
+ASSET_DIRS = [(ROOT, False), (PUBLIC_DIR, True)]
+PREFERRED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.svg', '.gif')
+
+ALIASES = {
+    'logo_concept_1': 'dependable_logo_concept_1',
+    'logo_concept_2': 'dependable_logo_concept_2',
+    'logo_concept_3': 'dependable_logo_concept_3',
+}
+
+Asset = namedtuple('Asset', 'name path size sha256 width height')
+
+_manifest = None
+
+
+class MissingAssetError(LookupError):
+    pass
+
+
+def logical_name(relpath):
+    stem = os.path.splitext(relpath)[0].replace(os.sep, '/').lower()
+    return re.sub(r'[^a-z0-9/]+', '_', stem)
+
+
+def _scan():
+    """Yield (relpath, path, stat) for every image under the asset directories"""
+    for directory, recursive in ASSET_DIRS:
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            with os.scandir(current) as entries:
+                for entry in sorted(entries, key=lambda entry: entry.name):
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not entry.name.startswith('.') and entry.path not in GENERATED_DIRS:
+                            pending.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in PREFERRED_EXTENSIONS:
+                        yield os.path.relpath(entry.path, directory), entry.path, entry.stat()
+
+
+def _pixel_size(path):
+    info = image_probe.probe(path)
+    if info.format == 'SVG':
+        return None, None
+    return info.width, info.height
+
+
+def build_manifest():
+    """Scan the asset directories once and return {logical name: Asset}"""
+    try:
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+
+    records, by_name = {}, {}
+    for relpath, path, stat in _scan():
+        record = cached.get(path)
+        if not record or record['size'] != stat.st_size or record['mtime_ns'] != stat.st_mtime_ns:
+            width, height = _pixel_size(path)
+            record = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                      'sha256': image_cache.file_digest(path), 'width': width, 'height': height}
+        records[path] = record
+        by_name.setdefault(logical_name(relpath), []).append(path)
+
+    if records != cached:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp = f"{CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=1, sort_keys=True)
+        os.replace(tmp, CACHE_FILE)
+
+    def entry(name, path):
+        record = records[path]
+        return Asset(name, path, record['size'], record['sha256'], record['width'], record['height'])
+
+    manifest = {}
+    for name, paths in by_name.items():
+        paths.sort(key=lambda path: PREFERRED_EXTENSIONS.index(os.path.splitext(path)[1].lower()))
+        if name not in manifest:
+            manifest[name] = entry(name, paths[0])
+        if len(paths) > 1:
+            for path in paths:
+                variant = f"{name}_{os.path.splitext(path)[1].lower().lstrip('.')}"
+                manifest[variant] = entry(variant, path)
+    for alias, name in ALIASES.items():
+        if name in manifest:
+            manifest[alias] = manifest[name]._replace(name=alias)
+    return manifest
+
+
+def manifest():
+    """The manifest for this process, scanned on first use"""
+    global _manifest
+    if _manifest is None:
+        _manifest = build_manifest()
+    return _manifest
+
+
+def has(name):
+    return name in manifest()
+
+
+def asset(name):
+    """Look up an asset by logical name; raises MissingAssetError if it is not there"""
+    found = manifest().get(name)
+    if found is None:
+        close = difflib.get_close_matches(name, manifest(), n=3)
+        hint = f" (did you mean {', '.join(close)}?)" if close else ""
+        raise MissingAssetError(f"No asset named {name!r} in {', '.join(d for d, _ in ASSET_DIRS)}{hint}")
+    return found
+
+
+def asset_path(name):
+    return asset(name).path
+
+
+def optional_asset_path(name):
+    """Path of an asset a document can do without, or None with a warning"""
+    if has(name):
+        return asset_path(name)
+    print(f"⚠ Asset {name!r} not found; leaving it out")
+    return None
+
+
+if __name__ == "__main__":
+    for name, entry in sorted(manifest().items()):
+        size = f"{entry.width}x{entry.height}" if entry.width else "-"
+        print(f"{name:<48} {size:>11} {entry.size:>10,}  {os.path.relpath(entry.path, ROOT)}")
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Before/after composites for every gallery pair
+
+The gallery's combined images (basement-reno-combined.jpg,
+patio-door-combined.jpg, ...) were put together by hand, so projects added
+later have none. This builds two composites for every before/after pair
+found by gallery.pair_photos():
+
+    composites/<project>-side-by-side.jpg   before | after, labelled
+    composites/<project>-slider.jpg         the comparison slider at 25/50/75%
+
+under client/public. Both photos are centre-cropped to the aspect ratio of
+the after shot and brought to one panel size, worked out from the image
+headers so that only one photo is decoded at a time, then their exposure is
+normalized: each is scaled in linear light so its median luminance meets the
+pair's geometric mean, with the gain limited to MAX_GAIN either way. All
+pixel work is NumPy array operations (resampling is Pillow's C resize).
+
+Each pair's outputs are keyed by the two source hashes and the recipe in
+.cache/composites.json, so adding a pair builds one set of composites and
+the outputs of pairs that no longer exist are removed.
+
+    python before_after_composites.py
+    python before_after_composites.py --clear     # remove every composite and the index
+"""
+
+import json
+import math
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+from PIL import Image as PILImage, ImageDraw, ImageFont, ImageOps
+
+import asset_manifest
+import image_cache
+from color_space import to_linear, to_srgb
+from gallery import gallery_assets, pair_photos
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = asset_manifest.COMPOSITES_DIR
+INDEX_FILE = os.path.join(ROOT, '.cache', 'composites.json')
+
+# Tallest panel; smaller sources are never upscaled
+PANEL_HEIGHT = 900
+SLIDER_POSITIONS = (0.25, 0.5, 0.75)
+MAX_GAIN = 2.0
+GUTTER = 12
+JPEG_QUALITY = 88
+RECIPE = f"v2-{PANEL_HEIGHT}-{SLIDER_POSITIONS}-{MAX_GAIN}-{GUTTER}-{JPEG_QUALITY}"
+
+# Brand colors as RGB
+BROWN = (0x65, 0x43, 0x21)
+GOLD = (0xB8, 0x86, 0x0B)
+WHITE = (0xFF, 0xFF, 0xFF)
+
+# Rec. 709 luminance weights, applied to linear RGB
+_LUMINANCE = np.array([0.2126, 0.7152, 0.0722])
+
+
+def panel_size(before_path, after_path):
+    """(width, height) of a pair's panels: the after shot's aspect, no taller than either cropped photo"""
+    after_width, after_height = image_cache.displayed_size(after_path)
+    before_width, before_height = image_cache.displayed_size(before_path)
+    aspect = after_width / after_height
+    cropped_height = before_height if before_width / before_height > aspect else round(before_width / aspect)
+    height = min(PANEL_HEIGHT, cropped_height, after_height)
+    return max(1, round(height * aspect)), height
+
+
+def load_panel(path, size):
+    """One photo centre-cropped and resized to size, as a float linear-RGB array
+
+    JPEGs decode at the smallest scale whose crop still covers size, and the
+    decoded photo is released before the next one is loaded.
+    """
+    width, height = image_cache.displayed_size(path)
+    aspect = size[0] / size[1]
+    # The crop keeps the full height of wider photos and the full width of narrower ones
+    scale = size[1] / height if width / height > aspect else size[0] / width
+    with image_cache.decoded(path, (math.ceil(width * scale), math.ceil(height * scale)), displayed=True) as im:
+        im = ImageOps.exif_transpose(im).convert('RGB')
+    panel = crop_to_aspect(im, aspect).resize(size, PILImage.LANCZOS)
+    return to_linear(np.asarray(panel, dtype=np.float64) / 255.0)
+
+
+def crop_to_aspect(im, aspect):
+    """Centre crop to width/height == aspect"""
+    width, height = im.size
+    if width / height > aspect:
+        new_width = round(height * aspect)
+        left = (width - new_width) // 2
+        return im.crop((left, 0, left + new_width, height))
+    new_height = round(width / aspect)
+    top = (height - new_height) // 2
+    return im.crop((0, top, width, top + new_height))
+
+
+def normalize_exposure(before, after):
+    """Scale both linear images so their median luminances meet at the pair's geometric mean"""
+    medians = [max(float(np.median(pixels @ _LUMINANCE)), 1e-4) for pixels in (before, after)]
+    target = float(np.sqrt(medians[0] * medians[1]))
+    return [np.clip(pixels * np.clip(target / median, 1 / MAX_GAIN, MAX_GAIN), 0.0, 1.0)
+            for pixels, median in zip((before, after), medians)]
+
+
+def to_image(linear):
+    return PILImage.fromarray(np.clip(to_srgb(linear) * 255.0 + 0.5, 0, 255).astype(np.uint8), 'RGB')
+
+
+def _label(image, text, x, y):
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=max(14, image.height // 22))
+    left, top, right, bottom = draw.textbbox((x, y), text, font=font)
+    pad = font.size // 3
+    draw.rectangle((left - pad, top - pad, right + pad, bottom + pad), fill=BROWN)
+    draw.text((x, y), text, fill=WHITE, font=font)
+
+
+def side_by_side(before, after):
+    """before | gold gutter | after, each labelled in the top left corner"""
+    height, width, _ = before.shape
+    gutter = np.broadcast_to(np.array(GOLD, dtype=np.float64) / 255.0, (height, GUTTER, 3))
+    image = to_image(np.concatenate([before, to_linear(gutter), after], axis=1))
+    margin = height // 25
+    _label(image, "BEFORE", margin, margin)
+    _label(image, "AFTER", width + GUTTER + margin, margin)
+    return image
+
+
+def slider_strip(before, after):
+    """The comparison slider at each of SLIDER_POSITIONS, frames side by side"""
+    height, width, _ = before.shape
+    columns = np.arange(width)[None, :, None]
+    gold = to_linear(np.array(GOLD, dtype=np.float64) / 255.0)
+    frames = []
+    for position in SLIDER_POSITIONS:
+        split = round(width * position)
+        frame = np.where(columns < split, before, after)
+        frame[:, max(0, split - 2):split + 2] = gold
+        frames.append(frame)
+        frames.append(np.ones((height, GUTTER, 3)))
+    return to_image(np.concatenate(frames[:-1], axis=1))
+
+
+def output_paths(slug):
+    return {
+        'side-by-side': os.path.join(OUTPUT_DIR, f"{slug}-side-by-side.jpg"),
+        'slider': os.path.join(OUTPUT_DIR, f"{slug}-slider.jpg"),
+    }
+
+
+def build_pair(pair):
+    size = panel_size(pair.before, pair.after)
+    before = load_panel(pair.before, size)
+    after = load_panel(pair.after, size)
+    before, after = normalize_exposure(before, after)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    images = {'side-by-side': side_by_side(before, after), 'slider': slider_strip(before, after)}
+    for kind, path in output_paths(pair.slug).items():
+        tmp = f"{path}.{os.getpid()}.tmp"
+        images[kind].save(tmp, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+        os.replace(tmp, path)
+
+
+def pair_key(pair):
+    return f"{image_cache.file_digest(pair.before)[:16]}-{image_cache.file_digest(pair.after)[:16]}-{RECIPE}"
+
+
+def load_index():
+    try:
+        with open(INDEX_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(index):
+    os.makedirs(os.path.dirname(INDEX_FILE), exist_ok=True)
+    tmp = f"{INDEX_FILE}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp, INDEX_FILE)
+
+
+def build():
+    """Build the composites of new and changed pairs; returns {slug: 'built'|'cached'|'removed'}"""
+    pairs, _ = pair_photos(gallery_assets())
+    index = load_index()
+    status = {}
+
+    for slug in set(index) - {pair.slug for pair in pairs}:
+        for path in output_paths(slug).values():
+            if os.path.exists(path):
+                os.remove(path)
+        del index[slug]
+        status[slug] = 'removed'
+
+    for pair in pairs:
+        key = pair_key(pair)
+        if index.get(pair.slug) == key and all(os.path.exists(p) for p in output_paths(pair.slug).values()):
+            status[pair.slug] = 'cached'
+            continue
+        build_pair(pair)
+        index[pair.slug] = key
+        status[pair.slug] = 'built'
+
+    save_index(index)
+    return status
+
+
+def clear():
+    if os.path.isdir(OUTPUT_DIR):
+        shutil.rmtree(OUTPUT_DIR)
+    if os.path.exists(INDEX_FILE):
+        os.remove(INDEX_FILE)
+
+
+if __name__ == "__main__":
+    if '--clear' in sys.argv[1:]:
+        clear()
+        print(f"✓ Cleared {OUTPUT_DIR}")
+    else:
+        started = time.perf_counter()
+        status = build()
+        for slug, state in sorted(status.items()):
+            print(f"  {slug:<28} {state}")
+        built = sum(state == 'built' for state in status.values())
+        print(f"✓ {built} of {len(status)} composite pairs built in {time.perf_counter() - started:.2f}s: {OUTPUT_DIR}")
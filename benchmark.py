@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the document generators
+
+    python benchmark.py                          # every generator + synthetic books
+    python benchmark.py complete synthetic-1000  # selected cases
+    python benchmark.py --save-baseline          # store the results as the new baseline
+    python benchmark.py --threshold 0.15         # fail on a >15% regression
+
+Every case calls a generator's build(path) as a function, in a forked child so
+that its peak RSS is its own. Each case records wall time, CPU time, peak RSS,
+page count and output bytes; the synthetic-N cases lay out N pages of brand
+book content to show how a build scales. Batch generators that write a
+directory of PDFs (location-one-pagers) are given a directory and counted
+over every PDF in it. For generators that render in a process pool, CPU
+time includes the workers and peak RSS is that of the largest process.
+
+Results are written to build/benchmark.json. The comparison with a stored
+baseline is optional: timings depend on the machine, so no baseline is
+committed, and until --save-baseline has written benchmark_baseline.json on
+this machine the run only reports. Once there is one, a case regresses when
+its wall time, CPU time or peak RSS exceeds the baseline by more than the
+threshold; the exit status is then 1.
+
+A case whose build raises, crashes or runs past --timeout is reported as
+failed and also makes the exit status 1.
+
+--max-rss-mb sets a memory ceiling for every build, checked on its own and
+without a baseline: a case whose peak RSS goes over it fails the run too.
+The default comes from BRAND_MEMORY_CEILING_MB; unset means no ceiling.
+
+    python benchmark.py gallery-portfolio --max-rss-mb 300
+"""
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import queue as queue_module
+import resource
+import shutil
+import sys
+import time
+
+import brand_engine
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FILE = os.path.join(ROOT, 'build', 'benchmark.json')
+BASELINE_FILE = os.path.join(ROOT, 'benchmark_baseline.json')
+DEFAULT_THRESHOLD = 0.10
+# Seconds a single build may take before it is killed and counted as failed
+DEFAULT_TIMEOUT = 900
+DEFAULT_MAX_RSS_MB = float(os.environ['BRAND_MEMORY_CEILING_MB']) if os.environ.get('BRAND_MEMORY_CEILING_MB') else None
+
+GENERATORS = dict(brand_engine.VARIANTS, **{
+    'project-document': 'create_project_document',
+    'project-proposal': 'create_project_proposal',
+    'gallery-portfolio': 'create_gallery_portfolio',
+    'blog-ebook': 'create_blog_ebook',
+    'faq-handbook': 'create_faq_handbook',
+    'case-studies': 'create_case_studies',
+    'review-cards': 'create_review_cards',
+    'location-one-pagers': 'create_location_one_pagers',
+})
+DOCX_GENERATORS = {'project-document', 'project-proposal'}
+# build(path) takes an output directory and writes one PDF per item into it
+DIRECTORY_GENERATORS = {'location-one-pagers'}
+SYNTHETIC_PAGES = (10, 100, 1000)
+
+# Compared against the baseline; pages and bytes are reported only
+METRICS = ('wall_s', 'cpu_s', 'peak_rss_kb')
+
+
+def cases():
+    names = list(GENERATORS)
+    names.extend(f"synthetic-{pages}" for pages in SYNTHETIC_PAGES)
+    return names
+
+
+def output_file(name, output_dir):
+    if name in DIRECTORY_GENERATORS:
+        return os.path.join(output_dir, 'benchmark', name)
+    extension = '.docx' if name in DOCX_GENERATORS else '.pdf'
+    return os.path.join(output_dir, 'benchmark', name + extension)
+
+
+def output_pdfs(path):
+    if os.path.isdir(path):
+        return [os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.pdf')]
+    return [path] if path.endswith('.pdf') else []
+
+
+def output_bytes(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(pdf) for pdf in output_pdfs(path))
+    return os.path.getsize(path)
+
+
+def build_synthetic(pdf_file, pages):
+    """Lay out `pages` pages of headings, body text and tables in the brand styles"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+
+    import brand_canvas
+    from brand_styles import BROWN, GOLD, CREAM, WHITE, MARGIN, PAGE_WIDTH, PAGE_HEIGHT, paragraph_style
+
+    heading = paragraph_style('BenchHeading', fontSize=24, textColor=BROWN, spaceAfter=12, fontName='Helvetica-Bold')
+    body = paragraph_style('BenchBody', fontSize=11, leading=15, spaceAfter=8, fontName='Helvetica')
+    text = ("Dependable Home Improvement is a premier home improvement and handyman service serving "
+            "Bergen County, New Jersey. Every project is finished with the same attention to detail. ")
+    story = []
+    for page in range(1, pages + 1):
+        story.append(Paragraph(f"Section {page}", heading))
+        story.append(Paragraph(text * 3, body))
+        story.append(Spacer(1, 0.2 * inch))
+        table = Table([["Element", "Font", "Size"]] + [[f"Item {row}", "Playfair Display", f"{row + 10}pt"] for row in range(6)],
+                      colWidths=[2.5 * inch, 3 * inch, 1.5 * inch])
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), BROWN),
+            ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
+            ('GRID', (0, 0), (-1, -1), 1, GOLD),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [WHITE, CREAM]),
+        ]))
+        story.append(table)
+        story.append(PageBreak())
+    doc = SimpleDocTemplate(pdf_file, pagesize=(PAGE_WIDTH, PAGE_HEIGHT), rightMargin=MARGIN,
+                            leftMargin=MARGIN, topMargin=MARGIN, bottomMargin=MARGIN)
+    doc.build(story, canvasmaker=brand_canvas.NumberedCanvas)
+
+
+def load_case(name):
+    """The build(path) function of a case; raises ImportError/OSError if its renderer is missing"""
+    if name.startswith('synthetic-'):
+        pages = int(name.split('-', 1)[1])
+        return lambda path: build_synthetic(path, pages)
+    return importlib.import_module(GENERATORS[name]).build
+
+
+def page_count(path):
+    pdfs = output_pdfs(path)
+    if not pdfs:
+        return None
+    from pypdf import PdfReader
+
+    return sum(len(PdfReader(pdf).pages) for pdf in pdfs)
+
+
+def _measure(name, path, queue):
+    """Child-process body: build, then report the measurements back
+
+    Only a generator whose renderer cannot be imported (WeasyPrint needs
+    Pango/Cairo system libraries) is skipped; any error during the build
+    itself, an OSError included, is a failure.
+    """
+    # Printing from every generator would drown the report
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        build = load_case(name)
+    except (ImportError, OSError) as exc:
+        queue.put({'skipped': _first_line(exc)})
+        return
+    except Exception as exc:
+        queue.put({'failed': f"{type(exc).__name__}: {_first_line(exc)}"})
+        return
+    try:
+        cpu_started = time.process_time() + _children_cpu()
+        started = time.perf_counter()
+        build(path)
+        wall = time.perf_counter() - started
+        cpu = time.process_time() + _children_cpu() - cpu_started
+        queue.put({
+            'wall_s': round(wall, 4),
+            'cpu_s': round(cpu, 4),
+            'peak_rss_kb': max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss),
+            'pages': page_count(path),
+            'bytes': output_bytes(path),
+        })
+    except Exception as exc:
+        queue.put({'failed': f"{type(exc).__name__}: {_first_line(exc)}"})
+
+
+def _children_cpu():
+    """CPU seconds of the finished child processes, such as a generator's pool workers"""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _first_line(exc):
+    lines = str(exc).splitlines()
+    return lines[0] if lines else type(exc).__name__
+
+
+def _result(child, queue, timeout):
+    """Wait for the child's result; a child that dies without one or overruns has failed"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return queue.get(timeout=1)
+        except queue_module.Empty:
+            if not child.is_alive():
+                return {'failed': f"build process exited with code {child.exitcode}"}
+            if time.monotonic() > deadline:
+                child.kill()
+                return {'failed': f"timed out after {timeout:g}s"}
+
+
+def measure(name, output_dir, repeat=1, timeout=DEFAULT_TIMEOUT):
+    """Run a case `repeat` times and keep the fastest run"""
+    path = output_file(name, output_dir)
+    if name in DIRECTORY_GENERATORS and os.path.isdir(path):
+        shutil.rmtree(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    context = multiprocessing.get_context('fork')
+    best = None
+    for _ in range(repeat):
+        queue = context.Queue()
+        child = context.Process(target=_measure, args=(name, path, queue))
+        child.start()
+        result = _result(child, queue, timeout)
+        child.join()
+        if 'skipped' in result or 'failed' in result:
+            return result
+        if best is None or result['wall_s'] < best['wall_s']:
+            best = result
+    return best
+
+
+def compare(results, baseline, threshold):
+    """Return [(case, metric, baseline value, value)] for every regression"""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous or not measured(result) or not measured(previous):
+            continue
+        for metric in METRICS:
+            if previous.get(metric) and result[metric] > previous[metric] * (1 + threshold):
+                regressions.append((name, metric, previous[metric], result[metric]))
+    return regressions
+
+
+def over_ceiling(results, max_rss_mb):
+    """Return [(case, peak RSS in MB)] for every case over the memory ceiling"""
+    if not max_rss_mb:
+        return []
+    return [(name, result['peak_rss_kb'] / 1024) for name, result in results.items()
+            if measured(result) and result['peak_rss_kb'] / 1024 > max_rss_mb]
+
+
+def measured(result):
+    return 'skipped' not in result and 'failed' not in result
+
+
+def load_json(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the document generators")
+    parser.add_argument('cases', nargs='*', metavar='case', help="cases to run (default: all)")
+    parser.add_argument('--list', action='store_true', help="list the available cases")
+    parser.add_argument('--repeat', type=int, default=1, help="runs per case; the fastest is kept")
+    parser.add_argument('--output-dir', default=brand_engine.OUTPUT_DIR)
+    parser.add_argument('--results', default=RESULTS_FILE)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before a case counts as a regression (0.10 = 10%%)")
+    parser.add_argument('--max-rss-mb', type=float, default=DEFAULT_MAX_RSS_MB,
+                        help="fail any case whose peak RSS exceeds this many MB (default: BRAND_MEMORY_CEILING_MB)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help="seconds a build may run before it counts as failed (default: %(default)s)")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the baseline")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in cases():
+            print(name)
+        return 0
+
+    unknown = [name for name in args.cases if name not in cases()]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)} (see --list)")
+
+    # The generators resolve their assets relative to the repository root
+    os.chdir(ROOT)
+    results = {}
+    for name in args.cases or cases():
+        results[name] = result = measure(name, args.output_dir, args.repeat, args.timeout)
+        if 'skipped' in result:
+            print(f"✗ {name:<20} skipped: {result['skipped']}")
+        elif 'failed' in result:
+            print(f"✗ {name:<20} FAILED: {result['failed']}")
+        else:
+            pages = result['pages'] if result['pages'] is not None else '-'
+            print(f"✓ {name:<20} {result['wall_s']:8.3f}s wall {result['cpu_s']:8.3f}s cpu "
+                  f"{result['peak_rss_kb'] / 1024:8.1f} MB rss {pages:>5} pages {result['bytes']:>10,} bytes")
+
+    write_json(args.results, results)
+    print(f"Results written to {args.results}")
+    failed = [name for name, result in results.items() if 'failed' in result]
+
+    over = over_ceiling(results, args.max_rss_mb)
+    for name, rss_mb in over:
+        print(f"OVER MEMORY CEILING {name}: {rss_mb:.1f} MB > {args.max_rss_mb:g} MB")
+    if args.max_rss_mb and not over:
+        print(f"Every case within the {args.max_rss_mb:g} MB memory ceiling")
+
+    if args.save_baseline:
+        write_json(args.baseline, dict(load_json(args.baseline), **{name: result for name, result in results.items()
+                                                                    if measured(result)}))
+        print(f"Baseline updated: {args.baseline}")
+        return 1 if over or failed else 0
+
+    baseline = load_json(args.baseline)
+    if not baseline:
+        print(f"No baseline at {args.baseline}; comparison skipped (run with --save-baseline to store one)")
+        return 1 if over or failed else 0
+    regressions = compare(results, baseline, args.threshold)
+    for name, metric, before, after in regressions:
+        print(f"REGRESSION {name} {metric}: {before} -> {after} (+{(after / before - 1) * 100:.0f}%)")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} of the baseline")
+    return 1 if regressions or over or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
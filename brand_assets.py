@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Shared image loading for the ReportLab documents
+
+Images placed at a fixed size are first resampled to that size through the
+on-disk cache in image_cache.py. Decoded images are then cached per file for
+the lifetime of the interpreter, so a logo placed in several documents (or
+several times in one) is read and decoded once when the variants are built
+together through brand_engine.py.
+
+LazyImage defers all of that to layout and drawing time, for documents
+with more photos than should be held in memory at once.
+
+SVG logos are drawn as vector paths instead (VectorImage): the SVG is
+parsed into a ReportLab Drawing once per content hash, and each document
+draws it into a form XObject the first time it appears and references that
+form wherever else it is placed.
+"""
+
+import os
+
+from reportlab.graphics import renderPDF
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable, Image
+
+import image_cache
+import image_probe
+
+_image_readers = {}
+_drawings = {}
+
+
+def image_reader(path):
+    """Return the shared decoded ImageReader for an image file"""
+    path = os.path.abspath(path)
+    reader = _image_readers.get(path)
+    if reader is None:
+        reader = _image_readers[path] = ImageReader(path)
+    return reader
+
+
+def fitted_size(path, width=None, height=None, kind='direct'):
+    """Placement size for an image, completing or fitting width/height from its header"""
+    if not width and not height:
+        return width, height
+    ratio = image_probe.aspect_ratio(path)
+    if not height:
+        return width, width / ratio
+    if not width:
+        return height * ratio, height
+    if kind in ('bound', 'proportional'):
+        return min(width, height * ratio), min(height, width / ratio)
+    return width, height
+
+
+class SharedImage(Image):
+    """Image flowable that draws from the shared decoded image cache
+
+    Given only a width or a height, the other follows from the file's aspect
+    ratio; kind='bound' or 'proportional' fits the image inside width x
+    height. Both read just the image header (image_probe.py). The source is
+    then swapped for a rendition resampled to the final size at `dpi`. JPEGs
+    keep ReportLab's own handling: they are embedded straight from the file
+    without being decoded.
+    """
+
+    def __init__(self, filename, width=None, height=None, kind='direct', dpi=image_cache.DEFAULT_DPI, **kwargs):
+        if isinstance(filename, str) and kind in ('direct', 'absolute', 'bound', 'proportional'):
+            width, height = fitted_size(filename, width, height, kind)
+            kind = 'direct'
+            if width and height:
+                filename = image_cache.downsampled_path(filename, width, height, dpi)
+        Image.__init__(self, filename, width, height, kind, **kwargs)
+
+    def __getattr__(self, a):
+        if a == '_img':
+            self._img = image_reader(self._file)
+            return self._img
+        return Image.__getattr__(self, a)
+
+
+class LazyImage(Flowable):
+    """Image flowable that only touches its file when it is laid out and drawn
+
+    Sizing follows SharedImage, but nothing is read when the flowable is
+    made: wrap() reads just the image header, and draw() fetches the
+    rendition for the placed size from image_cache and draws it by path, so
+    the canvas decides when the bytes are read. No decoded image is kept on
+    the flowable or in the shared reader cache, which keeps a story of many
+    photos from holding them all in memory.
+    """
+
+    def __init__(self, filename, width=None, height=None, kind='direct', dpi=image_cache.DEFAULT_DPI):
+        Flowable.__init__(self)
+        self.filename = filename
+        self._box = (width, height)
+        self.kind = kind
+        self.dpi = dpi
+        self.drawWidth = self.drawHeight = None
+
+    def wrap(self, availWidth, availHeight):
+        if self.drawWidth is None:
+            width, height = self._box
+            if not width and not height:
+                width, height = image_probe.size_in_points(self.filename)
+            self.drawWidth, self.drawHeight = fitted_size(self.filename, width, height, self.kind)
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        path = image_cache.downsampled_path(self.filename, self.drawWidth, self.drawHeight, self.dpi)
+        self.canv.drawImage(path, 0, 0, self.drawWidth, self.drawHeight, mask='auto')
+
+
+def svg_drawing(path):
+    """Return the shared Drawing parsed from an SVG file, one per content hash"""
+    digest = image_cache.file_digest(path)
+    drawing = _drawings.get(digest)
+    if drawing is None:
+        from svglib.svglib import svg2rlg
+
+        drawing = _drawings[digest] = svg2rlg(path)
+    return drawing
+
+
+class VectorImage(Flowable):
+    """SVG image flowable drawn as vector paths
+
+    Sizing follows SharedImage: width and/or height, with kind='bound' or
+    'proportional' to fit inside the box; with neither, the SVG's own size.
+    The paths are written once per document as a form XObject named after
+    the file's content hash, and every placement references that form.
+    """
+
+    def __init__(self, filename, width=None, height=None, kind='direct'):
+        Flowable.__init__(self)
+        self.filename = filename
+        self.digest = image_cache.file_digest(filename)
+        if not width and not height:
+            width, height = image_probe.size_in_points(filename)
+        self.drawWidth, self.drawHeight = fitted_size(filename, width, height, kind)
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        canvas = self.canv
+        drawing = svg_drawing(self.filename)
+        name = f"Svg{self.digest[:32]}"
+        if not canvas.hasForm(name):
+            canvas.beginForm(name, 0, 0, drawing.width, drawing.height)
+            renderPDF.draw(drawing, canvas, 0, 0)
+            canvas.endForm()
+        canvas.saveState()
+        canvas.scale(self.drawWidth / drawing.width, self.drawHeight / drawing.height)
+        canvas.doForm(name)
+        canvas.restoreState()
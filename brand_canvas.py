@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Page-numbering canvas shared by the ReportLab brand books
+
+The original NumberedCanvas kept a dict(self.__dict__) snapshot of every page
+until save(), so memory grew with page count. This canvas lets each page go
+straight to the document and only stamps the "Page X of Y" footers onto the
+finished page streams once the total is known.
+
+ImageDedupCanvas, which NumberedCanvas builds on, embeds each distinct image
+once per document, keyed by the content hash of the source file, however
+many times, from whichever path and at whatever size it is placed. The
+stream kept is the one for the largest placement, embedded without
+re-encoding where image_embed.py allows. image_reports holds the bytes saved
+and the embedding route per output file.
+
+tests/test_brand_canvas.py checks that the numbering overhead stays flat.
+"""
+
+import io
+import os
+
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfgen import canvas
+
+import image_cache
+import image_embed
+import image_probe
+
+# Output file -> [(source, placements, renditions, embedded bytes, saved bytes, route)]
+image_reports = {}
+
+
+class ImageDedupCanvas(canvas.Canvas):
+    """Canvas that embeds every source image once, at its largest placement
+
+    drawImage() only records the placement; the image XObjects are created
+    at save time, when every placement of the document is known.
+    """
+
+    def __init__(self, *args, **kwargs):
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self._image_sources = {}
+
+    def drawImage(self, image, x, y, width=None, height=None, mask=None, preserveAspectRatio=False, **kwargs):
+        path = image if isinstance(image, str) else getattr(image, 'fileName', None)
+        if width is None or height is None or preserveAspectRatio or not isinstance(path, str):
+            return canvas.Canvas.drawImage(self, image, x, y, width, height, mask=mask,
+                                           preserveAspectRatio=preserveAspectRatio, **kwargs)
+        self._currentPageHasImages = 1
+        digest = image_cache.source_digest(path)
+        name = f"Img{digest[:32]}" + ('' if mask == 'auto' else f"m{_digest_text(str(mask))}")
+        source = self._image_sources.setdefault(name, {'mask': mask, 'placements': 0, 'renditions': set()})
+        source['placements'] += 1
+        source['renditions'].add(os.path.abspath(path))
+
+        self.saveState()
+        self.translate(x, y)
+        self.scale(width, height)
+        self._code.append(f"/{self._doc.getXObjectName(name)} Do")
+        self.restoreState()
+        self._formsinuse.append(name)
+        return width, height
+
+    def save(self):
+        self._embed_images()
+        canvas.Canvas.save(self)
+
+    def getpdfdata(self):
+        self._embed_images()
+        return canvas.Canvas.getpdfdata(self)
+
+    def _embed_images(self):
+        """Register one image XObject per source, from its largest rendition"""
+        report = []
+        for name, source in self._image_sources.items():
+            renditions = source['renditions']
+            largest = max(renditions, key=lambda path: _pixel_count(path))
+            # Decoded from the file rather than the ImageReader, so no decoded copy outlives the build
+            image_obj, route = image_embed.image_xobject(name, largest, mask=source['mask'])
+            image_obj.name = name
+            self._doc.Reference(image_obj, self._doc.getXObjectName(name))
+            smask = getattr(image_obj, '_smask', None)
+            if smask:
+                image_obj.smask = self._doc.Reference(smask, self._doc.getXObjectName(smask.name))
+                del image_obj._smask
+            embedded = len(image_obj.streamContent) + (len(smask.streamContent) if smask else 0)
+            # What one XObject per rendition would have added on top, estimated from the files
+            saved = sum(os.path.getsize(path) for path in renditions if path != largest)
+            report.append((os.path.basename(image_cache.source_path(largest)), source['placements'], len(renditions),
+                           embedded, saved, route))
+        self._image_sources = {}
+        if report:
+            image_reports[getattr(self, '_filename', None)] = report
+
+
+def _digest_text(text):
+    return pdfdoc._digester(text.encode('utf-8'))[:8]
+
+
+def _pixel_count(path):
+    info = image_probe.probe(path)
+    return info.width * info.height
+
+
+def print_image_report(report):
+    for source, placements, renditions, embedded, saved, route in report:
+        print(f"  {source:<44} {placements:>2} placed {renditions:>2} sizes "
+              f"{embedded / 1024:>8.1f} KB embedded  {saved / 1024:>8.1f} KB saved  {image_embed.ROUTES[route]}")
+    fast = sum(row[5] != 'decoded' for row in report)
+    print(f"  {len(report)} images, {sum(row[1] for row in report)} placements, "
+          f"{sum(row[4] for row in report) / 1024:.1f} KB saved, {fast} embedded without decoding")
+
+
+class NumberedCanvas(ImageDedupCanvas):
+    """Drop-in canvasmaker that adds page number footers at save time"""
+
+    footer_format = "Page {page} of {total}"
+    footer_font = ("Helvetica", 9)
+    footer_color = colors.grey
+    footer_margin = 0.75 * inch
+    footer_y = 0.5 * inch
+    skip_cover = True
+
+    def save(self):
+        self._stamp_page_numbers()
+        ImageDedupCanvas.save(self)
+
+    def getpdfdata(self):
+        self._stamp_page_numbers()
+        return ImageDedupCanvas.getpdfdata(self)
+
+    def _stamp_page_numbers(self):
+        if len(self._code):
+            self.showPage()
+        pages = self._doc.Pages.pages
+        page_count = len(pages)
+        for page_num, page in enumerate(pages, 1):
+            if page_num == 1 and self.skip_cover:
+                continue
+            page.stream += self._footer_code(page_num, page_count, page.pagewidth)
+
+    def _footer_code(self, page_num, page_count, page_width):
+        """Render the footer operators for one page into a detached buffer"""
+        page_code, self._code = self._code, []
+        self.saveState()
+        self.draw_page_number(page_num, page_count, page_width)
+        self.restoreState()
+        footer_code, self._code = self._code, page_code
+        return '\n'.join(footer_code) + '\n'
+
+    def footer_fields(self):
+        """Extra fields for footer_format besides {page} and {total}"""
+        return {}
+
+    def draw_page_number(self, page_num, page_count, page_width):
+        self.setFont(*self.footer_font)
+        self.setFillColor(self.footer_color)
+        self.drawRightString(page_width - self.footer_margin, self.footer_y,
+                             self.footer_format.format(page=page_num, total=page_count, **self.footer_fields()))
+
+
+def page_number_overlay(canvasmaker, page_sizes):
+    """PDF bytes holding only the footers a canvasmaker would stamp
+
+    Used to number books that are assembled from separately rendered PDFs:
+    each overlay page is merged onto the matching page of the assembled book.
+    """
+    buf = io.BytesIO()
+    c = canvasmaker(buf, pagesize=page_sizes[0])
+    for page_size in page_sizes:
+        c.setPageSize(page_size)
+        c.showPage()
+    c.save()
+    return buf.getvalue()
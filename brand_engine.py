@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Build any or all brand book variants in a single process
+
+    python brand_engine.py                        # every variant into build/
+    python brand_engine.py complete professional  # selected variants
+    python brand_engine.py --list
+    python brand_engine.py --compare              # also time the scripts run one by one
+
+Every create_*.py variant exposes build(pdf_file). Building them here shares
+the ReportLab import, the cached ParagraphStyles from brand_styles and the
+decoded images from brand_assets between variants, instead of paying for all
+of it again in every script.
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(ROOT, 'build')
+
+VARIANTS = {
+    'complete': 'create_complete_brandbook',
+    'final': 'create_final_brandbook',
+    'corrected': 'create_corrected_brandbook',
+    'final-corrected': 'create_final_corrected_brandbook',
+    'professional': 'create_professional_brandbook',
+    'logo-presentation': 'create_logo_presentation',
+    'landscape-html': 'create_brand_book_landscape',
+    'portrait-html': 'create_brand_book_pdf',
+}
+
+
+def output_path(name, output_dir=OUTPUT_DIR):
+    return os.path.join(output_dir, f"{name}.pdf")
+
+
+def load_variant(name):
+    """Import a variant module; raises ImportError/OSError if its renderer is missing"""
+    return importlib.import_module(VARIANTS[name])
+
+
+def build_variants(names=None, output_dir=OUTPUT_DIR):
+    """Build variants in this interpreter
+
+    Returns ({name: seconds}, {name: reason}) for the built and the skipped
+    variants. A variant is skipped only when its renderer cannot be imported
+    (WeasyPrint needs Pango/Cairo system libraries).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    timings, skipped = {}, {}
+    for name in names or VARIANTS:
+        started = time.perf_counter()
+        try:
+            module = load_variant(name)
+        except (ImportError, OSError) as exc:
+            skipped[name] = str(exc).splitlines()[0]
+            continue
+        module.build(output_path(name, output_dir))
+        timings[name] = time.perf_counter() - started
+    return timings, skipped
+
+
+def time_separate_scripts(names, output_dir=OUTPUT_DIR):
+    """Build each variant in a fresh interpreter, the way the scripts run on their own"""
+    timings = {}
+    for name in names:
+        code = f"import {VARIANTS[name]} as variant; variant.build({output_path(name, output_dir)!r})"
+        started = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build brand book variants in one process")
+    parser.add_argument('variants', nargs='*', metavar='variant',
+                        help="variants to build (default: all)")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    parser.add_argument('--list', action='store_true', help="list the available variants")
+    parser.add_argument('--compare', action='store_true',
+                        help="also build each variant in its own interpreter and compare wall time")
+    parser.add_argument('--image-report', action='store_true',
+                        help="show the embedded images of each variant and the bytes saved by de-duplication")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, module in VARIANTS.items():
+            print(f"{name:<18} {module}.py")
+        return 0
+
+    unknown = [name for name in args.variants if name not in VARIANTS]
+    if unknown:
+        parser.error(f"unknown variant(s): {', '.join(unknown)} (see --list)")
+
+    # The variants resolve their assets relative to the repository root
+    os.chdir(ROOT)
+    names = args.variants or list(VARIANTS)
+
+    started = time.perf_counter()
+    timings, skipped = build_variants(names, args.output_dir)
+    total = time.perf_counter() - started
+
+    print()
+    for name, reason in skipped.items():
+        print(f"✗ {name} skipped: {reason}")
+    for name, seconds in timings.items():
+        print(f"✓ {name:<18} {seconds:6.2f}s  {output_path(name, args.output_dir)}")
+    print(f"Built {len(timings)} variant(s) in one process: {total:.2f}s")
+
+    if args.image_report:
+        import brand_canvas
+
+        for name in timings:
+            report = brand_canvas.image_reports.get(output_path(name, args.output_dir))
+            if report:
+                print(f"\nImages in {name}:")
+                brand_canvas.print_image_report(report)
+
+    if args.compare and timings:
+        separate = time_separate_scripts(list(timings), args.output_dir)
+        separate_total = sum(separate.values())
+        print(f"Same variants as separate scripts: {separate_total:.2f}s "
+              f"({separate_total / total:.1f}x the single-process time)")
+
+    return 1 if skipped else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
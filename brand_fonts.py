@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Brand typefaces for the ReportLab documents
+
+The brand book specifies Playfair Display for headlines, but without a
+registered TTF the generators could only use Helvetica-Bold. register()
+registers Playfair Display (regular, bold, italic, bold italic) from the
+local font directory, fonts/ or $BRAND_FONT_DIR, using the static TTFs as
+distributed by Google Fonts (PlayfairDisplay-Bold.ttf, ...).
+
+Parsing a TTF's tables is the slow part of registering it, so the parsed
+metrics are pickled to .cache/fonts, keyed by the font file's content hash
+and the ReportLab version; later runs only read the raw font bytes back for
+embedding. ReportLab embeds TrueType fonts as subsets, so each PDF carries
+only the glyphs it actually uses.
+
+The TTFs are not committed. Download Playfair Display from Google Fonts
+(https://fonts.google.com/specimen/Playfair+Display) and copy the four files
+named in FACES from its static/ folder into fonts/ next to this script (see
+fonts/README.md), or point $BRAND_FONT_DIR at a directory holding them.
+Faces whose file is missing fall back to the Helvetica face the documents
+used before, with a warning printed once per process, so the generators
+still run on a machine without the fonts.
+
+    python brand_fonts.py             # show which faces are available
+    python brand_fonts.py --clear     # drop the cached metrics
+"""
+
+import os
+import pickle
+import sys
+from fnmatch import fnmatch
+from weakref import WeakKeyDictionary
+
+import reportlab
+from reportlab import rl_config
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace, TTEncoding, unShapedFontGlob
+
+import image_cache
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+FONT_DIR = os.environ.get('BRAND_FONT_DIR', os.path.join(ROOT, 'fonts'))
+CACHE_DIR = os.path.join(ROOT, '.cache', 'fonts')
+
+# Registered name -> (file name, Helvetica fallback)
+FACES = {
+    'PlayfairDisplay': ('PlayfairDisplay-Regular.ttf', 'Helvetica'),
+    'PlayfairDisplay-Bold': ('PlayfairDisplay-Bold.ttf', 'Helvetica-Bold'),
+    'PlayfairDisplay-Italic': ('PlayfairDisplay-Italic.ttf', 'Helvetica-Oblique'),
+    'PlayfairDisplay-BoldItalic': ('PlayfairDisplay-BoldItalic.ttf', 'Helvetica-BoldOblique'),
+}
+
+# Face attributes rebuilt on load instead of pickled
+_UNPICKLED = ('_ttf_data', '_pdfScale')
+
+_registered = None
+_warned = set()
+
+
+class CachedTTFont(TTFont):
+    """TTFont whose parsed face comes from the on-disk metrics cache when possible"""
+
+    def __init__(self, name, filename, asciiReadable=None, shapable=True):
+        self.fontName = name
+        self.face = load_face(filename)
+        self.encoding = TTEncoding()
+        self.state = WeakKeyDictionary()
+        if asciiReadable is None:
+            asciiReadable = rl_config.ttfAsciiReadable
+        self._asciiReadable = asciiReadable
+        self.shapable = shapable and not any(fnmatch(name, glob) for glob in unShapedFontGlob)
+
+
+def _cache_path(filename):
+    return os.path.join(CACHE_DIR, f"{image_cache.file_digest(filename)[:32]}-{reportlab.Version}.pickle")
+
+
+def load_face(filename):
+    """Parsed TTFontFace for a font file, from the metrics cache if present"""
+    path = _cache_path(filename)
+    with open(filename, 'rb') as f:
+        ttf_data = f.read()
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        face = TTFontFace.__new__(TTFontFace)
+        face.__dict__.update(state)
+    else:
+        face = TTFontFace(filename)
+        state = {key: value for key, value in vars(face).items() if key not in _UNPICKLED}
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    face._ttf_data = ttf_data
+    scale = 1000 / face.unitsPerEm
+    face._pdfScale = (lambda x: x) if face.unitsPerEm == 1000 else (lambda x: x * scale)
+    face.filename = filename
+    return face
+
+
+def register(font_dir=None):
+    """Register the brand faces found in font_dir
+
+    Returns {face name: name to use in styles}; a face whose TTF is missing
+    maps to its Helvetica fallback. Registration happens once per process.
+    """
+    global _registered
+    if _registered is not None and font_dir is None:
+        return _registered
+    font_dir = font_dir or FONT_DIR
+    names, missing = {}, []
+    for name, (file_name, fallback) in FACES.items():
+        path = os.path.join(font_dir, file_name)
+        if os.path.exists(path):
+            pdfmetrics.registerFont(CachedTTFont(name, path))
+            names[name] = name
+        else:
+            names[name] = fallback
+            missing.append(file_name)
+    if missing and os.path.abspath(font_dir) not in _warned:
+        _warned.add(os.path.abspath(font_dir))
+        print(f"⚠ {', '.join(missing)} not in {font_dir}; using Helvetica instead (see fonts/README.md)")
+    if all(names[name] == name for name in FACES):
+        pdfmetrics.registerFontFamily('PlayfairDisplay', normal='PlayfairDisplay', bold='PlayfairDisplay-Bold',
+                                      italic='PlayfairDisplay-Italic', boldItalic='PlayfairDisplay-BoldItalic')
+    _registered = names
+    return names
+
+
+def font(name):
+    """Registered font name for a brand face, or its Helvetica fallback"""
+    return register()[name]
+
+
+def clear():
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+
+if __name__ == "__main__":
+    if '--clear' in sys.argv[1:]:
+        clear()
+        print(f"✓ Cleared {CACHE_DIR}")
+    else:
+        for name, resolved in register().items():
+            status = "registered" if resolved == name else f"missing, using {resolved}"
+            print(f"{name:<28} {status}")
+        print(f"Font directory: {FONT_DIR}")
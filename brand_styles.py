@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Brand colors, page geometry and shared ParagraphStyle objects for the ReportLab documents
+
+Every generator used to define the same BROWN/GOLD/CREAM palette and rebuild
+its ParagraphStyles from scratch. Styles created through paragraph_style() are
+cached by name and attributes, so identical definitions in different brand
+book variants resolve to one shared object per interpreter.
+"""
+
+from reportlab.lib.pagesizes import landscape, letter
+from reportlab.lib.units import inch
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.colors import HexColor
+
+import brand_fonts
+
+# Define brand colors
+BROWN = HexColor('#654321')
+GOLD = HexColor('#B8860B')
+CREAM = HexColor('#F5F5DC')
+CHARCOAL = HexColor('#36454F')
+WHITE = HexColor('#FFFFFF')
+
+# Headline typeface (Playfair Display when its TTFs are installed)
+HEADLINE_FONT = brand_fonts.font('PlayfairDisplay-Bold')
+
+# Page size
+PAGE_WIDTH, PAGE_HEIGHT = landscape(letter)
+MARGIN = 0.75 * inch
+
+_sample_styles = None
+_paragraph_styles = {}
+
+
+def sample_styles():
+    """ReportLab's sample stylesheet, built once and shared"""
+    global _sample_styles
+    if _sample_styles is None:
+        _sample_styles = getSampleStyleSheet()
+    return _sample_styles
+
+
+def paragraph_style(name, **attrs):
+    """Return a shared ParagraphStyle for this name and set of attributes
+
+    Styles are treated as read-only once created; derive a new style with
+    parent= instead of mutating a shared one.
+    """
+    key = (name, tuple(sorted((attr, _style_key(value)) for attr, value in attrs.items())))
+    style = _paragraph_styles.get(key)
+    if style is None:
+        style = _paragraph_styles[key] = ParagraphStyle(name, **attrs)
+    return style
+
+
+def _style_key(value):
+    if isinstance(value, (list, dict)):
+        return repr(value)
+    return value
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+sRGB transfer functions for image arithmetic in linear light
+
+Blurring, averaging and exposure scaling are done on linear values; 8-bit
+sRGB pixel values are gamma encoded, so averaging them directly darkens
+edges and shifts mid-tones. Both functions take and return numpy arrays of
+floats in 0..1.
+
+    linear = to_linear(np.asarray(image, dtype=np.float64) / 255.0)
+    pixels = np.clip(to_srgb(linear) * 255.0 + 0.5, 0, 255).astype(np.uint8)
+"""
+
+import numpy as np
+
+
+def to_linear(srgb):
+    """sRGB-encoded values to linear light"""
+    return np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+
+
+def to_srgb(linear):
+    """Linear light to sRGB-encoded values"""
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * np.power(linear, 1 / 2.4) - 0.055)
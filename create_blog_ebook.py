@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Create the downloadable blog e-book from client/public/blog-posts.json
+
+Every post becomes a chapter: its featured image, title, byline and the
+post's markdown content (## and ### headings, bullet and numbered lists,
+**bold**) in the brand book's styles. A cover and a contents page with real
+page numbers come first, and the PDF has a bookmark per post.
+
+The build streams, so memory stays flat however many posts there are:
+
+    - posts are read from the JSON one at a time (iter_posts), never the
+      whole file
+    - a post's content is turned into flowables as the layout reaches it
+      (post_flowables is a generator feeding a StreamingStory)
+    - each chapter is laid out as its own document and written to disk as
+      soon as it is finished, numbered from the page the previous chapter
+      ended on, so no more than one chapter is in ReportLab at a time
+
+The finished chapters are then concatenated by pdf_stream.StreamingPdfWriter,
+which copies each chapter's compressed objects to the output and lets go of
+them before reading the next. Page numbers are stamped by the
+brand books' NumberedCanvas ("Page N", counting from the first chapter).
+
+    python create_blog_ebook.py
+    python create_blog_ebook.py build/blog.pdf     # somewhere else
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from functools import partial
+from xml.sax.saxutils import escape
+
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+
+import asset_manifest
+import brand_canvas
+from asset_manifest import asset_path
+from brand_assets import SharedImage, VectorImage
+from brand_styles import BROWN, GOLD, CREAM, CHARCOAL, WHITE, HEADLINE_FONT, paragraph_style
+from create_final_corrected_brandbook import h1_style, h2_style, h3_style, body_style, bullet_style
+from pdf_stream import StreamingPdfWriter
+
+BLOG_FILE = os.path.join(asset_manifest.PUBLIC_DIR, 'blog-posts.json')
+PDF_FILE = "Dependable_Home_Improvement_Blog_eBook.pdf"
+WEBSITE = "https://prodependable.com"
+
+PAGE_WIDTH, PAGE_HEIGHT = letter
+EBOOK_MARGIN = 0.9 * inch
+DOC_OPTIONS = dict(
+    pagesize=letter,
+    rightMargin=EBOOK_MARGIN,
+    leftMargin=EBOOK_MARGIN,
+    topMargin=EBOOK_MARGIN,
+    bottomMargin=EBOOK_MARGIN
+)
+IMAGE_BOX = (PAGE_WIDTH - 2 * EBOOK_MARGIN, 3.2 * inch)
+# Screen-quality photos keep the download small
+IMAGE_DPI = 150
+
+cover_title = paragraph_style('EbookCoverTitle', fontSize=40, textColor=WHITE, alignment=TA_CENTER,
+                              fontName=HEADLINE_FONT, leading=48)
+cover_subtitle = paragraph_style('EbookCoverSubtitle', fontSize=18, textColor=GOLD, alignment=TA_CENTER,
+                                 fontName='Helvetica-Bold', leading=24)
+cover_note = paragraph_style('EbookCoverNote', fontSize=11, textColor=CHARCOAL, alignment=TA_CENTER,
+                             fontName='Helvetica', leading=15)
+byline_style = paragraph_style('EbookByline', fontSize=10, textColor=GOLD, fontName='Helvetica-Bold',
+                               spaceAfter=16, leading=13)
+toc_entry = paragraph_style('EbookTocEntry', fontSize=11, textColor=CHARCOAL, fontName='Helvetica', leading=14)
+toc_category = paragraph_style('EbookTocCategory', fontSize=9, textColor=GOLD, fontName='Helvetica-Bold', leading=12)
+toc_page = paragraph_style('EbookTocPage', parent=toc_entry, alignment=2)
+numbered_style = paragraph_style('EbookNumbered', parent=bullet_style, bulletIndent=6)
+# Headings never end a page
+heading2_style = paragraph_style('EbookH2', parent=h2_style, keepWithNext=1)
+heading3_style = paragraph_style('EbookH3', parent=h3_style, keepWithNext=1)
+
+_POSTS_KEY = re.compile(r'"posts"\s*:\s*\[')
+_NUMBERED = re.compile(r'(\d+)\.\s+(.*)')
+_BOLD = re.compile(r'\*\*(.+?)\*\*')
+
+
+class EbookCanvas(brand_canvas.NumberedCanvas):
+    """NumberedCanvas for one chapter, numbering from the book page it starts on"""
+
+    footer_format = "Page {page}"
+    skip_cover = False
+
+    def __init__(self, *args, first_page=1, **kwargs):
+        brand_canvas.NumberedCanvas.__init__(self, *args, **kwargs)
+        self.first_page = first_page
+
+    def draw_page_number(self, page_num, page_count, page_width):
+        brand_canvas.NumberedCanvas.draw_page_number(self, self.first_page + page_num - 1, page_count, page_width)
+
+
+class StreamingStory(list):
+    """Story list that pulls flowables from an iterator as the layout consumes them
+
+    doc.build() only ever looks a few flowables ahead (keepWithNext runs),
+    so no more than `lookahead` of them exist before they are laid out.
+    """
+
+    lookahead = 16
+
+    def __init__(self, flowables):
+        list.__init__(self)
+        self._source = iter(flowables)
+
+    def _fill(self, count):
+        while self._source is not None and list.__len__(self) < count:
+            flowable = next(self._source, None)
+            if flowable is None:
+                self._source = None
+            else:
+                self.append(flowable)
+
+    def __len__(self):
+        self._fill(self.lookahead)
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill(index + 1 if isinstance(index, int) and index >= 0 else self.lookahead)
+        return list.__getitem__(self, index)
+
+
+def iter_posts(path=BLOG_FILE, chunk_size=1 << 16):
+    """Yield the posts of blog-posts.json one at a time, reading the file in chunks"""
+    decoder = json.JSONDecoder()
+    with open(path, encoding='utf-8') as f:
+        buffer, pos = '', None
+        while pos is None:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            buffer += chunk
+            match = _POSTS_KEY.search(buffer)
+            if match:
+                buffer, pos = buffer[match.end():], 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if buffer[pos:pos + 1] == ']':
+                return
+            try:
+                post, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            yield post
+            buffer, pos = buffer[end:], 0
+
+
+def inline_markup(text):
+    """Markdown inline text as Paragraph markup"""
+    return _BOLD.sub(r'<b>\1</b>', escape(text))
+
+
+def post_flowables(post):
+    """Generate a post's flowables, one markdown block at a time"""
+    image = post.get('image')
+    if image:
+        path = os.path.join(asset_manifest.PUBLIC_DIR, *image.lstrip('/').split('/'))
+        if os.path.exists(path):
+            photo = SharedImage(path, *IMAGE_BOX, kind='bound', dpi=IMAGE_DPI)
+            photo.hAlign = 'CENTER'
+            yield photo
+            yield Spacer(1, 0.2 * inch)
+        else:
+            print(f"⚠ {image} is not in client/public; chapter has no image")
+    yield Paragraph(escape(post['title']), h1_style)
+    details = [post.get('category'), post.get('author'), post.get('date'), post.get('readTime')]
+    yield Paragraph(' &middot; '.join(escape(d) for d in details if d), byline_style)
+
+    lines = []
+    for line in post.get('content', '').splitlines() + ['']:
+        line = line.strip()
+        block = None
+        if line.startswith('### '):
+            block = Paragraph(inline_markup(line[4:]), heading3_style)
+        elif line.startswith('## '):
+            block = Paragraph(inline_markup(line[3:]), heading2_style)
+        elif line.startswith('- '):
+            block = Paragraph(inline_markup(line[2:]), bullet_style, bulletText='•')
+        elif _NUMBERED.match(line):
+            number, text = _NUMBERED.match(line).groups()
+            block = Paragraph(inline_markup(text), numbered_style, bulletText=f"{number}.")
+        elif line:
+            lines.append(line)
+            continue
+        if lines:
+            yield Paragraph(inline_markup(' '.join(lines)), body_style)
+            lines = []
+        if block is not None:
+            yield block
+
+    yield Spacer(1, 0.2 * inch)
+    yield Paragraph(f"Read online at {WEBSITE}/blog/{escape(post['slug'])}", byline_style)
+
+
+def render_chapter(post, path, first_page):
+    """Lay out one post into its own PDF; returns its page count"""
+    doc = SimpleDocTemplate(path, **DOC_OPTIONS)
+    doc.build(StreamingStory(post_flowables(post)), canvasmaker=partial(EbookCanvas, first_page=first_page))
+    return doc.page
+
+
+def front_matter(contents):
+    """Cover and contents page for [(title, category, page)]"""
+    story = [Spacer(1, 1.2 * inch)]
+    title = Table([[VectorImage(asset_path('dependable_logo'), width=1.8 * inch)],
+                   [Paragraph("The Dependable Home<br/>Improvement Guide", cover_title)]],
+                  colWidths=[PAGE_WIDTH - 2 * EBOOK_MARGIN])
+    title.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), BROWN),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('TOPPADDING', (0, 0), (-1, -1), 18),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 18),
+    ]))
+    story.append(title)
+    story.append(Spacer(1, 0.4 * inch))
+    story.append(Paragraph("Articles from the Dependable Home Improvement blog", cover_subtitle))
+    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(f"{len(contents)} articles on maintenance, renovation and home value in Bergen County, "
+                           f"New Jersey.<br/>{WEBSITE.split('//')[1]}", cover_note))
+    story.append(PageBreak())
+
+    story.append(Paragraph("Contents", h1_style))
+    rows = [[[Paragraph(escape(title), toc_entry), Paragraph(escape(category or ''), toc_category)],
+             Paragraph(str(page), toc_page)] for title, category, page in contents]
+    table = Table(rows, colWidths=[PAGE_WIDTH - 2 * EBOOK_MARGIN - 0.8 * inch, 0.8 * inch], repeatRows=0)
+    table.setStyle(TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LINEBELOW', (0, 0), (-1, -1), 0.5, CREAM),
+        ('TOPPADDING', (0, 0), (-1, -1), 5),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+    ]))
+    story.append(table)
+    return story
+
+
+def build(pdf_file=PDF_FILE, posts=None):
+    """Write the e-book; posts defaults to streaming them from blog-posts.json"""
+    started = time.perf_counter()
+    contents, chapters = [], []
+    with tempfile.TemporaryDirectory(prefix='ebook-') as work_dir:
+        next_page = 1
+        for number, post in enumerate(iter_posts() if posts is None else posts, 1):
+            path = os.path.join(work_dir, f"chapter-{number:05d}.pdf")
+            pages = render_chapter(post, path, next_page)
+            contents.append((post['title'], post.get('category'), next_page))
+            chapters.append(path)
+            next_page += pages
+
+        front = os.path.join(work_dir, "front.pdf")
+        SimpleDocTemplate(front, **DOC_OPTIONS).build(
+            front_matter(contents), canvasmaker=brand_canvas.ImageDedupCanvas)
+
+        tmp = f"{pdf_file}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            writer = StreamingPdfWriter(f)
+            writer.append(front)
+            front_pages = writer.page_count
+            for path, (title, _, _) in zip(chapters, contents):
+                writer.append(path, outline=title)
+                os.remove(path)
+            writer.close(info={'/Title': "The Dependable Home Improvement Guide", '/Producer': "ReportLab PDF Library"})
+        os.replace(tmp, pdf_file)
+
+    print(f"✓ Blog e-book created successfully: {pdf_file}")
+    print(f"✓ {len(contents)} posts, {front_pages + next_page - 1} pages in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    build(*sys.argv[1:2])
@@ -3,8 +3,9 @@
 Generate professional landscape PDF brand book for Dependable Home Improvement
 """
 
-from weasyprint import HTML, CSS
-from pathlib import Path
+import sys
+
+import html_render
 
 # HTML template with professional styling in landscape
 html_content = """
@@ -1294,18 +1295,20 @@ html_content = """
 </html>
 """
 
-# Write HTML to file
-with open('brand_book_temp.html', 'w', encoding='utf-8') as f:
-    f.write(html_content)
+PDF_FILE = 'Dependable_Home_Improvement_Brand_Book.pdf'
+PAGE_CSS = '@page { size: 11in 8.5in landscape; margin: 0; }'
+
+
+def build(pdf_file=PDF_FILE, review_dir=None):
+    """Lay the book out once; review_dir also gets page previews and a text dump"""
+    # Generate PDF
+    print("Generating landscape PDF brand book with expanded typography...")
+    document = html_render.write_pdf(html_content, pdf_file, page_css=PAGE_CSS, review_dir=review_dir)
 
-# Generate PDF
-print("Generating landscape PDF brand book with expanded typography...")
-HTML('brand_book_temp.html').write_pdf(
-    'Dependable_Home_Improvement_Brand_Book.pdf',
-    stylesheets=[CSS(string='@page { size: 11in 8.5in landscape; margin: 0; }')]
-)
+    print(f"Brand book PDF created successfully! ({len(document.pages)} pages)")
+    if review_dir:
+        print(f"Review previews and page text written to {review_dir}")
 
-print("Brand book PDF created successfully!")
 
-# Clean up temp file
-Path('brand_book_temp.html').unlink()
+if __name__ == "__main__":
+    build(review_dir='build/review' if '--review' in sys.argv[1:] else None)
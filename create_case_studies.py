@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Create a PDF for every case study in client/public/case-studies.json, plus a combined portfolio
+
+Each study gets its own document under build/case-studies/<slug>.pdf: the
+project facts, the before and after photos, the challenge, the solution,
+the results and the client's testimonial. The combined portfolio is a cover
+and contents page followed by every study, with a bookmark per study.
+
+Photos are LazyImage flowables, so building the story reads nothing: a
+photo's header is read when it is laid out and its rendition is fetched
+from the shared image cache when it is drawn. Each study is its own
+document, and the portfolio is put together from the finished study PDFs
+by pdf_stream.StreamingPdfWriter, so however many studies there are, only
+one study's photos are in memory at a time.
+
+    python create_case_studies.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from xml.sax.saxutils import escape
+
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import landscape, letter
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+
+import asset_manifest
+import brand_canvas
+from asset_manifest import asset_path
+from brand_assets import LazyImage, VectorImage
+from brand_styles import BROWN, GOLD, CREAM, CHARCOAL, WHITE, HEADLINE_FONT, MARGIN, paragraph_style
+from create_final_corrected_brandbook import h1_style, h2_style, body_style, bullet_style, box_style
+from pdf_stream import StreamingPdfWriter
+
+CASE_STUDIES_FILE = os.path.join(asset_manifest.PUBLIC_DIR, 'case-studies.json')
+OUTPUT_DIR = os.path.join(asset_manifest.ROOT, 'build', 'case-studies')
+PDF_FILE = "Dependable_Home_Improvement_Case_Studies.pdf"
+
+PAGE_WIDTH, PAGE_HEIGHT = landscape(letter)
+DOC_OPTIONS = dict(
+    pagesize=landscape(letter),
+    rightMargin=MARGIN,
+    leftMargin=MARGIN,
+    topMargin=MARGIN,
+    bottomMargin=MARGIN
+)
+PHOTO_BOX = (4.5 * inch, 3.0 * inch)
+# Screen-quality photos keep the studies small enough to email
+PHOTO_DPI = 150
+
+cover_title = paragraph_style('StudyCoverTitle', fontSize=44, textColor=WHITE, alignment=TA_CENTER,
+                              fontName=HEADLINE_FONT, leading=54)
+cover_subtitle = paragraph_style('StudyCoverSubtitle', fontSize=22, textColor=GOLD, alignment=TA_CENTER,
+                                 fontName='Helvetica-Bold', leading=28)
+category_style = paragraph_style('StudyCategory', fontSize=12, textColor=GOLD, fontName='Helvetica-Bold',
+                                 spaceAfter=4, leading=15)
+fact_label = paragraph_style('StudyFactLabel', fontSize=9, textColor=GOLD, fontName='Helvetica-Bold',
+                             alignment=TA_CENTER, leading=11)
+fact_value = paragraph_style('StudyFactValue', fontSize=12, textColor=BROWN, fontName='Helvetica-Bold',
+                             alignment=TA_CENTER, leading=15)
+label_style = paragraph_style('StudyLabel', fontSize=10, textColor=CHARCOAL, fontName='Helvetica-Bold',
+                              alignment=TA_CENTER, leading=12)
+missing_style = paragraph_style('StudyMissing', fontSize=10, textColor=CHARCOAL, fontName='Helvetica-Oblique',
+                                alignment=TA_CENTER, leading=12)
+contents_style = paragraph_style('StudyContents', fontSize=11, textColor=CHARCOAL, fontName='Helvetica', leading=14)
+
+
+class StudyCanvas(brand_canvas.NumberedCanvas):
+    """NumberedCanvas whose footer names the case study"""
+
+    footer_format = "{title}  ·  Page {page} of {total}"
+    skip_cover = False
+
+    def __init__(self, *args, title='', **kwargs):
+        brand_canvas.NumberedCanvas.__init__(self, *args, **kwargs)
+        self.title = title
+
+    def footer_fields(self):
+        return {'title': self.title}
+
+
+def load_studies(path=CASE_STUDIES_FILE):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def public_path(url):
+    return os.path.join(asset_manifest.PUBLIC_DIR, *url.lstrip('/').split('/'))
+
+
+def photo(url):
+    """LazyImage for a site image URL, or a note if the file is missing"""
+    path = public_path(url) if url else None
+    if path and os.path.exists(path):
+        return LazyImage(path, *PHOTO_BOX, kind='bound', dpi=PHOTO_DPI)
+    print(f"⚠ {url} is not in client/public; shown as missing")
+    return Paragraph("Photo not available", missing_style)
+
+
+def facts_table(study):
+    facts = [("LOCATION", study.get('location')), ("DURATION", study.get('duration')),
+             ("BUDGET", study.get('budget')), ("YEAR", study.get('year'))]
+    facts = [(label, value) for label, value in facts if value]
+    table = Table([[Paragraph(label, fact_label) for label, _ in facts],
+                   [Paragraph(escape(str(value)), fact_value) for _, value in facts]],
+                  colWidths=[(PAGE_WIDTH - 2 * MARGIN) / len(facts)] * len(facts))
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), CREAM),
+        ('BOX', (0, 0), (-1, -1), 1, GOLD),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ]))
+    return table
+
+
+def photos_table(images):
+    table = Table([
+        [photo(images.get('before')), photo(images.get('after'))],
+        [Paragraph("BEFORE", label_style), Paragraph("AFTER", label_style)],
+    ], colWidths=[PHOTO_BOX[0] + 0.2 * inch] * 2, rowHeights=[PHOTO_BOX[1] + 0.2 * inch, None])
+    table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+        ('BACKGROUND', (0, 1), (-1, 1), CREAM),
+        ('BOX', (0, 0), (-1, -1), 1, GOLD),
+        ('LINEAFTER', (0, 0), (0, -1), 1, GOLD),
+    ]))
+    return table
+
+
+def study_story(study):
+    story = [
+        Paragraph(escape(study.get('category', 'Case Study')).upper(), category_style),
+        Paragraph(escape(study['title']), h1_style),
+        facts_table(study),
+        Spacer(1, 0.2 * inch),
+    ]
+    images = study.get('images') or {}
+    if images:
+        story.append(photos_table(images))
+    story.append(Paragraph("The Challenge", h2_style))
+    story.append(Paragraph(escape(study.get('challenge', '')), body_style))
+    story.append(Paragraph("Our Solution", h2_style))
+    story.append(Paragraph(escape(study.get('solution', '')), body_style))
+    if study.get('results'):
+        story.append(Paragraph("Results", h2_style))
+        story.extend(Paragraph(f"• {escape(result)}", bullet_style) for result in study['results'])
+    testimonial = study.get('testimonial')
+    if testimonial:
+        # ZapfDingbats 'H' is a solid star
+        stars = 'H' * int(testimonial.get('rating') or 0)
+        story.append(Spacer(1, 0.1 * inch))
+        story.append(Paragraph(
+            f"<i>“{escape(testimonial['text'])}”</i><br/><br/>"
+            f"<b>{escape(testimonial.get('author', ''))}</b>"
+            f"  <font name='ZapfDingbats' color='#B8860B'>{stars}</font>", box_style))
+    return story
+
+
+def render_study(study, pdf_file):
+    """Lay out one case study on its own; returns its page count"""
+    doc = SimpleDocTemplate(pdf_file, title=study['title'], **DOC_OPTIONS)
+    doc.build(study_story(study),
+              canvasmaker=lambda *args, **kwargs: StudyCanvas(*args, title=study['title'], **kwargs))
+    return doc.page
+
+
+def front_matter(studies):
+    story = [Spacer(1, 0.9 * inch)]
+    title = Table([[VectorImage(asset_path('dependable_logo'), width=1.8 * inch)],
+                   [Paragraph("Case Studies", cover_title)]], colWidths=[PAGE_WIDTH - 2 * MARGIN])
+    title.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), BROWN),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('TOPPADDING', (0, 0), (-1, -1), 18),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 18),
+    ]))
+    story.append(title)
+    story.append(Spacer(1, 0.4 * inch))
+    story.append(Paragraph("Dependable Home Improvement", cover_subtitle))
+    story.append(PageBreak())
+
+    story.append(Paragraph("Projects in This Portfolio", h1_style))
+    rows = [["Project", "Category", "Location", "Year"]]
+    rows += [[Paragraph(escape(study['title']), contents_style), study.get('category', ''),
+              study.get('location', ''), study.get('year', '')] for study in studies]
+    table = Table(rows, colWidths=[4.5 * inch, 2.0 * inch, 1.6 * inch, 0.9 * inch], repeatRows=1)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), BROWN),
+        ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('TEXTCOLOR', (1, 1), (-1, -1), CHARCOAL),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 1, GOLD),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [WHITE, CREAM]),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ]))
+    story.append(table)
+    return story
+
+
+def build(pdf_file=PDF_FILE, output_dir=OUTPUT_DIR, studies=None):
+    """Write one PDF per case study into output_dir and the combined portfolio to pdf_file"""
+    started = time.perf_counter()
+    studies = load_studies() if studies is None else studies
+    os.makedirs(output_dir, exist_ok=True)
+
+    study_files = []
+    for study in studies:
+        path = os.path.join(output_dir, f"{study['slug']}.pdf")
+        pages = render_study(study, path)
+        study_files.append(path)
+        print(f"  {study['slug']:<40} {pages} page{'s' if pages > 1 else ''}")
+
+    with tempfile.TemporaryDirectory(prefix='case-studies-') as work_dir:
+        front = os.path.join(work_dir, "front.pdf")
+        SimpleDocTemplate(front, **DOC_OPTIONS).build(front_matter(studies), canvasmaker=brand_canvas.ImageDedupCanvas)
+        tmp = f"{pdf_file}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            writer = StreamingPdfWriter(f)
+            writer.append(front)
+            for study, path in zip(studies, study_files):
+                writer.append(path, outline=study['title'])
+            writer.close(info={'/Title': "Dependable Home Improvement Case Studies",
+                               '/Producer': "ReportLab PDF Library"})
+        os.replace(tmp, pdf_file)
+
+    print(f"✓ {len(studies)} case studies written to {output_dir}")
+    print(f"✓ Combined portfolio created successfully: {pdf_file} "
+          f"({writer.page_count} pages in {time.perf_counter() - started:.2f}s)")
+
+
+if __name__ == "__main__":
+    build(*sys.argv[1:2])
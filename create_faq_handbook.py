@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Create the FAQ handbook from client/public/faq-data.json
+
+A cover, a contents page and one section per FAQ category, every question
+with its answer. The contents page carries real page numbers and links, and
+each category and question has a PDF bookmark.
+
+ReportLab's multiBuild() gets page numbers into a table of contents by
+laying the whole document out again until they stop changing, which is at
+least two passes every time. This build starts from the page map of the
+previous build instead (.cache/faq-page-map.json): the contents page is
+set with those numbers, FaqDocTemplate records where every category and
+question actually lands, and only if that differs is the layout run again
+with the new map. An unchanged or lightly edited FAQ builds in one pass;
+the build reports how many it took.
+
+    python create_faq_handbook.py
+    python create_faq_handbook.py --clear     # forget the cached page map
+"""
+
+import json
+import os
+import sys
+from xml.sax.saxutils import escape
+
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+
+import asset_manifest
+import brand_canvas
+from asset_manifest import asset_path
+from brand_assets import VectorImage
+from brand_styles import BROWN, GOLD, CHARCOAL, WHITE, HEADLINE_FONT, MARGIN, paragraph_style
+from create_final_corrected_brandbook import h1_style, h2_style, body_style
+
+FAQ_FILE = os.path.join(asset_manifest.PUBLIC_DIR, 'faq-data.json')
+PAGE_MAP_FILE = os.path.join(asset_manifest.ROOT, '.cache', 'faq-page-map.json')
+PDF_FILE = "Dependable_Home_Improvement_FAQ_Handbook.pdf"
+
+PAGE_WIDTH, PAGE_HEIGHT = letter
+DOC_OPTIONS = dict(
+    pagesize=letter,
+    rightMargin=MARGIN,
+    leftMargin=MARGIN,
+    topMargin=MARGIN,
+    bottomMargin=MARGIN
+)
+# Layout passes allowed before giving up on the page numbers settling
+MAX_PASSES = 4
+
+NumberedCanvas = brand_canvas.NumberedCanvas
+
+cover_title = paragraph_style('FaqCoverTitle', fontSize=40, textColor=WHITE, alignment=TA_CENTER,
+                              fontName=HEADLINE_FONT, leading=48)
+cover_subtitle = paragraph_style('FaqCoverSubtitle', fontSize=18, textColor=GOLD, alignment=TA_CENTER,
+                                 fontName='Helvetica-Bold', leading=24)
+cover_note = paragraph_style('FaqCoverNote', fontSize=11, textColor=CHARCOAL, alignment=TA_CENTER,
+                             fontName='Helvetica', leading=15)
+category_style = paragraph_style('FaqCategory', parent=h2_style, keepWithNext=1)
+question_style = paragraph_style('FaqQuestion', fontSize=12, textColor=BROWN, fontName='Helvetica-Bold',
+                                 spaceBefore=10, spaceAfter=4, leading=15, keepWithNext=1)
+toc_category = paragraph_style('FaqTocCategory', fontSize=12, textColor=BROWN, fontName='Helvetica-Bold', leading=15)
+toc_question = paragraph_style('FaqTocQuestion', fontSize=10, textColor=CHARCOAL, fontName='Helvetica',
+                               leftIndent=14, leading=13)
+toc_page = paragraph_style('FaqTocPage', fontSize=10, textColor=CHARCOAL, fontName='Helvetica', alignment=TA_RIGHT,
+                           leading=13)
+
+
+class FaqDocTemplate(SimpleDocTemplate):
+    """Records the page each marked flowable lands on, and bookmarks it
+
+    A flowable is marked by giving it a faq_key and an outline (title,
+    level); page_map is {faq_key: page} once the build has finished.
+    """
+
+    def __init__(self, *args, **kwargs):
+        SimpleDocTemplate.__init__(self, *args, **kwargs)
+        self.page_map = {}
+
+    def afterFlowable(self, flowable):
+        key = getattr(flowable, 'faq_key', None)
+        if key is None:
+            return
+        self.page_map[key] = self.page
+        title, level = flowable.outline
+        self.canv.bookmarkPage(key)
+        self.canv.addOutlineEntry(title, key, level)
+
+
+def marked(flowable, key, title, level):
+    flowable.faq_key = key
+    flowable.outline = (title, level)
+    return flowable
+
+
+def question_key(question):
+    return f"q{question['id']}"
+
+
+def load_faq(path=FAQ_FILE):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['categories']
+
+
+def contents_table(categories, page_map):
+    """Contents rows linked to their destinations, numbered from page_map
+
+    Numbers the map does not have yet are left blank; they occupy a fixed
+    column, so filling them in does not move anything.
+    """
+    def row(key, text, style):
+        link = f'<a href="#{key}">{escape(text)}</a>'
+        return [Paragraph(link, style), Paragraph(f'<a href="#{key}">{page_map.get(key, "")}</a>', toc_page)]
+
+    rows, styles = [], []
+    for category in categories:
+        styles.append(('TOPPADDING', (0, len(rows)), (-1, len(rows)), 10))
+        styles.append(('LINEBELOW', (0, len(rows)), (-1, len(rows)), 1, GOLD))
+        rows.append(row(category['id'], category['name'], toc_category))
+        rows.extend(row(question_key(q), q['question'], toc_question) for q in category['questions'])
+    table = Table(rows, colWidths=[PAGE_WIDTH - 2 * MARGIN - 0.6 * inch, 0.6 * inch])
+    table.setStyle(TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('TOPPADDING', (0, 0), (-1, -1), 2),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ] + styles))
+    return table
+
+
+def build_story(categories, page_map):
+    story = [Spacer(1, 1.4 * inch)]
+    title = Table([[VectorImage(asset_path('dependable_logo'), width=1.8 * inch)],
+                   [Paragraph("Frequently Asked<br/>Questions", cover_title)]],
+                  colWidths=[PAGE_WIDTH - 2 * MARGIN])
+    title.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), BROWN),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('TOPPADDING', (0, 0), (-1, -1), 18),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 18),
+    ]))
+    story.append(title)
+    story.append(Spacer(1, 0.4 * inch))
+    story.append(Paragraph("Dependable Home Improvement", cover_subtitle))
+    story.append(Spacer(1, 0.3 * inch))
+    questions = sum(len(category['questions']) for category in categories)
+    story.append(Paragraph(f"{questions} answers about working with us, in {len(categories)} topics", cover_note))
+    story.append(PageBreak())
+
+    story.append(Paragraph("Contents", h1_style))
+    story.append(contents_table(categories, page_map))
+    story.append(PageBreak())
+
+    for category in categories:
+        story.append(marked(Paragraph(escape(category['name']), category_style),
+                            category['id'], category['name'], 0))
+        for question in category['questions']:
+            story.append(marked(Paragraph(escape(question['question']), question_style),
+                                question_key(question), question['question'], 1))
+            story.append(Paragraph(escape(question['answer']), body_style))
+        story.append(Spacer(1, 0.2 * inch))
+    return story
+
+
+def load_page_map():
+    try:
+        with open(PAGE_MAP_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_page_map(page_map):
+    os.makedirs(os.path.dirname(PAGE_MAP_FILE), exist_ok=True)
+    tmp = f"{PAGE_MAP_FILE}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(page_map, f, indent=1, sort_keys=True)
+    os.replace(tmp, PAGE_MAP_FILE)
+
+
+def build(pdf_file=PDF_FILE):
+    """Write the handbook; returns the number of layout passes it took"""
+    categories = load_faq()
+    cached = page_map = load_page_map()
+    tmp = f"{pdf_file}.{os.getpid()}.tmp"
+    for passes in range(1, MAX_PASSES + 1):
+        doc = FaqDocTemplate(tmp, title="Dependable Home Improvement FAQ", **DOC_OPTIONS)
+        doc.build(build_story(categories, page_map), canvasmaker=NumberedCanvas)
+        if doc.page_map == page_map:
+            break
+        page_map = doc.page_map
+    else:
+        os.remove(tmp)
+        raise RuntimeError(f"contents page numbers still changing after {MAX_PASSES} layout passes")
+    os.replace(tmp, pdf_file)
+    if page_map != cached:
+        save_page_map(page_map)
+
+    print(f"✓ FAQ handbook created successfully: {pdf_file}")
+    print(f"✓ {len(page_map)} entries, {doc.page} pages, {passes} layout pass{'es' if passes > 1 else ''} "
+          f"({'cached page map reused' if passes == 1 else 'page map updated'})")
+    return passes
+
+
+def clear():
+    if os.path.exists(PAGE_MAP_FILE):
+        os.remove(PAGE_MAP_FILE)
+
+
+if __name__ == "__main__":
+    if '--clear' in sys.argv[1:]:
+        clear()
+        print(f"✓ Cleared {PAGE_MAP_FILE}")
+    else:
+        build()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Create the project portfolio from the website gallery (client/public/gallery)
+
+Before/after shots are paired by file name (basement-before.jpg with
+basement-after.jpg, cellar-door-before.jpg with cellar-door-after.png, ...)
+and laid out side by side, one project per row; every other photo goes into
+a captioned contact-sheet grid. When a file exists in several formats
+(deck-restoration-1.png and .webp) the manifest's preferred one is used.
+
+Decoding and resampling the photos is the slow part, so thumbnails are made
+in a process pool before layout, one task per image, largest file first: the
+build waits about as long as the slowest image rather than the sum of all of
+them. Thumbnails go through the content-addressed image cache, so a rebuild
+only resamples photos that changed.
+
+    python create_gallery_portfolio.py
+    python create_gallery_portfolio.py --workers 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from reportlab.lib.pagesizes import landscape, letter
+from reportlab.lib.units import inch
+from reportlab.lib.enums import TA_CENTER
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, KeepTogether
+
+import brand_canvas
+import image_cache
+from asset_manifest import asset_path
+from brand_assets import SharedImage, fitted_size
+from brand_styles import BROWN, GOLD, CREAM, CHARCOAL, WHITE, HEADLINE_FONT, MARGIN, paragraph_style
+from gallery import gallery_assets, pair_photos
+
+
+class NumberedCanvas(brand_canvas.NumberedCanvas):
+    footer_format = "Page {page}"
+
+
+PDF_FILE = "Dependable_Home_Improvement_Portfolio.pdf"
+DOC_OPTIONS = dict(
+    pagesize=landscape(letter),
+    rightMargin=MARGIN,
+    leftMargin=MARGIN,
+    topMargin=MARGIN,
+    bottomMargin=MARGIN
+)
+
+# Screen-quality thumbnails keep the portfolio small enough to email
+THUMBNAIL_DPI = 150
+
+# Placement boxes; photos are fitted inside them without distortion
+PAIR_BOX = (4.5*inch, 2.45*inch)
+GRID_COLUMNS = 3
+GRID_BOX = (2.95*inch, 2.1*inch)
+
+title_style = paragraph_style(
+    'PortfolioTitle',
+    fontSize=44,
+    textColor=WHITE,
+    alignment=TA_CENTER,
+    fontName=HEADLINE_FONT,
+    leading=54,
+    backColor=BROWN,
+    borderPadding=30
+)
+
+subtitle_style = paragraph_style(
+    'PortfolioSubtitle',
+    fontSize=22,
+    textColor=GOLD,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold',
+    leading=28
+)
+
+h1_style = paragraph_style(
+    'PortfolioH1',
+    fontSize=28,
+    textColor=BROWN,
+    fontName=HEADLINE_FONT,
+    spaceAfter=14,
+    leading=34
+)
+
+project_style = paragraph_style(
+    'PortfolioProject',
+    fontSize=14,
+    textColor=BROWN,
+    fontName='Helvetica-Bold',
+    spaceBefore=6,
+    spaceAfter=4,
+    leading=17
+)
+
+label_style = paragraph_style(
+    'PortfolioLabel',
+    fontSize=10,
+    textColor=CHARCOAL,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold',
+    leading=12
+)
+
+caption_style = paragraph_style(
+    'PortfolioCaption',
+    fontSize=9,
+    textColor=CHARCOAL,
+    alignment=TA_CENTER,
+    fontName='Helvetica',
+    leading=11
+)
+
+
+def _thumbnail(path, width, height):
+    """Worker body: resample one photo into the image cache"""
+    started = time.perf_counter()
+    image_cache.downsampled_path(path, width, height, THUMBNAIL_DPI)
+    return path, time.perf_counter() - started
+
+
+def make_thumbnails(placements, workers=None):
+    """Resample every (path, width, height) placement in a process pool
+
+    Returns {path: seconds spent in the worker}. Each image is its own task
+    and the largest files are submitted first, so the pool is not left
+    waiting on one big photo queued behind many small ones.
+    """
+    placements = sorted(placements, key=lambda placement: -os.path.getsize(placement[0]))
+    timings = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_thumbnail, *placement) for placement in placements]
+        for future in as_completed(futures):
+            path, seconds = future.result()
+            timings[path] = seconds
+    return timings
+
+
+def fitted(path, box):
+    width, height = fitted_size(path, *box, kind='bound')
+    return path, width, height
+
+
+def photo(path, box):
+    return SharedImage(path, *box, kind='bound', dpi=THUMBNAIL_DPI)
+
+
+def pair_row(pair):
+    """One project: its name over the before and after photos side by side"""
+    table = Table([
+        [photo(pair.before, PAIR_BOX), photo(pair.after, PAIR_BOX)],
+        [Paragraph("BEFORE", label_style), Paragraph("AFTER", label_style)],
+    ], colWidths=[PAIR_BOX[0] + 0.2*inch] * 2)
+    table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+        ('BACKGROUND', (0, 1), (-1, 1), CREAM),
+        ('BOX', (0, 0), (-1, -1), 1, GOLD),
+        ('LINEAFTER', (0, 0), (0, -1), 1, GOLD),
+    ]))
+    return KeepTogether([Paragraph(pair.title, project_style), table, Spacer(1, 0.15*inch)])
+
+
+def photo_grid(photos):
+    """Contact-sheet table, GRID_COLUMNS captioned photos per row"""
+    cells = [[photo(item.path, GRID_BOX), Paragraph(item.title, caption_style)] for item in photos]
+    cells += [''] * (-len(cells) % GRID_COLUMNS)
+    rows = [cells[i:i + GRID_COLUMNS] for i in range(0, len(cells), GRID_COLUMNS)]
+    table = Table(rows, colWidths=[GRID_BOX[0] + 0.2*inch] * GRID_COLUMNS)
+    table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ]))
+    return table
+
+
+def build_story(pairs, singles):
+    story = []
+
+    # ============= COVER PAGE =============
+    story.append(Spacer(1, 1.0*inch))
+    logo = SharedImage(asset_path('cascadia_logo'), width=3.5*inch, height=1.2*inch, kind='bound')
+    logo.hAlign = 'CENTER'
+    story.append(logo)
+    story.append(Spacer(1, 0.6*inch))
+    story.append(Paragraph("DEPENDABLE HOME<br/>IMPROVEMENT", title_style))
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph("Project Portfolio", subtitle_style))
+    story.append(Spacer(1, 0.2*inch))
+    story.append(Paragraph(f"{len(pairs)} before &amp; after projects &middot; {len(singles)} finished-work photos",
+                           caption_style))
+    story.append(PageBreak())
+
+    # ============= BEFORE & AFTER =============
+    if pairs:
+        story.append(Paragraph("Before &amp; After", h1_style))
+        story.extend(pair_row(pair) for pair in pairs)
+        story.append(PageBreak())
+
+    # ============= PROJECT GALLERY =============
+    if singles:
+        story.append(Paragraph("Project Gallery", h1_style))
+        story.append(photo_grid(singles))
+
+    return story
+
+
+def build(pdf_file=PDF_FILE, workers=None):
+    pairs, singles = pair_photos(gallery_assets())
+    placements = [fitted(path, PAIR_BOX) for pair in pairs for path in (pair.before, pair.after)]
+    placements += [fitted(item.path, GRID_BOX) for item in singles]
+
+    print(f"Making {len(placements)} gallery thumbnails...")
+    started = time.perf_counter()
+    timings = make_thumbnails(placements, workers)
+    wall = time.perf_counter() - started
+    if timings:
+        slowest = max(timings, key=timings.get)
+        print(f"✓ Thumbnails ready in {wall:.2f}s (slowest image {timings[slowest]:.2f}s: "
+              f"{os.path.basename(slowest)}; {sum(timings.values()):.2f}s of work in total)")
+
+    doc = SimpleDocTemplate(pdf_file, **DOC_OPTIONS)
+    doc.build(build_story(pairs, singles), canvasmaker=NumberedCanvas)
+    print(f"✓ Portfolio created successfully: {pdf_file}")
+    print(f"✓ {len(pairs)} before/after pairs, {len(singles)} gallery photos")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the project portfolio from the website gallery")
+    parser.add_argument('--workers', type=int, default=None, help="thumbnail processes (default: one per core)")
+    args = parser.parse_args(argv)
+    build(workers=args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
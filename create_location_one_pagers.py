@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Printable one-pager for every town in client/public/locations.json
+
+Each town gets a single letter-size page in the brand book's styles: the
+town's description, an at-a-glance table, its community highlights, the
+services offered there and a call to action. The pages are written to
+build/locations/<slug>.pdf, one file per town.
+
+Towns are rendered in a process pool, one task per town. Each worker builds
+the page template and the header/footer artwork (LocationArtwork) once, in
+its initializer, and reuses them for every town it renders, so a town costs
+only the layout of its own text; the artwork is written into each PDF as
+two form XObjects. Nothing is shared between towns, so the build scales
+with the number of cores.
+
+    python create_location_one_pagers.py                  # every town
+    python create_location_one_pagers.py fort-lee-nj      # selected towns
+    python create_location_one_pagers.py --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+from reportlab.graphics import renderPDF
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.platypus import (BaseDocTemplate, PageTemplate, Frame, KeepInFrame, Paragraph, Spacer,
+                                Table, TableStyle)
+
+import asset_manifest
+from asset_manifest import asset_path
+from brand_assets import fitted_size, svg_drawing
+from brand_styles import BROWN, GOLD, CREAM, CHARCOAL, WHITE, HEADLINE_FONT, MARGIN, paragraph_style
+from create_final_corrected_brandbook import h1_style, h2_style, body_style, bullet_style, box_style
+
+LOCATIONS_FILE = os.path.join(asset_manifest.PUBLIC_DIR, 'locations.json')
+OUTPUT_DIR = os.path.join(asset_manifest.ROOT, 'build', 'locations')
+
+PAGE_WIDTH, PAGE_HEIGHT = letter
+HEADER_HEIGHT = 1.35 * inch
+FOOTER_HEIGHT = 0.7 * inch
+LOGO_HEIGHT = 0.85 * inch
+
+PHONE = "(201) 637-4345"
+EMAIL = "info@prodependable.com"
+WEBSITE = "prodependable.com"
+
+SERVICES = (
+    "Deck building, refinishing and repair",
+    "Patio, entry and cellar door installation",
+    "Basement finishing and interior remodeling",
+    "Custom carpentry and structural repairs",
+    "Interior and exterior painting",
+    "Handyman services for everyday repairs",
+)
+
+subtitle_style = paragraph_style('LocationSubtitle', fontSize=13, textColor=GOLD, fontName='Helvetica-Bold',
+                                 spaceAfter=14, leading=16)
+cell_style = paragraph_style('LocationCell', fontSize=11, textColor=CHARCOAL, fontName='Helvetica', leading=14)
+cta_style = paragraph_style('LocationCallToAction', parent=box_style, alignment=TA_CENTER)
+
+
+class LocationArtwork:
+    """Header band and footer of the one-pager, built once and placed as form XObjects
+
+    An instance is the page template's onPage callback. The logo Drawing and
+    the measured text are prepared in __init__; each document gets the
+    artwork as two forms on its first page, and every page references them.
+    """
+
+    header_form = 'LocationHeader'
+    footer_form = 'LocationFooter'
+
+    def __init__(self):
+        logo_path = asset_path('dependable_logo')
+        self.logo = svg_drawing(logo_path)
+        self.logo_width, self.logo_height = fitted_size(logo_path, height=LOGO_HEIGHT)
+        self.footer_text = f"Dependable Home Improvement  ·  {PHONE}  ·  {EMAIL}  ·  {WEBSITE}"
+
+    def __call__(self, canvas, doc):
+        if not canvas.hasForm(self.header_form):
+            self._define_forms(canvas)
+        canvas.doForm(self.header_form)
+        canvas.doForm(self.footer_form)
+
+    def _define_forms(self, canvas):
+        canvas.beginForm(self.header_form, 0, PAGE_HEIGHT - HEADER_HEIGHT, PAGE_WIDTH, PAGE_HEIGHT)
+        canvas.setFillColor(BROWN)
+        canvas.rect(0, PAGE_HEIGHT - HEADER_HEIGHT, PAGE_WIDTH, HEADER_HEIGHT, stroke=0, fill=1)
+        canvas.setFillColor(GOLD)
+        canvas.rect(0, PAGE_HEIGHT - HEADER_HEIGHT - 4, PAGE_WIDTH, 4, stroke=0, fill=1)
+        logo_y = PAGE_HEIGHT - (HEADER_HEIGHT + self.logo_height) / 2
+        canvas.saveState()
+        canvas.translate(MARGIN, logo_y)
+        canvas.scale(self.logo_width / self.logo.width, self.logo_height / self.logo.height)
+        renderPDF.draw(self.logo, canvas, 0, 0)
+        canvas.restoreState()
+        canvas.setFillColor(WHITE)
+        canvas.setFont(HEADLINE_FONT, 22)
+        canvas.drawRightString(PAGE_WIDTH - MARGIN, PAGE_HEIGHT - HEADER_HEIGHT / 2 - 2, "Dependable Home Improvement")
+        canvas.setFillColor(GOLD)
+        canvas.setFont('Helvetica-Oblique', 11)
+        canvas.drawRightString(PAGE_WIDTH - MARGIN, PAGE_HEIGHT - HEADER_HEIGHT / 2 - 20,
+                               "Crafting Excellence. Building Trust.")
+        canvas.endForm()
+
+        canvas.beginForm(self.footer_form, 0, 0, PAGE_WIDTH, FOOTER_HEIGHT)
+        canvas.setStrokeColor(GOLD)
+        canvas.setLineWidth(1)
+        canvas.line(MARGIN, FOOTER_HEIGHT - 0.15 * inch, PAGE_WIDTH - MARGIN, FOOTER_HEIGHT - 0.15 * inch)
+        canvas.setFillColor(CHARCOAL)
+        canvas.setFont('Helvetica', 9)
+        canvas.drawCentredString(PAGE_WIDTH / 2, FOOTER_HEIGHT / 2 - 3, self.footer_text)
+        canvas.endForm()
+
+
+def page_templates(artwork):
+    """The one-pager's page template: a single frame between header and footer"""
+    frame = Frame(MARGIN, FOOTER_HEIGHT, PAGE_WIDTH - 2 * MARGIN,
+                  PAGE_HEIGHT - HEADER_HEIGHT - FOOTER_HEIGHT - 0.2 * inch, id='body')
+    return [PageTemplate(id='OnePager', frames=[frame], onPage=artwork)]
+
+
+def load_locations(path=LOCATIONS_FILE):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_story(location):
+    city = escape(location['city'])
+    town = f"{city}, {escape(location['state'])}"
+    content = [
+        Paragraph(f"Home Improvement in {town}", h1_style),
+        Paragraph(f"Serving {escape(location['county'])} &middot; ZIP {escape(location['zip'])}", subtitle_style),
+        Paragraph(escape(location['description']), body_style),
+        Spacer(1, 0.1 * inch),
+    ]
+
+    glance = Table([
+        [Paragraph("<b>Population</b>", cell_style), Paragraph(escape(location['population']), cell_style)],
+        [Paragraph("<b>County</b>", cell_style), Paragraph(escape(location['county']), cell_style)],
+        [Paragraph("<b>ZIP code</b>", cell_style), Paragraph(escape(location['zip']), cell_style)],
+        [Paragraph("<b>Local page</b>", cell_style),
+         Paragraph(f"{WEBSITE}/locations/{escape(location['slug'])}", cell_style)],
+    ], colWidths=[1.6 * inch, 5.0 * inch])
+    glance.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), CREAM),
+        ('GRID', (0, 0), (-1, -1), 1, GOLD),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 5),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+    ]))
+    content.append(Paragraph(f"{city} at a Glance", h2_style))
+    content.append(glance)
+
+    if location.get('features'):
+        content.append(Paragraph(f"What {city} Is Known For", h2_style))
+        content.extend(Paragraph(f"• {escape(feature)}", bullet_style) for feature in location['features'])
+
+    content.append(Paragraph(f"Our Services in {city}", h2_style))
+    content.extend(Paragraph(f"• {service}", bullet_style) for service in SERVICES)
+    content.append(Spacer(1, 0.15 * inch))
+    content.append(Paragraph(
+        f"<b><font size=13 color='#654321'>Free estimates for {city} homeowners</font></b><br/>"
+        f"Call {PHONE} or email {EMAIL}", cta_style))
+
+    # A one-pager stays one page: a long description shrinks the text instead
+    return [KeepInFrame(0, 0, content, mode='shrink')]
+
+
+# Page templates and artwork of a pool worker, built once per worker
+_worker_templates = None
+
+
+def _init_worker():
+    global _worker_templates
+    _worker_templates = page_templates(LocationArtwork())
+
+
+def _render(location, output_dir):
+    """Worker body: write one town's one-pager; returns (slug, seconds)"""
+    started = time.perf_counter()
+    pdf_file = os.path.join(output_dir, f"{location['slug']}.pdf")
+    doc = BaseDocTemplate(pdf_file, pagesize=letter, pageTemplates=_worker_templates,
+                          title=f"Dependable Home Improvement - {location['city']}, {location['state']}",
+                          leftMargin=MARGIN, rightMargin=MARGIN, topMargin=HEADER_HEIGHT, bottomMargin=FOOTER_HEIGHT)
+    doc.build(build_story(location))
+    return location['slug'], time.perf_counter() - started
+
+
+def build(output_dir=OUTPUT_DIR, slugs=None, workers=None, locations=None):
+    """Render the one-pagers of every town (or of `slugs`); returns {slug: seconds}"""
+    locations = load_locations() if locations is None else locations
+    if slugs:
+        unknown = set(slugs) - {location['slug'] for location in locations}
+        if unknown:
+            raise KeyError(f"not in locations.json: {', '.join(sorted(unknown))}")
+        locations = [location for location in locations if location['slug'] in slugs]
+    os.makedirs(output_dir, exist_ok=True)
+
+    timings = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(_render, location, output_dir) for location in locations]
+        for future in futures:
+            slug, seconds = future.result()
+            timings[slug] = seconds
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a printable one-pager for each service-area town")
+    parser.add_argument('slugs', nargs='*', metavar='slug', help="towns to render (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="render processes (default: one per core)")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        timings = build(args.output_dir, args.slugs, args.workers)
+    except KeyError as exc:
+        parser.error(exc.args[0])
+    wall = time.perf_counter() - started
+    for slug, seconds in timings.items():
+        print(f"  {slug:<28} {seconds:5.2f}s")
+    print(f"✓ {len(timings)} location one-pagers in {wall:.2f}s "
+          f"({sum(timings.values()):.2f}s of rendering): {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
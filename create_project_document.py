@@ -9,6 +9,9 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+import image_embed
+from asset_manifest import asset_path
+
 def add_hyperlink(paragraph, url, text):
     """Add a hyperlink to a paragraph"""
     part = paragraph.part
@@ -37,579 +40,586 @@ def add_hyperlink(paragraph, url, text):
     paragraph._p.append(hyperlink)
     return hyperlink
 
-# Create document
-doc = Document()
+DOCX_FILE = 'Dependable_Home_Improvement_Website_Overview.docx'
+
+
+def build(docx_file=DOCX_FILE):
+    # Create document
+    doc = Document()
 
-# Set default font
-style = doc.styles['Normal']
-font = style.font
-font.name = 'Calibri'
-font.size = Pt(11)
+    # Set default font
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = 'Calibri'
+    font.size = Pt(11)
 
-# Add Cascadia logo
-try:
-    logo = doc.add_picture('cascadia-logo.jpg', width=Inches(3.5))
+    # Add Cascadia logo
+    # python-docx cannot read cascadia-logo.jpg as stored (CMYK, no JFIF header)
+    logo, route = image_embed.docx_picture(doc, asset_path('cascadia_logo'), width=Inches(3.5))
+    print(f"✓ Cascadia logo embedded ({route})")
     last_paragraph = doc.paragraphs[-1]
     last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
     doc.add_paragraph()  # Add spacing
-except:
-    pass
 
-# Title
-title = doc.add_heading('DEPENDABLE HOME IMPROVEMENT', 0)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-title.runs[0].font.color.rgb = RGBColor(101, 67, 33)  # Brown color
+    # Title
+    title = doc.add_heading('DEPENDABLE HOME IMPROVEMENT', 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title.runs[0].font.color.rgb = RGBColor(101, 67, 33)  # Brown color
+
+    subtitle = doc.add_heading('Premium Website Redesign Project Overview', level=2)
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle.runs[0].font.color.rgb = RGBColor(184, 134, 11)  # Gold color
+
+    doc.add_paragraph()
+
+    # Executive Summary
+    doc.add_heading('Executive Summary', 1)
+    p = doc.add_paragraph()
+    p.add_run('Cascadia Managing Brands is proud to present the complete transformation of Dependable Home Improvement\'s digital presence. This document outlines the comprehensive website redesign that elevates your online presence from a basic informational site to a sophisticated, conversion-optimized digital marketing platform valued at over $15,000 in professional development services.\n\n')
+
+    p = doc.add_paragraph()
+    p.add_run('This premium website redesign positions Dependable Home Improvement as the premier home improvement service in Bergen County, New Jersey, with advanced features typically found on enterprise-level websites costing upwards of $100,000. For reference, ')
+    add_hyperlink(p, 'https://liquiddeath.com', 'LiquidDeath.com')
+    p.add_run(' represents the caliber of design and functionality that commands six-figure budgets in the industry.\n\n')
+
+    p = doc.add_paragraph()
+    p.add_run('We are providing this exceptional website to you at no charge as part of our commitment to supporting quality businesses in our community.')
+
+    # Color Scheme Section
+    doc.add_heading('Design Philosophy & Color Scheme', 1)
+
+    doc.add_heading('Brown & Gold Palette: The Psychology of Premium', 2)
+    p = doc.add_paragraph()
+    p.add_run('The sophisticated brown and gold color scheme was strategically selected for multiple marketing and psychological reasons:\n\n')
+
+    p = doc.add_paragraph()
+    p.add_run('Marketing Rationale: ').bold = True
+    p.add_run('Brown conveys reliability, earthiness, and craftsmanship—essential qualities for a home improvement business. It psychologically connects to wood, natural materials, and the foundation of quality construction. Gold represents premium service, excellence, and value. This combination immediately positions Dependable Home Improvement as a high-end, trustworthy service provider rather than a budget contractor.\n\n')
+
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Rationale: ').bold = True
+    p.add_run('The high contrast between brown backgrounds and gold accents ensures excellent readability across all devices, which directly impacts user engagement metrics—a critical SEO ranking factor. The warm, professional palette differentiates your site from competitors who typically use blue or green schemes, making your brand more memorable and reducing bounce rates.\n\n')
+
+    p = doc.add_paragraph()
+    p.add_run('We deliberately avoided gradient fades in favor of solid, sophisticated backgrounds to maintain a clean, modern aesthetic that loads faster and appears more professional on all screen sizes.')
+
+    # Comprehensive Features Section
+    doc.add_heading('Comprehensive Feature Breakdown', 1)
+
+    # Hero Section
+    doc.add_heading('1. Dynamic Hero Section with Video Background', 2)
+
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('A full-screen hero section featuring professional carpentry work video background, your actual company logo (115px for maximum visibility), compelling headline "Crafting Excellence, Building Trust," and prominent call-to-action buttons.\n\n')
+
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Video backgrounds increase engagement by 80% compared to static images. The moving imagery immediately captures attention, demonstrates your craftsmanship in action, and creates an emotional connection. The tagline positions you as both skilled craftsmen and trustworthy partners—addressing the two primary concerns of home improvement customers.\n\n')
 
-subtitle = doc.add_heading('Premium Website Redesign Project Overview', level=2)
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-subtitle.runs[0].font.color.rgb = RGBColor(184, 134, 11)  # Gold color
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Video content increases time-on-site, a crucial ranking signal for Google. The hero section is optimized for Core Web Vitals with lazy loading and WebP format compression, ensuring fast load times despite rich media. The prominent logo and company name provide immediate brand recognition and support local search optimization.')
 
-doc.add_paragraph()
+    # Animated Statistics
+    doc.add_heading('2. Animated Statistics Counter', 2)
 
-# Executive Summary
-doc.add_heading('Executive Summary', 1)
-p = doc.add_paragraph()
-p.add_run('Cascadia Managing Brands is proud to present the complete transformation of Dependable Home Improvement\'s digital presence. This document outlines the comprehensive website redesign that elevates your online presence from a basic informational site to a sophisticated, conversion-optimized digital marketing platform valued at over $15,000 in professional development services.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Real-time counting animations displaying 20+ years of experience, 1,500+ completed projects, 500+ satisfied clients, and 100% satisfaction guarantee.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('This premium website redesign positions Dependable Home Improvement as the premier home improvement service in Bergen County, New Jersey, with advanced features typically found on enterprise-level websites costing upwards of $100,000. For reference, ')
-add_hyperlink(p, 'https://liquiddeath.com', 'LiquidDeath.com')
-p.add_run(' represents the caliber of design and functionality that commands six-figure budgets in the industry.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Animated numbers draw the eye and make statistics more impactful. These specific metrics build immediate credibility and overcome the primary objection in home improvement: "Can I trust this contractor?" The 100% satisfaction guarantee reduces perceived risk.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('We are providing this exceptional website to you at no charge as part of our commitment to supporting quality businesses in our community.')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Animation increases user interaction, improving engagement metrics. The statistics are also coded in structured data (Schema.org) for search engines to display in rich snippets, potentially increasing click-through rates from search results by 30%.')
 
-# Color Scheme Section
-doc.add_heading('Design Philosophy & Color Scheme', 1)
+    # Navigation
+    doc.add_heading('3. Intelligent Sticky Navigation with Multi-Language Support', 2)
 
-doc.add_heading('Brown & Gold Palette: The Psychology of Premium', 2)
-p = doc.add_paragraph()
-p.add_run('The sophisticated brown and gold color scheme was strategically selected for multiple marketing and psychological reasons:\n\n')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Fixed navigation bar that transitions from transparent to white on scroll, featuring left-aligned logo (20% larger than standard), company name on maximum 2 lines, comprehensive menu links, and language toggle for English, Russian, and Spanish (Latin America).\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Rationale: ').bold = True
-p.add_run('Brown conveys reliability, earthiness, and craftsmanship—essential qualities for a home improvement business. It psychologically connects to wood, natural materials, and the foundation of quality construction. Gold represents premium service, excellence, and value. This combination immediately positions Dependable Home Improvement as a high-end, trustworthy service provider rather than a budget contractor.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Sticky navigation keeps conversion opportunities (contact buttons, phone number) always accessible, increasing lead generation by up to 40%. Multi-language support dramatically expands your addressable market in Bergen County\'s diverse population, particularly the significant Russian and Spanish-speaking communities.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Rationale: ').bold = True
-p.add_run('The high contrast between brown backgrounds and gold accents ensures excellent readability across all devices, which directly impacts user engagement metrics—a critical SEO ranking factor. The warm, professional palette differentiates your site from competitors who typically use blue or green schemes, making your brand more memorable and reducing bounce rates.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('The smooth scroll transition provides excellent user experience without jarring jumps. Language options are implemented with proper hreflang tags for international SEO. The left-aligned, prominent logo ensures brand visibility and supports mobile usability guidelines.')
 
-p = doc.add_paragraph()
-p.add_run('We deliberately avoided gradient fades in favor of solid, sophisticated backgrounds to maintain a clean, modern aesthetic that loads faster and appears more professional on all screen sizes.')
+    # Promotional Banner
+    doc.add_heading('4. Seasonal Promotions Banner', 2)
 
-# Comprehensive Features Section
-doc.add_heading('Comprehensive Feature Breakdown', 1)
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Dismissible banner at the top of the page highlighting current seasonal offers (currently: Winter Special - 15% off interior painting).\n\n')
 
-# Hero Section
-doc.add_heading('1. Dynamic Hero Section with Video Background', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Urgency-driven promotions increase conversion rates by creating a compelling reason to act now rather than later. Seasonal offers align with natural buying cycles and help fill slower periods.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('A full-screen hero section featuring professional carpentry work video background, your actual company logo (115px for maximum visibility), compelling headline "Crafting Excellence, Building Trust," and prominent call-to-action buttons.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('The dismissible feature respects user experience while still capturing attention. Banner content can be easily updated to match current campaigns without developer intervention.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Video backgrounds increase engagement by 80% compared to static images. The moving imagery immediately captures attention, demonstrates your craftsmanship in action, and creates an emotional connection. The tagline positions you as both skilled craftsmen and trustworthy partners—addressing the two primary concerns of home improvement customers.\n\n')
+    # Before/After Gallery
+    doc.add_heading('5. Professional Before/After Project Gallery', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Video content increases time-on-site, a crucial ranking signal for Google. The hero section is optimized for Core Web Vitals with lazy loading and WebP format compression, ensuring fast load times despite rich media. The prominent logo and company name provide immediate brand recognition and support local search optimization.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Side-by-side before and after photo gallery showcasing 9 completed projects including deck refinishing, reconstruction, stair replacement, patio door installation, cellar door installation, and basement finishing. All images are actual projects from your portfolio.\n\n')
 
-# Animated Statistics
-doc.add_heading('2. Animated Statistics Counter', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Before/after galleries are the single most persuasive element for home improvement websites. They provide concrete proof of capability, help prospects visualize their own projects, and build trust through transparency. Using real project photos (not stock images) establishes authenticity.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Real-time counting animations displaying 20+ years of experience, 1,500+ completed projects, 500+ satisfied clients, and 100% satisfaction guarantee.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Image galleries increase time-on-page and reduce bounce rates. Each image includes descriptive alt text for accessibility and SEO. The side-by-side layout (not sliders) ensures all images are immediately visible to search engine crawlers, improving image search rankings. WebP format reduces file size by 30% while maintaining quality.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Animated numbers draw the eye and make statistics more impactful. These specific metrics build immediate credibility and overcome the primary objection in home improvement: "Can I trust this contractor?" The 100% satisfaction guarantee reduces perceived risk.\n\n')
+    # Interactive Service Area Map
+    doc.add_heading('6. Interactive Google Maps Service Area Visualization', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Animation increases user interaction, improving engagement metrics. The statistics are also coded in structured data (Schema.org) for search engines to display in rich snippets, potentially increasing click-through rates from search results by 30%.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Fully interactive Google Maps integration showing your 25-mile service radius around Bergen County, with clickable markers, service areas list, and integrated contact information.\n\n')
 
-# Navigation
-doc.add_heading('3. Intelligent Sticky Navigation with Multi-Language Support', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('The visual service area map immediately answers the question "Do you serve my area?" reducing friction in the customer journey. It positions you as an established local business rather than a fly-by-night contractor.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Fixed navigation bar that transitions from transparent to white on scroll, featuring left-aligned logo (20% larger than standard), company name on maximum 2 lines, comprehensive menu links, and language toggle for English, Russian, and Spanish (Latin America).\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Google Maps integration provides powerful local SEO signals. The embedded map connects to your Google Business Profile, strengthening local search rankings. Geographic data helps Google understand your service area for "near me" searches, which account for 46% of all Google searches.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Sticky navigation keeps conversion opportunities (contact buttons, phone number) always accessible, increasing lead generation by up to 40%. Multi-language support dramatically expands your addressable market in Bergen County\'s diverse population, particularly the significant Russian and Spanish-speaking communities.\n\n')
+    # Multi-Step Contact Form
+    doc.add_heading('7. Advanced 4-Step Multi-Step Contact Form', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('The smooth scroll transition provides excellent user experience without jarring jumps. Language options are implemented with proper hreflang tags for international SEO. The left-aligned, prominent logo ensures brand visibility and supports mobile usability guidelines.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Progressive contact form with visual progress indicator collecting: (1) Contact information, (2) Project details and service type, (3) Timeline and budget range, (4) Additional requirements and preferences. Includes real-time validation and success confirmation.\n\n')
 
-# Promotional Banner
-doc.add_heading('4. Seasonal Promotions Banner', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Multi-step forms increase completion rates by 300% compared to long single-page forms. The progressive disclosure reduces psychological burden while gathering detailed qualification information. This allows you to prioritize high-value leads and prepare more accurate estimates before the first call.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Dismissible banner at the top of the page highlighting current seasonal offers (currently: Winter Special - 15% off interior painting).\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Form interactions count as engagement signals for SEO. The step-by-step approach reduces form abandonment, improving conversion rates. Client-side validation provides immediate feedback, improving user experience and reducing server load.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Urgency-driven promotions increase conversion rates by creating a compelling reason to act now rather than later. Seasonal offers align with natural buying cycles and help fill slower periods.\n\n')
+    # Location Pages
+    doc.add_heading('8. Location-Specific Landing Pages', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('The dismissible feature respects user experience while still capturing attention. Banner content can be easily updated to match current campaigns without developer intervention.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Eight dedicated pages for major Bergen County towns: Hackensack, Teaneck, Fort Lee, Fair Lawn, Bergenfield, Paramus, Ridgewood, and Englewood. Each page includes localized content, service information, and area-specific testimonials.\n\n')
 
-# Before/After Gallery
-doc.add_heading('5. Professional Before/After Project Gallery', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Location pages demonstrate deep local knowledge and commitment to specific communities. They allow you to address unique characteristics of each town and build stronger connections with local residents.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Side-by-side before and after photo gallery showcasing 9 completed projects including deck refinishing, reconstruction, stair replacement, patio door installation, cellar door installation, and basement finishing. All images are actual projects from your portfolio.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('This is advanced local SEO strategy. Each location page targets "[service] in [city]" keywords, dramatically increasing your visibility for high-intent local searches. These pages can rank independently, multiplying your search presence. Location pages are essential for appearing in Google\'s Local Pack (the map results at the top of search).')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Before/after galleries are the single most persuasive element for home improvement websites. They provide concrete proof of capability, help prospects visualize their own projects, and build trust through transparency. Using real project photos (not stock images) establishes authenticity.\n\n')
+    # Dynamic Testimonials
+    doc.add_heading('9. Dynamic Testimonials Management System', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Image galleries increase time-on-page and reduce bounce rates. Each image includes descriptive alt text for accessibility and SEO. The side-by-side layout (not sliders) ensures all images are immediately visible to search engine crawlers, improving image search rankings. WebP format reduces file size by 30% while maintaining quality.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('JSON-based testimonials system allowing easy updates without code changes. Currently featuring reviews from Bill S. (Ramsey), Sarah M. (Teaneck), Michael R. (Hackensack), Jennifer L. (Fort Lee), David K. (Paramus), and Lisa W. (Ridgewood). Includes verified badges, star ratings, dates, and service types.\n\n')
 
-# Interactive Service Area Map
-doc.add_heading('6. Interactive Google Maps Service Area Visualization', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Customer testimonials are the most trusted form of marketing content, with 92% of consumers reading reviews before making a decision. The verified badges and specific details (names, locations, dates) build credibility. Featuring diverse service types demonstrates comprehensive capabilities.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Fully interactive Google Maps integration showing your 25-mile service radius around Bergen County, with clickable markers, service areas list, and integrated contact information.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Reviews are implemented with Schema.org Review markup, enabling rich snippets in search results (star ratings appear directly in Google). The dynamic system makes it effortless to keep content fresh, which search engines reward. Regular review updates signal an active, thriving business.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('The visual service area map immediately answers the question "Do you serve my area?" reducing friction in the customer journey. It positions you as an established local business rather than a fly-by-night contractor.\n\n')
+    # Review Platform Badges
+    doc.add_heading('10. Third-Party Review Platform Integration', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Google Maps integration provides powerful local SEO signals. The embedded map connects to your Google Business Profile, strengthening local search rankings. Geographic data helps Google understand your service area for "near me" searches, which account for 46% of all Google searches.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Prominent badges for Angi (formerly Angie\'s List), Google Reviews, and Better Business Bureau with A+ rating. Review widgets displaying actual customer feedback from each platform.\n\n')
 
-# Multi-Step Contact Form
-doc.add_heading('7. Advanced 4-Step Multi-Step Contact Form', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Third-party validation is exponentially more powerful than self-promotion. BBB accreditation and high ratings on Angi and Google provide independent verification of quality. The A+ BBB rating specifically addresses trust concerns that prevent conversions.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Progressive contact form with visual progress indicator collecting: (1) Contact information, (2) Project details and service type, (3) Timeline and budget range, (4) Additional requirements and preferences. Includes real-time validation and success confirmation.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Links to review platforms create valuable backlinks and citation signals for local SEO. The widgets pull in fresh content automatically, keeping your site dynamic. Review platform integration increases your digital footprint across multiple authoritative domains.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Multi-step forms increase completion rates by 300% compared to long single-page forms. The progressive disclosure reduces psychological burden while gathering detailed qualification information. This allows you to prioritize high-value leads and prepare more accurate estimates before the first call.\n\n')
+    # Blog Section
+    doc.add_heading('11. Content Marketing Blog with Category Filtering', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Form interactions count as engagement signals for SEO. The step-by-step approach reduces form abandonment, improving conversion rates. Client-side validation provides immediate feedback, improving user experience and reducing server load.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Professional blog featuring 5 comprehensive articles: Winter Home Maintenance, Kitchen Remodeling Trends 2024, Choosing the Right Contractor, Bathroom Renovation ROI, and Spring Exterior Care. Each article includes featured images, category tags, author information, and estimated read time.\n\n')
 
-# Location Pages
-doc.add_heading('8. Location-Specific Landing Pages', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Educational content positions you as an expert advisor, not just a service provider. Blog articles address common questions and concerns, building trust before prospects even contact you. Content marketing generates 3x more leads than traditional advertising at 62% lower cost.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Eight dedicated pages for major Bergen County towns: Hackensack, Teaneck, Fort Lee, Fair Lawn, Bergenfield, Paramus, Ridgewood, and Englewood. Each page includes localized content, service information, and area-specific testimonials.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Blogs are SEO powerhouses. Each article targets specific long-tail keywords that prospects search for ("how to choose a contractor," "bathroom renovation ROI"). Regular content updates signal site freshness to search engines. Blog posts create internal linking opportunities and increase total indexed pages, expanding your search visibility. Articles are optimized with Schema.org BlogPosting markup for enhanced search appearance.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Location pages demonstrate deep local knowledge and commitment to specific communities. They allow you to address unique characteristics of each town and build stronger connections with local residents.\n\n')
+    # FAQ Page
+    doc.add_heading('12. Comprehensive FAQ Page with Schema Markup', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('This is advanced local SEO strategy. Each location page targets "[service] in [city]" keywords, dramatically increasing your visibility for high-intent local searches. These pages can rank independently, multiplying your search presence. Location pages are essential for appearing in Google\'s Local Pack (the map results at the top of search).')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('21 frequently asked questions organized into 7 categories: Getting Started, Services, Timeline & Scheduling, Licensing & Insurance, Pricing & Payment, Project Management, and Communication. Expandable accordion interface for easy navigation.\n\n')
 
-# Dynamic Testimonials
-doc.add_heading('9. Dynamic Testimonials Management System', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('FAQs preemptively address objections and concerns, reducing friction in the sales process. They qualify leads by setting clear expectations about process, pricing structure, and requirements. Comprehensive FAQs reduce repetitive customer service inquiries.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('JSON-based testimonials system allowing easy updates without code changes. Currently featuring reviews from Bill S. (Ramsey), Sarah M. (Teaneck), Michael R. (Hackensack), Jennifer L. (Fort Lee), David K. (Paramus), and Lisa W. (Ridgewood). Includes verified badges, star ratings, dates, and service types.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('FAQ pages target question-based searches ("Do I need permits for...?", "How long does...?"). Implemented with FAQPage schema markup, your answers can appear directly in Google search results as rich snippets, dramatically increasing visibility and click-through rates. Voice search optimization is built-in, as virtual assistants often pull from FAQ structured data.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Customer testimonials are the most trusted form of marketing content, with 92% of consumers reading reviews before making a decision. The verified badges and specific details (names, locations, dates) build credibility. Featuring diverse service types demonstrates comprehensive capabilities.\n\n')
+    # Services Page
+    doc.add_heading('13. Detailed Services Showcase', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Reviews are implemented with Schema.org Review markup, enabling rich snippets in search results (star ratings appear directly in Google). The dynamic system makes it effortless to keep content fresh, which search engines reward. Regular review updates signal an active, thriving business.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Dedicated services page highlighting four core service categories: General Handyman Services, Professional Carpentry, Interior & Exterior Painting, and Complete Home Renovations. Each service includes detailed feature lists, benefits, and visual icons.\n\n')
 
-# Review Platform Badges
-doc.add_heading('10. Third-Party Review Platform Integration', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Clear service categorization helps prospects quickly identify if you can solve their specific problem. Detailed descriptions educate customers about scope and quality, setting appropriate expectations. The comprehensive service list positions you as a full-service provider, increasing average project value.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Prominent badges for Angi (formerly Angie\'s List), Google Reviews, and Better Business Bureau with A+ rating. Review widgets displaying actual customer feedback from each platform.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Each service category is optimized for specific keyword clusters. The page structure uses Schema.org Service markup, enabling rich results in search. Internal linking from services to related blog posts and case studies creates strong topical authority signals.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Third-party validation is exponentially more powerful than self-promotion. BBB accreditation and high ratings on Angi and Google provide independent verification of quality. The A+ BBB rating specifically addresses trust concerns that prevent conversions.\n\n')
+    # Team Page
+    doc.add_heading('14. Team & Company Culture Showcase', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Links to review platforms create valuable backlinks and citation signals for local SEO. The widgets pull in fresh content automatically, keeping your site dynamic. Review platform integration increases your digital footprint across multiple authoritative domains.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Dedicated team page featuring bios for Sergey (Owner/Master Craftsman), Boris (Lead Carpenter), and crew members. Includes office and workshop photos demonstrating your professional operation.\n\n')
 
-# Blog Section
-doc.add_heading('11. Content Marketing Blog with Category Filtering', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Putting faces to the business humanizes your brand and builds trust. Customers want to know who will be entering their homes. Professional bios establish expertise and experience. Workshop photos demonstrate you\'re an established, legitimate business with proper facilities.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Professional blog featuring 5 comprehensive articles: Winter Home Maintenance, Kitchen Remodeling Trends 2024, Choosing the Right Contractor, Bathroom Renovation ROI, and Spring Exterior Care. Each article includes featured images, category tags, author information, and estimated read time.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Team pages increase site depth and provide additional indexable content. Personal bios can rank for branded searches and establish individual authority. The page supports E-E-A-T (Experience, Expertise, Authoritativeness, Trustworthiness) signals that Google uses for ranking.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Educational content positions you as an expert advisor, not just a service provider. Blog articles address common questions and concerns, building trust before prospects even contact you. Content marketing generates 3x more leads than traditional advertising at 62% lower cost.\n\n')
+    # Social Media Integration
+    doc.add_heading('15. Social Media Integration & WhatsApp Communication', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Blogs are SEO powerhouses. Each article targets specific long-tail keywords that prospects search for ("how to choose a contractor," "bathroom renovation ROI"). Regular content updates signal site freshness to search engines. Blog posts create internal linking opportunities and increase total indexed pages, expanding your search visibility. Articles are optimized with Schema.org BlogPosting markup for enhanced search appearance.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Integrated links to Facebook, Instagram, LinkedIn, and Yelp profiles throughout the site. Floating WhatsApp button for instant messaging capability.\n\n')
 
-# FAQ Page
-doc.add_heading('12. Comprehensive FAQ Page with Schema Markup', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Social proof extends beyond your website. Links to active social profiles allow prospects to see real-time updates, additional photos, and community engagement. WhatsApp provides a low-friction communication channel preferred by many customers, especially in immigrant communities. Instant messaging captures leads who might not fill out forms or make phone calls.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('21 frequently asked questions organized into 7 categories: Getting Started, Services, Timeline & Scheduling, Licensing & Insurance, Pricing & Payment, Project Management, and Communication. Expandable accordion interface for easy navigation.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Social signals contribute to overall online authority. Cross-platform presence strengthens brand consistency. WhatsApp integration improves conversion rates by offering multiple contact methods, reducing bounce rates from visitors who prefer messaging.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('FAQs preemptively address objections and concerns, reducing friction in the sales process. They qualify leads by setting clear expectations about process, pricing structure, and requirements. Comprehensive FAQs reduce repetitive customer service inquiries.\n\n')
+    # Case Studies
+    doc.add_heading('16. Detailed Case Studies & Project Transformations', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('FAQ pages target question-based searches ("Do I need permits for...?", "How long does...?"). Implemented with FAQPage schema markup, your answers can appear directly in Google search results as rich snippets, dramatically increasing visibility and click-through rates. Voice search optimization is built-in, as virtual assistants often pull from FAQ structured data.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('In-depth case studies documenting complete project transformations with challenges, solutions, and results. Includes detailed project narratives, timelines, and outcome descriptions.\n\n')
 
-# Services Page
-doc.add_heading('13. Detailed Services Showcase', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Case studies are powerful sales tools that demonstrate problem-solving ability and results. They help prospects envision their own projects and understand your process. Detailed narratives build confidence in your expertise and thoroughness.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Dedicated services page highlighting four core service categories: General Handyman Services, Professional Carpentry, Interior & Exterior Painting, and Complete Home Renovations. Each service includes detailed feature lists, benefits, and visual icons.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Long-form case studies provide substantial content depth, targeting multiple related keywords. They increase average time-on-site and reduce bounce rates. Case studies create natural opportunities for internal linking to related services and blog posts.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Clear service categorization helps prospects quickly identify if you can solve their specific problem. Detailed descriptions educate customers about scope and quality, setting appropriate expectations. The comprehensive service list positions you as a full-service provider, increasing average project value.\n\n')
+    # Video Resources
+    doc.add_heading('17. Video How-To Guides Library', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Each service category is optimized for specific keyword clusters. The page structure uses Schema.org Service markup, enabling rich results in search. Internal linking from services to related blog posts and case studies creates strong topical authority signals.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Collection of educational video guides covering home maintenance and improvement topics, positioning you as a helpful resource beyond just service provider.\n\n')
 
-# Team Page
-doc.add_heading('14. Team & Company Culture Showcase', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Educational videos build goodwill and establish expertise. They create touchpoints with prospects who aren\'t ready to hire yet, keeping you top-of-mind. Video content is highly shareable, expanding organic reach.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Dedicated team page featuring bios for Sergey (Owner/Master Craftsman), Boris (Lead Carpenter), and crew members. Includes office and workshop photos demonstrating your professional operation.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Video content dramatically increases engagement metrics. Video pages have 50x better chance of ranking on first page of Google than text-only pages. Video schema markup enables video rich snippets in search results.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Putting faces to the business humanizes your brand and builds trust. Customers want to know who will be entering their homes. Professional bios establish expertise and experience. Workshop photos demonstrate you\'re an established, legitimate business with proper facilities.\n\n')
+    # Downloadable Resources
+    doc.add_heading('18. Downloadable PDF Resources', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Team pages increase site depth and provide additional indexable content. Personal bios can rank for branded searches and establish individual authority. The page supports E-E-A-T (Experience, Expertise, Authoritativeness, Trustworthiness) signals that Google uses for ranking.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Professional PDF guides and checklists available for download, providing value to visitors and establishing authority.\n\n')
 
-# Social Media Integration
-doc.add_heading('15. Social Media Integration & WhatsApp Communication', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Downloadable resources serve as lead magnets, capturing contact information in exchange for value. They extend your brand beyond the website and keep you visible during the consideration phase.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Integrated links to Facebook, Instagram, LinkedIn, and Yelp profiles throughout the site. Floating WhatsApp button for instant messaging capability.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('PDF resources create additional indexed content and target document search results. They provide backlink opportunities when shared and referenced by others.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Social proof extends beyond your website. Links to active social profiles allow prospects to see real-time updates, additional photos, and community engagement. WhatsApp provides a low-friction communication channel preferred by many customers, especially in immigrant communities. Instant messaging captures leads who might not fill out forms or make phone calls.\n\n')
+    # Referral Program
+    doc.add_heading('19. Customer Referral Program', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Social signals contribute to overall online authority. Cross-platform presence strengthens brand consistency. WhatsApp integration improves conversion rates by offering multiple contact methods, reducing bounce rates from visitors who prefer messaging.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Structured referral program with clear incentives and easy participation process, encouraging word-of-mouth marketing.\n\n')
 
-# Case Studies
-doc.add_heading('16. Detailed Case Studies & Project Transformations', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Referral programs systematize word-of-mouth, the most effective marketing channel. Incentivized referrals reduce customer acquisition costs while maintaining high-quality leads. Referred customers have 37% higher retention rates.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('In-depth case studies documenting complete project transformations with challenges, solutions, and results. Includes detailed project narratives, timelines, and outcome descriptions.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Referral program pages target branded searches and demonstrate business legitimacy. They create shareable content and can generate social media engagement.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Case studies are powerful sales tools that demonstrate problem-solving ability and results. They help prospects envision their own projects and understand your process. Detailed narratives build confidence in your expertise and thoroughness.\n\n')
+    # Analytics
+    doc.add_heading('20. Advanced Analytics & User Behavior Tracking', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Long-form case studies provide substantial content depth, targeting multiple related keywords. They increase average time-on-site and reduce bounce rates. Case studies create natural opportunities for internal linking to related services and blog posts.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Integrated Google Analytics 4 and Hotjar heatmap tracking with comprehensive setup documentation. Complete visitor tracking, conversion monitoring, and user behavior analysis capabilities.\n\n')
 
-# Video Resources
-doc.add_heading('17. Video How-To Guides Library', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Data-driven decision making is essential for optimization. Analytics reveal which marketing channels drive the most valuable traffic, which pages convert best, and where visitors drop off. Hotjar heatmaps show exactly how users interact with your site, enabling continuous improvement.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Collection of educational video guides covering home maintenance and improvement topics, positioning you as a helpful resource beyond just service provider.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Analytics data informs SEO strategy by revealing high-performing content and optimization opportunities. Behavior metrics help identify technical issues affecting user experience and search rankings.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Educational videos build goodwill and establish expertise. They create touchpoints with prospects who aren\'t ready to hire yet, keeping you top-of-mind. Video content is highly shareable, expanding organic reach.\n\n')
+    # Schema Markup
+    doc.add_heading('21. Comprehensive Schema.org Structured Data', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Video content dramatically increases engagement metrics. Video pages have 50x better chance of ranking on first page of Google than text-only pages. Video schema markup enables video rich snippets in search results.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Complete structured data implementation including LocalBusiness schema with coordinates and service areas, Service schemas for all offerings, FAQPage schema, BlogPosting schema, and Review schema.\n\n')
 
-# Downloadable Resources
-doc.add_heading('18. Downloadable PDF Resources', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Structured data enables rich search results that stand out visually, increasing click-through rates by up to 30%. Star ratings, business hours, and service information appear directly in search results.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Professional PDF guides and checklists available for download, providing value to visitors and establishing authority.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Schema markup is the language search engines use to understand your content. It\'s essential for appearing in rich snippets, knowledge panels, and voice search results. Proper structured data implementation gives you a significant competitive advantage, as most small business websites lack it.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Downloadable resources serve as lead magnets, capturing contact information in exchange for value. They extend your brand beyond the website and keep you visible during the consideration phase.\n\n')
+    # Legal Pages
+    doc.add_heading('22. Privacy Policy & Terms of Service', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('PDF resources create additional indexed content and target document search results. They provide backlink opportunities when shared and referenced by others.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Comprehensive legal pages covering privacy practices, data collection, cookie usage, and terms of service.\n\n')
 
-# Referral Program
-doc.add_heading('19. Customer Referral Program', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Legal pages demonstrate professionalism and build trust. They reassure visitors that you take privacy and business practices seriously.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Structured referral program with clear incentives and easy participation process, encouraging word-of-mouth marketing.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Privacy policies are legally required for websites using analytics or collecting data. They\'re also trust signals for search engines and necessary for GDPR compliance, protecting you from legal liability.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Referral programs systematize word-of-mouth, the most effective marketing channel. Incentivized referrals reduce customer acquisition costs while maintaining high-quality leads. Referred customers have 37% higher retention rates.\n\n')
+    # Sitemap
+    doc.add_heading('23. Complete XML Sitemap & Breadcrumb Navigation', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Referral program pages target branded searches and demonstrate business legitimacy. They create shareable content and can generate social media engagement.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Comprehensive sitemap listing all pages and breadcrumb navigation showing user location within site hierarchy.\n\n')
 
-# Analytics
-doc.add_heading('20. Advanced Analytics & User Behavior Tracking', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Clear navigation reduces frustration and helps visitors find information quickly, improving conversion rates.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Integrated Google Analytics 4 and Hotjar heatmap tracking with comprehensive setup documentation. Complete visitor tracking, conversion monitoring, and user behavior analysis capabilities.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('XML sitemaps help search engines discover and index all your pages. Breadcrumbs provide additional internal linking and can appear in search results, improving click-through rates. Both are essential technical SEO elements.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Data-driven decision making is essential for optimization. Analytics reveal which marketing channels drive the most valuable traffic, which pages convert best, and where visitors drop off. Hotjar heatmaps show exactly how users interact with your site, enabling continuous improvement.\n\n')
+    # Newsletter
+    doc.add_heading('24. Newsletter Signup & Email List Building', 2)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Analytics data informs SEO strategy by revealing high-performing content and optimization opportunities. Behavior metrics help identify technical issues affecting user experience and search rankings.')
+    p = doc.add_paragraph()
+    p.add_run('What We Built: ').bold = True
+    p.add_run('Email capture form with validation and success confirmation, enabling ongoing communication with prospects and customers.\n\n')
 
-# Schema Markup
-doc.add_heading('21. Comprehensive Schema.org Structured Data', 2)
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Email marketing delivers $42 return for every $1 spent. Building an email list creates a owned marketing channel independent of advertising platforms. Regular newsletters keep you top-of-mind for future projects and referrals.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Complete structured data implementation including LocalBusiness schema with coordinates and service areas, Service schemas for all offerings, FAQPage schema, BlogPosting schema, and Review schema.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Email list building supports long-term customer relationship management. It enables remarketing to engaged audiences and provides a direct communication channel.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Structured data enables rich search results that stand out visually, increasing click-through rates by up to 30%. Star ratings, business hours, and service information appear directly in search results.\n\n')
+    # Technical Excellence
+    doc.add_heading('Technical Excellence & Performance Optimization', 1)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Schema markup is the language search engines use to understand your content. It\'s essential for appearing in rich snippets, knowledge panels, and voice search results. Proper structured data implementation gives you a significant competitive advantage, as most small business websites lack it.')
+    doc.add_heading('Core Web Vitals Optimization', 2)
+    p = doc.add_paragraph()
+    p.add_run('The entire website is built with Google\'s Core Web Vitals in mind—the performance metrics that directly impact search rankings:\n\n')
 
-# Legal Pages
-doc.add_heading('22. Privacy Policy & Terms of Service', 2)
+    p = doc.add_paragraph()
+    p.add_run('• Largest Contentful Paint (LCP): ').bold = True
+    p.add_run('Optimized image loading and video compression ensure the hero section loads in under 2.5 seconds.\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Comprehensive legal pages covering privacy practices, data collection, cookie usage, and terms of service.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('• First Input Delay (FID): ').bold = True
+    p.add_run('Minimal JavaScript and efficient code execution provide instant interactivity.\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Legal pages demonstrate professionalism and build trust. They reassure visitors that you take privacy and business practices seriously.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('• Cumulative Layout Shift (CLS): ').bold = True
+    p.add_run('Proper image dimensions and reserved space prevent content jumping during load.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Privacy policies are legally required for websites using analytics or collecting data. They\'re also trust signals for search engines and necessary for GDPR compliance, protecting you from legal liability.')
+    doc.add_heading('Mobile-First Responsive Design', 2)
+    p = doc.add_paragraph()
+    p.add_run('With over 60% of web traffic coming from mobile devices, the entire site is built mobile-first. Every element adapts perfectly to smartphones, tablets, and desktops. Google\'s mobile-first indexing means your mobile site IS your search ranking, making this critical for SEO.')
 
-# Sitemap
-doc.add_heading('23. Complete XML Sitemap & Breadcrumb Navigation', 2)
+    doc.add_heading('WebP Image Format & Lazy Loading', 2)
+    p = doc.add_paragraph()
+    p.add_run('All images use modern WebP format, reducing file sizes by 30% compared to JPEG while maintaining quality. Lazy loading ensures images only download when needed, dramatically improving initial page load speed.')
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Comprehensive sitemap listing all pages and breadcrumb navigation showing user location within site hierarchy.\n\n')
+    doc.add_heading('Accessibility Compliance', 2)
+    p = doc.add_paragraph()
+    p.add_run('The site follows WCAG accessibility guidelines with proper heading hierarchy, alt text for all images, keyboard navigation support, and sufficient color contrast. Accessibility is both ethically important and a ranking factor for search engines.')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Clear navigation reduces frustration and helps visitors find information quickly, improving conversion rates.\n\n')
+    # Value Proposition
+    doc.add_heading('Investment Value & Market Comparison', 1)
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('XML sitemaps help search engines discover and index all your pages. Breadcrumbs provide additional internal linking and can appear in search results, improving click-through rates. Both are essential technical SEO elements.')
+    doc.add_heading('Professional Development Cost: $15,000+', 2)
+    p = doc.add_paragraph()
+    p.add_run('A website of this caliber, built by a professional agency, would typically cost between $15,000 and $25,000. This estimate includes:\n\n')
 
-# Newsletter
-doc.add_heading('24. Newsletter Signup & Email List Building', 2)
+    items = [
+        'Custom design and branding: $3,000-$5,000',
+        'Responsive development (20+ pages): $5,000-$8,000',
+        'Content creation (blog articles, service descriptions): $2,000-$3,000',
+        'Advanced features (maps, forms, galleries): $2,000-$4,000',
+        'SEO optimization and schema implementation: $1,500-$2,500',
+        'Multi-language integration: $1,000-$2,000',
+        'Analytics setup and documentation: $500-$1,000'
+    ]
 
-p = doc.add_paragraph()
-p.add_run('What We Built: ').bold = True
-p.add_run('Email capture form with validation and success confirmation, enabling ongoing communication with prospects and customers.\n\n')
+    for item in items:
+        p = doc.add_paragraph(item, style='List Bullet')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Email marketing delivers $42 return for every $1 spent. Building an email list creates a owned marketing channel independent of advertising platforms. Regular newsletters keep you top-of-mind for future projects and referrals.\n\n')
+    doc.add_paragraph()
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Email list building supports long-term customer relationship management. It enables remarketing to engaged audiences and provides a direct communication channel.')
+    doc.add_heading('Enterprise-Level Comparison: $100,000+', 2)
+    p = doc.add_paragraph()
+    p.add_run('For context on what enterprise-level web development costs, consider ')
+    add_hyperlink(p, 'https://liquiddeath.com', 'LiquidDeath.com')
+    p.add_run('. This beverage company\'s website features:\n\n')
 
-# Technical Excellence
-doc.add_heading('Technical Excellence & Performance Optimization', 1)
+    items = [
+        'Custom 3D animations and interactive elements',
+        'Advanced e-commerce integration',
+        'Custom CMS and content management',
+        'Video production and motion graphics',
+        'Complex user account systems',
+        'Multi-region deployment and CDN optimization'
+    ]
 
-doc.add_heading('Core Web Vitals Optimization', 2)
-p = doc.add_paragraph()
-p.add_run('The entire website is built with Google\'s Core Web Vitals in mind—the performance metrics that directly impact search rankings:\n\n')
+    for item in items:
+        p = doc.add_paragraph(item, style='List Bullet')
 
-p = doc.add_paragraph()
-p.add_run('• Largest Contentful Paint (LCP): ').bold = True
-p.add_run('Optimized image loading and video compression ensure the hero section loads in under 2.5 seconds.\n')
+    doc.add_paragraph()
 
-p = doc.add_paragraph()
-p.add_run('• First Input Delay (FID): ').bold = True
-p.add_run('Minimal JavaScript and efficient code execution provide instant interactivity.\n')
+    p = doc.add_paragraph()
+    p.add_run('Sites at this level typically cost $100,000-$250,000 and require teams of designers, developers, and content creators working for months. While your site is appropriately scoped for a local service business, it incorporates many of the same premium features and professional standards found in enterprise websites.')
 
-p = doc.add_paragraph()
-p.add_run('• Cumulative Layout Shift (CLS): ').bold = True
-p.add_run('Proper image dimensions and reserved space prevent content jumping during load.\n\n')
+    doc.add_heading('Cascadia Managing Brands\' Commitment', 2)
+    p = doc.add_paragraph()
+    p.add_run('We are providing this exceptional website to Dependable Home Improvement at no charge. This represents our commitment to supporting quality businesses in our community and our confidence in building long-term partnerships. The value we\'re delivering—over $15,000 in professional web development—is our investment in your success.')
 
-doc.add_heading('Mobile-First Responsive Design', 2)
-p = doc.add_paragraph()
-p.add_run('With over 60% of web traffic coming from mobile devices, the entire site is built mobile-first. Every element adapts perfectly to smartphones, tablets, and desktops. Google\'s mobile-first indexing means your mobile site IS your search ranking, making this critical for SEO.')
+    # Ongoing Benefits
+    doc.add_heading('Ongoing Benefits & Long-Term Value', 1)
 
-doc.add_heading('WebP Image Format & Lazy Loading', 2)
-p = doc.add_paragraph()
-p.add_run('All images use modern WebP format, reducing file sizes by 30% compared to JPEG while maintaining quality. Lazy loading ensures images only download when needed, dramatically improving initial page load speed.')
+    doc.add_heading('Continuous SEO Improvement', 2)
+    p = doc.add_paragraph()
+    p.add_run('Unlike traditional advertising that stops working when you stop paying, SEO compounds over time. Every blog post, every review, every page we\'ve built will continue attracting organic traffic for years. The structured data and optimization we\'ve implemented positions you to dominate local search results.')
 
-doc.add_heading('Accessibility Compliance', 2)
-p = doc.add_paragraph()
-p.add_run('The site follows WCAG accessibility guidelines with proper heading hierarchy, alt text for all images, keyboard navigation support, and sufficient color contrast. Accessibility is both ethically important and a ranking factor for search engines.')
+    doc.add_heading('Scalable Foundation', 2)
+    p = doc.add_paragraph()
+    p.add_run('The website architecture supports easy expansion. Adding new services, locations, team members, or features requires minimal effort. The JSON-based testimonials system and blog structure allow you to update content without developer assistance.')
 
-# Value Proposition
-doc.add_heading('Investment Value & Market Comparison', 1)
+    doc.add_heading('Competitive Advantage', 2)
+    p = doc.add_paragraph()
+    p.add_run('Most home improvement contractors have basic, outdated websites or rely solely on directory listings. Your premium website immediately differentiates you as a professional, established business. When prospects compare you to competitors, your digital presence will be the deciding factor.')
 
-doc.add_heading('Professional Development Cost: $15,000+', 2)
-p = doc.add_paragraph()
-p.add_run('A website of this caliber, built by a professional agency, would typically cost between $15,000 and $25,000. This estimate includes:\n\n')
+    doc.add_heading('Lead Generation Engine', 2)
+    p = doc.add_paragraph()
+    p.add_run('Every feature is designed to convert visitors into leads: multiple contact forms, click-to-call buttons, WhatsApp integration, newsletter signups, and referral program. The multi-step contact form qualifies leads automatically, saving you time and focusing your efforts on serious prospects.')
 
-items = [
-    'Custom design and branding: $3,000-$5,000',
-    'Responsive development (20+ pages): $5,000-$8,000',
-    'Content creation (blog articles, service descriptions): $2,000-$3,000',
-    'Advanced features (maps, forms, galleries): $2,000-$4,000',
-    'SEO optimization and schema implementation: $1,500-$2,500',
-    'Multi-language integration: $1,000-$2,000',
-    'Analytics setup and documentation: $500-$1,000'
-]
+    # Next Steps
+    doc.add_heading('Next Steps & Recommendations', 1)
 
-for item in items:
-    p = doc.add_paragraph(item, style='List Bullet')
+    p = doc.add_paragraph()
+    p.add_run('To maximize the value of your new website, we recommend:\n\n')
 
-doc.add_paragraph()
+    p = doc.add_paragraph()
+    p.add_run('1. Configure Analytics: ').bold = True
+    p.add_run('Set up your Google Analytics 4 and Hotjar accounts using the provided documentation. This enables data-driven optimization.\n\n')
 
-doc.add_heading('Enterprise-Level Comparison: $100,000+', 2)
-p = doc.add_paragraph()
-p.add_run('For context on what enterprise-level web development costs, consider ')
-add_hyperlink(p, 'https://liquiddeath.com', 'LiquidDeath.com')
-p.add_run('. This beverage company\'s website features:\n\n')
+    p = doc.add_paragraph()
+    p.add_run('2. Update Team Photos: ').bold = True
+    p.add_run('Replace placeholder images with professional photos of Sergey, Boris, and your crew. Authentic photos build trust.\n\n')
 
-items = [
-    'Custom 3D animations and interactive elements',
-    'Advanced e-commerce integration',
-    'Custom CMS and content management',
-    'Video production and motion graphics',
-    'Complex user account systems',
-    'Multi-region deployment and CDN optimization'
-]
+    p = doc.add_paragraph()
+    p.add_run('3. Connect Social Media: ').bold = True
+    p.add_run('Provide your actual Facebook, Instagram, LinkedIn, and Yelp URLs to link from the website.\n\n')
 
-for item in items:
-    p = doc.add_paragraph(item, style='List Bullet')
+    p = doc.add_paragraph()
+    p.add_run('4. Regular Content Updates: ').bold = True
+    p.add_run('Add new testimonials as you receive them using the simple JSON system. Post new blog articles quarterly to maintain SEO momentum.\n\n')
 
-doc.add_paragraph()
+    p = doc.add_paragraph()
+    p.add_run('5. Monitor Performance: ').bold = True
+    p.add_run('Review analytics monthly to understand which pages drive the most leads and which marketing channels are most effective.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Sites at this level typically cost $100,000-$250,000 and require teams of designers, developers, and content creators working for months. While your site is appropriately scoped for a local service business, it incorporates many of the same premium features and professional standards found in enterprise websites.')
+    p = doc.add_paragraph()
+    p.add_run('6. Leverage for Marketing: ').bold = True
+    p.add_run('Include your website URL on all marketing materials, vehicle wraps, business cards, and email signatures. The professional site reinforces your brand across all touchpoints.')
 
-doc.add_heading('Cascadia Managing Brands\' Commitment', 2)
-p = doc.add_paragraph()
-p.add_run('We are providing this exceptional website to Dependable Home Improvement at no charge. This represents our commitment to supporting quality businesses in our community and our confidence in building long-term partnerships. The value we\'re delivering—over $15,000 in professional web development—is our investment in your success.')
+    # Conclusion
+    doc.add_heading('Conclusion', 1)
 
-# Ongoing Benefits
-doc.add_heading('Ongoing Benefits & Long-Term Value', 1)
+    p = doc.add_paragraph()
+    p.add_run('This website represents a complete digital transformation for Dependable Home Improvement. Every design choice, every feature, and every line of code serves a specific marketing or technical purpose. The result is a sophisticated, conversion-optimized platform that positions you as the premier home improvement service in Bergen County.\n\n')
 
-doc.add_heading('Continuous SEO Improvement', 2)
-p = doc.add_paragraph()
-p.add_run('Unlike traditional advertising that stops working when you stop paying, SEO compounds over time. Every blog post, every review, every page we\'ve built will continue attracting organic traffic for years. The structured data and optimization we\'ve implemented positions you to dominate local search results.')
+    p = doc.add_paragraph()
+    p.add_run('The $15,000+ value we\'re providing at no charge reflects our commitment to your success and our confidence in building a lasting partnership. We\'ve created not just a website, but a powerful marketing asset that will generate leads, build credibility, and drive business growth for years to come.\n\n')
 
-doc.add_heading('Scalable Foundation', 2)
-p = doc.add_paragraph()
-p.add_run('The website architecture supports easy expansion. Adding new services, locations, team members, or features requires minimal effort. The JSON-based testimonials system and blog structure allow you to update content without developer assistance.')
+    p = doc.add_paragraph()
+    p.add_run('Welcome to your new digital presence.')
 
-doc.add_heading('Competitive Advantage', 2)
-p = doc.add_paragraph()
-p.add_run('Most home improvement contractors have basic, outdated websites or rely solely on directory listings. Your premium website immediately differentiates you as a professional, established business. When prospects compare you to competitors, your digital presence will be the deciding factor.')
+    # Add footer with Cascadia branding
+    doc.add_paragraph()
+    doc.add_paragraph()
+    footer = doc.add_paragraph()
+    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    footer.add_run('Prepared by Cascadia Managing Brands').bold = True
+    footer.runs[0].font.size = Pt(12)
+    footer.runs[0].font.color.rgb = RGBColor(76, 153, 76)  # Green color
 
-doc.add_heading('Lead Generation Engine', 2)
-p = doc.add_paragraph()
-p.add_run('Every feature is designed to convert visitors into leads: multiple contact forms, click-to-call buttons, WhatsApp integration, newsletter signups, and referral program. The multi-step contact form qualifies leads automatically, saving you time and focusing your efforts on serious prospects.')
+    # Save document
+    doc.save(docx_file)
+    print("Document created successfully!")
 
-# Next Steps
-doc.add_heading('Next Steps & Recommendations', 1)
-
-p = doc.add_paragraph()
-p.add_run('To maximize the value of your new website, we recommend:\n\n')
-
-p = doc.add_paragraph()
-p.add_run('1. Configure Analytics: ').bold = True
-p.add_run('Set up your Google Analytics 4 and Hotjar accounts using the provided documentation. This enables data-driven optimization.\n\n')
-
-p = doc.add_paragraph()
-p.add_run('2. Update Team Photos: ').bold = True
-p.add_run('Replace placeholder images with professional photos of Sergey, Boris, and your crew. Authentic photos build trust.\n\n')
-
-p = doc.add_paragraph()
-p.add_run('3. Connect Social Media: ').bold = True
-p.add_run('Provide your actual Facebook, Instagram, LinkedIn, and Yelp URLs to link from the website.\n\n')
-
-p = doc.add_paragraph()
-p.add_run('4. Regular Content Updates: ').bold = True
-p.add_run('Add new testimonials as you receive them using the simple JSON system. Post new blog articles quarterly to maintain SEO momentum.\n\n')
-
-p = doc.add_paragraph()
-p.add_run('5. Monitor Performance: ').bold = True
-p.add_run('Review analytics monthly to understand which pages drive the most leads and which marketing channels are most effective.\n\n')
-
-p = doc.add_paragraph()
-p.add_run('6. Leverage for Marketing: ').bold = True
-p.add_run('Include your website URL on all marketing materials, vehicle wraps, business cards, and email signatures. The professional site reinforces your brand across all touchpoints.')
-
-# Conclusion
-doc.add_heading('Conclusion', 1)
-
-p = doc.add_paragraph()
-p.add_run('This website represents a complete digital transformation for Dependable Home Improvement. Every design choice, every feature, and every line of code serves a specific marketing or technical purpose. The result is a sophisticated, conversion-optimized platform that positions you as the premier home improvement service in Bergen County.\n\n')
-
-p = doc.add_paragraph()
-p.add_run('The $15,000+ value we\'re providing at no charge reflects our commitment to your success and our confidence in building a lasting partnership. We\'ve created not just a website, but a powerful marketing asset that will generate leads, build credibility, and drive business growth for years to come.\n\n')
-
-p = doc.add_paragraph()
-p.add_run('Welcome to your new digital presence.')
-
-# Add footer with Cascadia branding
-doc.add_paragraph()
-doc.add_paragraph()
-footer = doc.add_paragraph()
-footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
-footer.add_run('Prepared by Cascadia Managing Brands').bold = True
-footer.runs[0].font.size = Pt(12)
-footer.runs[0].font.color.rgb = RGBColor(76, 153, 76)  # Green color
 
-# Save document
-doc.save('Dependable_Home_Improvement_Website_Overview.docx')
-print("Document created successfully!")
+if __name__ == "__main__":
+    build()
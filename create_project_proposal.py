@@ -9,6 +9,9 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+import image_embed
+from asset_manifest import asset_path
+
 def add_hyperlink(paragraph, url, text):
     """Add a hyperlink to a paragraph"""
     part = paragraph.part
@@ -37,597 +40,604 @@ def add_hyperlink(paragraph, url, text):
     paragraph._p.append(hyperlink)
     return hyperlink
 
-# Create document
-doc = Document()
+DOCX_FILE = 'Dependable_Home_Improvement_Website_Proposal.docx'
+
 
-# Set default font
-style = doc.styles['Normal']
-font = style.font
-font.name = 'Calibri'
-font.size = Pt(11)
+def build(docx_file=DOCX_FILE):
+    # Create document
+    doc = Document()
 
-# Add Cascadia logo
-try:
-    logo = doc.add_picture('cascadia-logo.jpg', width=Inches(3.5))
+    # Set default font
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = 'Calibri'
+    font.size = Pt(11)
+
+    # Add Cascadia logo
+    # python-docx cannot read cascadia-logo.jpg as stored (CMYK, no JFIF header)
+    logo, route = image_embed.docx_picture(doc, asset_path('cascadia_logo'), width=Inches(3.5))
+    print(f"✓ Cascadia logo embedded ({route})")
     last_paragraph = doc.paragraphs[-1]
     last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
     doc.add_paragraph()  # Add spacing
-except:
-    pass
 
-# Title
-title = doc.add_heading('DEPENDABLE HOME IMPROVEMENT', 0)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-title.runs[0].font.color.rgb = RGBColor(101, 67, 33)  # Brown color
+    # Title
+    title = doc.add_heading('DEPENDABLE HOME IMPROVEMENT', 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title.runs[0].font.color.rgb = RGBColor(101, 67, 33)  # Brown color
+
+    subtitle = doc.add_heading('Premium Website Redesign Proposal', level=2)
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle.runs[0].font.color.rgb = RGBColor(184, 134, 11)  # Gold color
+
+    doc.add_paragraph()
+
+    # Executive Summary
+    doc.add_heading('Executive Summary', 1)
+    p = doc.add_paragraph()
+    p.add_run('Cascadia Managing Brands is excited to propose a comprehensive transformation of Dependable Home Improvement\'s digital presence. This document outlines our vision for a website redesign that will elevate your online presence from a basic informational site to a sophisticated, conversion-optimized digital marketing platform valued at over $15,000 in professional development services.\n\n')
+
+    p = doc.add_paragraph()
+    p.add_run('This premium website redesign will position Dependable Home Improvement as the premier home improvement service in Bergen County, New Jersey, with advanced features typically found on enterprise-level websites costing upwards of $100,000. For reference, ')
+    add_hyperlink(p, 'https://liquiddeath.com', 'LiquidDeath.com')
+    p.add_run(' represents the caliber of design and functionality that commands six-figure budgets in the industry.\n\n')
+
+    p = doc.add_paragraph()
+    p.add_run('We will be providing this exceptional website to you at no charge as part of our commitment to supporting quality businesses in our community.')
 
-subtitle = doc.add_heading('Premium Website Redesign Proposal', level=2)
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-subtitle.runs[0].font.color.rgb = RGBColor(184, 134, 11)  # Gold color
+    # Color Scheme Section
+    doc.add_heading('Design Philosophy & Color Scheme', 1)
 
-doc.add_paragraph()
+    doc.add_heading('Brown & Gold Palette: The Psychology of Premium', 2)
+    p = doc.add_paragraph()
+    p.add_run('We will implement a sophisticated brown and gold color scheme, strategically selected for multiple marketing and psychological reasons:\n\n')
 
-# Executive Summary
-doc.add_heading('Executive Summary', 1)
-p = doc.add_paragraph()
-p.add_run('Cascadia Managing Brands is excited to propose a comprehensive transformation of Dependable Home Improvement\'s digital presence. This document outlines our vision for a website redesign that will elevate your online presence from a basic informational site to a sophisticated, conversion-optimized digital marketing platform valued at over $15,000 in professional development services.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Rationale: ').bold = True
+    p.add_run('Brown conveys reliability, earthiness, and craftsmanship—essential qualities for a home improvement business. It psychologically connects to wood, natural materials, and the foundation of quality construction. Gold represents premium service, excellence, and value. This combination will immediately position Dependable Home Improvement as a high-end, trustworthy service provider rather than a budget contractor.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('This premium website redesign will position Dependable Home Improvement as the premier home improvement service in Bergen County, New Jersey, with advanced features typically found on enterprise-level websites costing upwards of $100,000. For reference, ')
-add_hyperlink(p, 'https://liquiddeath.com', 'LiquidDeath.com')
-p.add_run(' represents the caliber of design and functionality that commands six-figure budgets in the industry.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Rationale: ').bold = True
+    p.add_run('The high contrast between brown backgrounds and gold accents will ensure excellent readability across all devices, which directly impacts user engagement metrics—a critical SEO ranking factor. The warm, professional palette will differentiate your site from competitors who typically use blue or green schemes, making your brand more memorable and reducing bounce rates.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('We will be providing this exceptional website to you at no charge as part of our commitment to supporting quality businesses in our community.')
+    p = doc.add_paragraph()
+    p.add_run('We will deliberately avoid gradient fades in favor of solid, sophisticated backgrounds to maintain a clean, modern aesthetic that loads faster and appears more professional on all screen sizes.')
 
-# Color Scheme Section
-doc.add_heading('Design Philosophy & Color Scheme', 1)
+    # Comprehensive Features Section
+    doc.add_heading('Comprehensive Feature Plan', 1)
 
-doc.add_heading('Brown & Gold Palette: The Psychology of Premium', 2)
-p = doc.add_paragraph()
-p.add_run('We will implement a sophisticated brown and gold color scheme, strategically selected for multiple marketing and psychological reasons:\n\n')
+    # Hero Section
+    doc.add_heading('1. Dynamic Hero Section with Video Background', 2)
 
-p = doc.add_paragraph()
-p.add_run('Marketing Rationale: ').bold = True
-p.add_run('Brown conveys reliability, earthiness, and craftsmanship—essential qualities for a home improvement business. It psychologically connects to wood, natural materials, and the foundation of quality construction. Gold represents premium service, excellence, and value. This combination will immediately position Dependable Home Improvement as a high-end, trustworthy service provider rather than a budget contractor.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('A full-screen hero section featuring professional carpentry work video background, your actual company logo (optimized at 115px for maximum visibility), compelling headline "Crafting Excellence, Building Trust," and prominent call-to-action buttons.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Rationale: ').bold = True
-p.add_run('The high contrast between brown backgrounds and gold accents will ensure excellent readability across all devices, which directly impacts user engagement metrics—a critical SEO ranking factor. The warm, professional palette will differentiate your site from competitors who typically use blue or green schemes, making your brand more memorable and reducing bounce rates.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Video backgrounds increase engagement by 80% compared to static images. The moving imagery will immediately capture attention, demonstrate your craftsmanship in action, and create an emotional connection. The tagline will position you as both skilled craftsmen and trustworthy partners—addressing the two primary concerns of home improvement customers.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('We will deliberately avoid gradient fades in favor of solid, sophisticated backgrounds to maintain a clean, modern aesthetic that loads faster and appears more professional on all screen sizes.')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Video content increases time-on-site, a crucial ranking signal for Google. The hero section will be optimized for Core Web Vitals with lazy loading and WebP format compression, ensuring fast load times despite rich media. The prominent logo and company name will provide immediate brand recognition and support local search optimization.')
 
-# Comprehensive Features Section
-doc.add_heading('Comprehensive Feature Plan', 1)
+    # Animated Statistics
+    doc.add_heading('2. Animated Statistics Counter', 2)
 
-# Hero Section
-doc.add_heading('1. Dynamic Hero Section with Video Background', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Real-time counting animations displaying 20+ years of experience, 1,500+ completed projects, 500+ satisfied clients, and 100% satisfaction guarantee.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('A full-screen hero section featuring professional carpentry work video background, your actual company logo (optimized at 115px for maximum visibility), compelling headline "Crafting Excellence, Building Trust," and prominent call-to-action buttons.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Animated numbers draw the eye and make statistics more impactful. These specific metrics will build immediate credibility and overcome the primary objection in home improvement: "Can I trust this contractor?" The 100% satisfaction guarantee reduces perceived risk.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Video backgrounds increase engagement by 80% compared to static images. The moving imagery will immediately capture attention, demonstrate your craftsmanship in action, and create an emotional connection. The tagline will position you as both skilled craftsmen and trustworthy partners—addressing the two primary concerns of home improvement customers.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Animation increases user interaction, improving engagement metrics. The statistics will also be coded in structured data (Schema.org) for search engines to display in rich snippets, potentially increasing click-through rates from search results by 30%.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Video content increases time-on-site, a crucial ranking signal for Google. The hero section will be optimized for Core Web Vitals with lazy loading and WebP format compression, ensuring fast load times despite rich media. The prominent logo and company name will provide immediate brand recognition and support local search optimization.')
+    # Navigation
+    doc.add_heading('3. Intelligent Sticky Navigation with Multi-Language Support', 2)
 
-# Animated Statistics
-doc.add_heading('2. Animated Statistics Counter', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Fixed navigation bar that transitions from transparent to white on scroll, featuring left-aligned logo (20% larger than standard), company name on maximum 2 lines, comprehensive menu links, and language toggle for English, Russian, and Spanish (Latin America).\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Real-time counting animations displaying 20+ years of experience, 1,500+ completed projects, 500+ satisfied clients, and 100% satisfaction guarantee.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Sticky navigation keeps conversion opportunities (contact buttons, phone number) always accessible, increasing lead generation by up to 40%. Multi-language support will dramatically expand your addressable market in Bergen County\'s diverse population, particularly the significant Russian and Spanish-speaking communities.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Animated numbers draw the eye and make statistics more impactful. These specific metrics will build immediate credibility and overcome the primary objection in home improvement: "Can I trust this contractor?" The 100% satisfaction guarantee reduces perceived risk.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('The smooth scroll transition will provide excellent user experience without jarring jumps. Language options will be implemented with proper hreflang tags for international SEO. The left-aligned, prominent logo ensures brand visibility and supports mobile usability guidelines.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Animation increases user interaction, improving engagement metrics. The statistics will also be coded in structured data (Schema.org) for search engines to display in rich snippets, potentially increasing click-through rates from search results by 30%.')
+    # Promotional Banner
+    doc.add_heading('4. Seasonal Promotions Banner', 2)
 
-# Navigation
-doc.add_heading('3. Intelligent Sticky Navigation with Multi-Language Support', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Dismissible banner at the top of the page highlighting current seasonal offers (example: Winter Special - 15% off interior painting).\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Fixed navigation bar that transitions from transparent to white on scroll, featuring left-aligned logo (20% larger than standard), company name on maximum 2 lines, comprehensive menu links, and language toggle for English, Russian, and Spanish (Latin America).\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Urgency-driven promotions increase conversion rates by creating a compelling reason to act now rather than later. Seasonal offers align with natural buying cycles and help fill slower periods.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Sticky navigation keeps conversion opportunities (contact buttons, phone number) always accessible, increasing lead generation by up to 40%. Multi-language support will dramatically expand your addressable market in Bergen County\'s diverse population, particularly the significant Russian and Spanish-speaking communities.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('The dismissible feature respects user experience while still capturing attention. Banner content can be easily updated to match current campaigns without developer intervention.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('The smooth scroll transition will provide excellent user experience without jarring jumps. Language options will be implemented with proper hreflang tags for international SEO. The left-aligned, prominent logo ensures brand visibility and supports mobile usability guidelines.')
+    # Before/After Gallery
+    doc.add_heading('5. Professional Before/After Project Gallery', 2)
 
-# Promotional Banner
-doc.add_heading('4. Seasonal Promotions Banner', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Side-by-side before and after photo gallery showcasing your completed projects including deck refinishing, reconstruction, stair replacement, patio door installation, cellar door installation, and basement finishing. We will use actual projects from your portfolio.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Dismissible banner at the top of the page highlighting current seasonal offers (example: Winter Special - 15% off interior painting).\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Before/after galleries are the single most persuasive element for home improvement websites. They provide concrete proof of capability, help prospects visualize their own projects, and build trust through transparency. Using real project photos (not stock images) establishes authenticity.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Urgency-driven promotions increase conversion rates by creating a compelling reason to act now rather than later. Seasonal offers align with natural buying cycles and help fill slower periods.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Image galleries increase time-on-page and reduce bounce rates. Each image will include descriptive alt text for accessibility and SEO. The side-by-side layout (not sliders) ensures all images are immediately visible to search engine crawlers, improving image search rankings. WebP format will reduce file size by 30% while maintaining quality.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('The dismissible feature respects user experience while still capturing attention. Banner content can be easily updated to match current campaigns without developer intervention.')
+    # Interactive Service Area Map
+    doc.add_heading('6. Interactive Google Maps Service Area Visualization', 2)
 
-# Before/After Gallery
-doc.add_heading('5. Professional Before/After Project Gallery', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Fully interactive Google Maps integration showing your 25-mile service radius around Bergen County, with clickable markers, service areas list, and integrated contact information.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Side-by-side before and after photo gallery showcasing your completed projects including deck refinishing, reconstruction, stair replacement, patio door installation, cellar door installation, and basement finishing. We will use actual projects from your portfolio.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('The visual service area map will immediately answer the question "Do you serve my area?" reducing friction in the customer journey. It positions you as an established local business rather than a fly-by-night contractor.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Before/after galleries are the single most persuasive element for home improvement websites. They provide concrete proof of capability, help prospects visualize their own projects, and build trust through transparency. Using real project photos (not stock images) establishes authenticity.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Google Maps integration provides powerful local SEO signals. The embedded map will connect to your Google Business Profile, strengthening local search rankings. Geographic data helps Google understand your service area for "near me" searches, which account for 46% of all Google searches.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Image galleries increase time-on-page and reduce bounce rates. Each image will include descriptive alt text for accessibility and SEO. The side-by-side layout (not sliders) ensures all images are immediately visible to search engine crawlers, improving image search rankings. WebP format will reduce file size by 30% while maintaining quality.')
+    # Multi-Step Contact Form
+    doc.add_heading('7. Advanced 4-Step Multi-Step Contact Form', 2)
 
-# Interactive Service Area Map
-doc.add_heading('6. Interactive Google Maps Service Area Visualization', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Progressive contact form with visual progress indicator collecting: (1) Contact information, (2) Project details and service type, (3) Timeline and budget range, (4) Additional requirements and preferences. Will include real-time validation and success confirmation.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Fully interactive Google Maps integration showing your 25-mile service radius around Bergen County, with clickable markers, service areas list, and integrated contact information.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Multi-step forms increase completion rates by 300% compared to long single-page forms. The progressive disclosure reduces psychological burden while gathering detailed qualification information. This will allow you to prioritize high-value leads and prepare more accurate estimates before the first call.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('The visual service area map will immediately answer the question "Do you serve my area?" reducing friction in the customer journey. It positions you as an established local business rather than a fly-by-night contractor.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Form interactions count as engagement signals for SEO. The step-by-step approach reduces form abandonment, improving conversion rates. Client-side validation provides immediate feedback, improving user experience and reducing server load.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Google Maps integration provides powerful local SEO signals. The embedded map will connect to your Google Business Profile, strengthening local search rankings. Geographic data helps Google understand your service area for "near me" searches, which account for 46% of all Google searches.')
+    # Location Pages
+    doc.add_heading('8. Location-Specific Landing Pages', 2)
 
-# Multi-Step Contact Form
-doc.add_heading('7. Advanced 4-Step Multi-Step Contact Form', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Eight dedicated pages for major Bergen County towns: Hackensack, Teaneck, Fort Lee, Fair Lawn, Bergenfield, Paramus, Ridgewood, and Englewood. Each page will include localized content, service information, and area-specific testimonials.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Progressive contact form with visual progress indicator collecting: (1) Contact information, (2) Project details and service type, (3) Timeline and budget range, (4) Additional requirements and preferences. Will include real-time validation and success confirmation.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Location pages demonstrate deep local knowledge and commitment to specific communities. They allow you to address unique characteristics of each town and build stronger connections with local residents.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Multi-step forms increase completion rates by 300% compared to long single-page forms. The progressive disclosure reduces psychological burden while gathering detailed qualification information. This will allow you to prioritize high-value leads and prepare more accurate estimates before the first call.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('This is advanced local SEO strategy. Each location page will target "[service] in [city]" keywords, dramatically increasing your visibility for high-intent local searches. These pages can rank independently, multiplying your search presence. Location pages are essential for appearing in Google\'s Local Pack (the map results at the top of search).')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Form interactions count as engagement signals for SEO. The step-by-step approach reduces form abandonment, improving conversion rates. Client-side validation provides immediate feedback, improving user experience and reducing server load.')
+    # Dynamic Testimonials
+    doc.add_heading('9. Dynamic Testimonials Management System', 2)
 
-# Location Pages
-doc.add_heading('8. Location-Specific Landing Pages', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('JSON-based testimonials system allowing easy updates without code changes. Will feature reviews with verified badges, star ratings, dates, and service types.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Eight dedicated pages for major Bergen County towns: Hackensack, Teaneck, Fort Lee, Fair Lawn, Bergenfield, Paramus, Ridgewood, and Englewood. Each page will include localized content, service information, and area-specific testimonials.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Customer testimonials are the most trusted form of marketing content, with 92% of consumers reading reviews before making a decision. The verified badges and specific details (names, locations, dates) build credibility. Featuring diverse service types demonstrates comprehensive capabilities.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Location pages demonstrate deep local knowledge and commitment to specific communities. They allow you to address unique characteristics of each town and build stronger connections with local residents.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Reviews will be implemented with Schema.org Review markup, enabling rich snippets in search results (star ratings appear directly in Google). The dynamic system makes it effortless to keep content fresh, which search engines reward. Regular review updates signal an active, thriving business.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('This is advanced local SEO strategy. Each location page will target "[service] in [city]" keywords, dramatically increasing your visibility for high-intent local searches. These pages can rank independently, multiplying your search presence. Location pages are essential for appearing in Google\'s Local Pack (the map results at the top of search).')
+    # Review Platform Badges
+    doc.add_heading('10. Third-Party Review Platform Integration', 2)
 
-# Dynamic Testimonials
-doc.add_heading('9. Dynamic Testimonials Management System', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Prominent badges for Angi (formerly Angie\'s List), Google Reviews, and Better Business Bureau with A+ rating. Review widgets displaying actual customer feedback from each platform.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('JSON-based testimonials system allowing easy updates without code changes. Will feature reviews with verified badges, star ratings, dates, and service types.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Third-party validation is exponentially more powerful than self-promotion. BBB accreditation and high ratings on Angi and Google provide independent verification of quality. The A+ BBB rating specifically addresses trust concerns that prevent conversions.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Customer testimonials are the most trusted form of marketing content, with 92% of consumers reading reviews before making a decision. The verified badges and specific details (names, locations, dates) build credibility. Featuring diverse service types demonstrates comprehensive capabilities.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Links to review platforms create valuable backlinks and citation signals for local SEO. The widgets pull in fresh content automatically, keeping your site dynamic. Review platform integration increases your digital footprint across multiple authoritative domains.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Reviews will be implemented with Schema.org Review markup, enabling rich snippets in search results (star ratings appear directly in Google). The dynamic system makes it effortless to keep content fresh, which search engines reward. Regular review updates signal an active, thriving business.')
+    # Blog Section
+    doc.add_heading('11. Content Marketing Blog with Category Filtering', 2)
 
-# Review Platform Badges
-doc.add_heading('10. Third-Party Review Platform Integration', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Professional blog featuring comprehensive articles on topics like Winter Home Maintenance, Kitchen Remodeling Trends, Choosing the Right Contractor, Bathroom Renovation ROI, and Spring Exterior Care. Each article will include featured images, category tags, author information, and estimated read time.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Prominent badges for Angi (formerly Angie\'s List), Google Reviews, and Better Business Bureau with A+ rating. Review widgets displaying actual customer feedback from each platform.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Educational content positions you as an expert advisor, not just a service provider. Blog articles address common questions and concerns, building trust before prospects even contact you. Content marketing generates 3x more leads than traditional advertising at 62% lower cost.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Third-party validation is exponentially more powerful than self-promotion. BBB accreditation and high ratings on Angi and Google provide independent verification of quality. The A+ BBB rating specifically addresses trust concerns that prevent conversions.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Blogs are SEO powerhouses. Each article will target specific long-tail keywords that prospects search for ("how to choose a contractor," "bathroom renovation ROI"). Regular content updates signal site freshness to search engines. Blog posts create internal linking opportunities and increase total indexed pages, expanding your search visibility. Articles will be optimized with Schema.org BlogPosting markup for enhanced search appearance.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Links to review platforms create valuable backlinks and citation signals for local SEO. The widgets pull in fresh content automatically, keeping your site dynamic. Review platform integration increases your digital footprint across multiple authoritative domains.')
+    # FAQ Page
+    doc.add_heading('12. Comprehensive FAQ Page with Schema Markup', 2)
 
-# Blog Section
-doc.add_heading('11. Content Marketing Blog with Category Filtering', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Frequently asked questions organized into categories: Getting Started, Services, Timeline & Scheduling, Licensing & Insurance, Pricing & Payment, Project Management, and Communication. Expandable accordion interface for easy navigation.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Professional blog featuring comprehensive articles on topics like Winter Home Maintenance, Kitchen Remodeling Trends, Choosing the Right Contractor, Bathroom Renovation ROI, and Spring Exterior Care. Each article will include featured images, category tags, author information, and estimated read time.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('FAQs will preemptively address objections and concerns, reducing friction in the sales process. They qualify leads by setting clear expectations about process, pricing structure, and requirements. Comprehensive FAQs reduce repetitive customer service inquiries.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Educational content positions you as an expert advisor, not just a service provider. Blog articles address common questions and concerns, building trust before prospects even contact you. Content marketing generates 3x more leads than traditional advertising at 62% lower cost.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('FAQ pages target question-based searches ("Do I need permits for...?", "How long does...?"). Implemented with FAQPage schema markup, your answers can appear directly in Google search results as rich snippets, dramatically increasing visibility and click-through rates. Voice search optimization is built-in, as virtual assistants often pull from FAQ structured data.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Blogs are SEO powerhouses. Each article will target specific long-tail keywords that prospects search for ("how to choose a contractor," "bathroom renovation ROI"). Regular content updates signal site freshness to search engines. Blog posts create internal linking opportunities and increase total indexed pages, expanding your search visibility. Articles will be optimized with Schema.org BlogPosting markup for enhanced search appearance.')
+    # Services Page
+    doc.add_heading('13. Detailed Services Showcase', 2)
 
-# FAQ Page
-doc.add_heading('12. Comprehensive FAQ Page with Schema Markup', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Dedicated services page highlighting four core service categories: General Handyman Services, Professional Carpentry, Interior & Exterior Painting, and Complete Home Renovations. Each service will include detailed feature lists, benefits, and visual icons.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Frequently asked questions organized into categories: Getting Started, Services, Timeline & Scheduling, Licensing & Insurance, Pricing & Payment, Project Management, and Communication. Expandable accordion interface for easy navigation.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Clear service categorization helps prospects quickly identify if you can solve their specific problem. Detailed descriptions educate customers about scope and quality, setting appropriate expectations. The comprehensive service list positions you as a full-service provider, increasing average project value.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('FAQs will preemptively address objections and concerns, reducing friction in the sales process. They qualify leads by setting clear expectations about process, pricing structure, and requirements. Comprehensive FAQs reduce repetitive customer service inquiries.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Each service category will be optimized for specific keyword clusters. The page structure will use Schema.org Service markup, enabling rich results in search. Internal linking from services to related blog posts and case studies creates strong topical authority signals.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('FAQ pages target question-based searches ("Do I need permits for...?", "How long does...?"). Implemented with FAQPage schema markup, your answers can appear directly in Google search results as rich snippets, dramatically increasing visibility and click-through rates. Voice search optimization is built-in, as virtual assistants often pull from FAQ structured data.')
+    # Team Page
+    doc.add_heading('14. Team & Company Culture Showcase', 2)
 
-# Services Page
-doc.add_heading('13. Detailed Services Showcase', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Dedicated team page featuring bios for Sergey (Owner/Master Craftsman), Boris (Lead Carpenter), and crew members. Will include office and workshop photos demonstrating your professional operation.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Dedicated services page highlighting four core service categories: General Handyman Services, Professional Carpentry, Interior & Exterior Painting, and Complete Home Renovations. Each service will include detailed feature lists, benefits, and visual icons.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Putting faces to the business humanizes your brand and builds trust. Customers want to know who will be entering their homes. Professional bios establish expertise and experience. Workshop photos demonstrate you\'re an established, legitimate business with proper facilities.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Clear service categorization helps prospects quickly identify if you can solve their specific problem. Detailed descriptions educate customers about scope and quality, setting appropriate expectations. The comprehensive service list positions you as a full-service provider, increasing average project value.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Team pages increase site depth and provide additional indexable content. Personal bios can rank for branded searches and establish individual authority. The page supports E-E-A-T (Experience, Expertise, Authoritativeness, Trustworthiness) signals that Google uses for ranking.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Each service category will be optimized for specific keyword clusters. The page structure will use Schema.org Service markup, enabling rich results in search. Internal linking from services to related blog posts and case studies creates strong topical authority signals.')
+    # Social Media Integration
+    doc.add_heading('15. Social Media Integration & WhatsApp Communication', 2)
 
-# Team Page
-doc.add_heading('14. Team & Company Culture Showcase', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Integrated links to Facebook, Instagram, LinkedIn, and Yelp profiles throughout the site. Floating WhatsApp button for instant messaging capability.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Dedicated team page featuring bios for Sergey (Owner/Master Craftsman), Boris (Lead Carpenter), and crew members. Will include office and workshop photos demonstrating your professional operation.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Social proof extends beyond your website. Links to active social profiles allow prospects to see real-time updates, additional photos, and community engagement. WhatsApp provides a low-friction communication channel preferred by many customers, especially in immigrant communities. Instant messaging captures leads who might not fill out forms or make phone calls.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Putting faces to the business humanizes your brand and builds trust. Customers want to know who will be entering their homes. Professional bios establish expertise and experience. Workshop photos demonstrate you\'re an established, legitimate business with proper facilities.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Social signals contribute to overall online authority. Cross-platform presence strengthens brand consistency. WhatsApp integration improves conversion rates by offering multiple contact methods, reducing bounce rates from visitors who prefer messaging.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Team pages increase site depth and provide additional indexable content. Personal bios can rank for branded searches and establish individual authority. The page supports E-E-A-T (Experience, Expertise, Authoritativeness, Trustworthiness) signals that Google uses for ranking.')
+    # Case Studies
+    doc.add_heading('16. Detailed Case Studies & Project Transformations', 2)
 
-# Social Media Integration
-doc.add_heading('15. Social Media Integration & WhatsApp Communication', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('In-depth case studies documenting complete project transformations with challenges, solutions, and results. Will include detailed project narratives, timelines, and outcome descriptions.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Integrated links to Facebook, Instagram, LinkedIn, and Yelp profiles throughout the site. Floating WhatsApp button for instant messaging capability.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Case studies are powerful sales tools that demonstrate problem-solving ability and results. They help prospects envision their own projects and understand your process. Detailed narratives build confidence in your expertise and thoroughness.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Social proof extends beyond your website. Links to active social profiles allow prospects to see real-time updates, additional photos, and community engagement. WhatsApp provides a low-friction communication channel preferred by many customers, especially in immigrant communities. Instant messaging captures leads who might not fill out forms or make phone calls.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Long-form case studies provide substantial content depth, targeting multiple related keywords. They increase average time-on-site and reduce bounce rates. Case studies create natural opportunities for internal linking to related services and blog posts.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Social signals contribute to overall online authority. Cross-platform presence strengthens brand consistency. WhatsApp integration improves conversion rates by offering multiple contact methods, reducing bounce rates from visitors who prefer messaging.')
+    # Video Resources
+    doc.add_heading('17. Video How-To Guides Library', 2)
 
-# Case Studies
-doc.add_heading('16. Detailed Case Studies & Project Transformations', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Collection of educational video guides covering home maintenance and improvement topics, positioning you as a helpful resource beyond just service provider.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('In-depth case studies documenting complete project transformations with challenges, solutions, and results. Will include detailed project narratives, timelines, and outcome descriptions.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Educational videos build goodwill and establish expertise. They create touchpoints with prospects who aren\'t ready to hire yet, keeping you top-of-mind. Video content is highly shareable, expanding organic reach.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Case studies are powerful sales tools that demonstrate problem-solving ability and results. They help prospects envision their own projects and understand your process. Detailed narratives build confidence in your expertise and thoroughness.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Video content dramatically increases engagement metrics. Video pages have 50x better chance of ranking on first page of Google than text-only pages. Video schema markup enables video rich snippets in search results.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Long-form case studies provide substantial content depth, targeting multiple related keywords. They increase average time-on-site and reduce bounce rates. Case studies create natural opportunities for internal linking to related services and blog posts.')
+    # Downloadable Resources
+    doc.add_heading('18. Downloadable PDF Resources', 2)
 
-# Video Resources
-doc.add_heading('17. Video How-To Guides Library', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Professional PDF guides and checklists available for download, providing value to visitors and establishing authority.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Collection of educational video guides covering home maintenance and improvement topics, positioning you as a helpful resource beyond just service provider.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Downloadable resources serve as lead magnets, capturing contact information in exchange for value. They extend your brand beyond the website and keep you visible during the consideration phase.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Educational videos build goodwill and establish expertise. They create touchpoints with prospects who aren\'t ready to hire yet, keeping you top-of-mind. Video content is highly shareable, expanding organic reach.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('PDF resources create additional indexed content and target document search results. They provide backlink opportunities when shared and referenced by others.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Video content dramatically increases engagement metrics. Video pages have 50x better chance of ranking on first page of Google than text-only pages. Video schema markup enables video rich snippets in search results.')
+    # Referral Program
+    doc.add_heading('19. Customer Referral Program', 2)
 
-# Downloadable Resources
-doc.add_heading('18. Downloadable PDF Resources', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Structured referral program with clear incentives and easy participation process, encouraging word-of-mouth marketing.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Professional PDF guides and checklists available for download, providing value to visitors and establishing authority.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Referral programs systematize word-of-mouth, the most effective marketing channel. Incentivized referrals reduce customer acquisition costs while maintaining high-quality leads. Referred customers have 37% higher retention rates.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Downloadable resources serve as lead magnets, capturing contact information in exchange for value. They extend your brand beyond the website and keep you visible during the consideration phase.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Referral program pages target branded searches and demonstrate business legitimacy. They create shareable content and can generate social media engagement.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('PDF resources create additional indexed content and target document search results. They provide backlink opportunities when shared and referenced by others.')
+    # Analytics
+    doc.add_heading('20. Advanced Analytics & User Behavior Tracking', 2)
 
-# Referral Program
-doc.add_heading('19. Customer Referral Program', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Integrated Google Analytics 4 and Hotjar heatmap tracking with comprehensive setup documentation. Complete visitor tracking, conversion monitoring, and user behavior analysis capabilities.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Structured referral program with clear incentives and easy participation process, encouraging word-of-mouth marketing.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Data-driven decision making is essential for optimization. Analytics will reveal which marketing channels drive the most valuable traffic, which pages convert best, and where visitors drop off. Hotjar heatmaps will show exactly how users interact with your site, enabling continuous improvement.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Referral programs systematize word-of-mouth, the most effective marketing channel. Incentivized referrals reduce customer acquisition costs while maintaining high-quality leads. Referred customers have 37% higher retention rates.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Analytics data informs SEO strategy by revealing high-performing content and optimization opportunities. Behavior metrics help identify technical issues affecting user experience and search rankings.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Referral program pages target branded searches and demonstrate business legitimacy. They create shareable content and can generate social media engagement.')
+    # Schema Markup
+    doc.add_heading('21. Comprehensive Schema.org Structured Data', 2)
 
-# Analytics
-doc.add_heading('20. Advanced Analytics & User Behavior Tracking', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Complete structured data implementation including LocalBusiness schema with coordinates and service areas, Service schemas for all offerings, FAQPage schema, BlogPosting schema, and Review schema.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Integrated Google Analytics 4 and Hotjar heatmap tracking with comprehensive setup documentation. Complete visitor tracking, conversion monitoring, and user behavior analysis capabilities.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Structured data enables rich search results that stand out visually, increasing click-through rates by up to 30%. Star ratings, business hours, and service information will appear directly in search results.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Data-driven decision making is essential for optimization. Analytics will reveal which marketing channels drive the most valuable traffic, which pages convert best, and where visitors drop off. Hotjar heatmaps will show exactly how users interact with your site, enabling continuous improvement.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Schema markup is the language search engines use to understand your content. It\'s essential for appearing in rich snippets, knowledge panels, and voice search results. Proper structured data implementation gives you a significant competitive advantage, as most small business websites lack it.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Analytics data informs SEO strategy by revealing high-performing content and optimization opportunities. Behavior metrics help identify technical issues affecting user experience and search rankings.')
+    # Legal Pages
+    doc.add_heading('22. Privacy Policy & Terms of Service', 2)
 
-# Schema Markup
-doc.add_heading('21. Comprehensive Schema.org Structured Data', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Comprehensive legal pages covering privacy practices, data collection, cookie usage, and terms of service.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Complete structured data implementation including LocalBusiness schema with coordinates and service areas, Service schemas for all offerings, FAQPage schema, BlogPosting schema, and Review schema.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Legal pages demonstrate professionalism and build trust. They reassure visitors that you take privacy and business practices seriously.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Structured data enables rich search results that stand out visually, increasing click-through rates by up to 30%. Star ratings, business hours, and service information will appear directly in search results.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Privacy policies are legally required for websites using analytics or collecting data. They\'re also trust signals for search engines and necessary for GDPR compliance, protecting you from legal liability.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Schema markup is the language search engines use to understand your content. It\'s essential for appearing in rich snippets, knowledge panels, and voice search results. Proper structured data implementation gives you a significant competitive advantage, as most small business websites lack it.')
+    # Sitemap
+    doc.add_heading('23. Complete XML Sitemap & Breadcrumb Navigation', 2)
 
-# Legal Pages
-doc.add_heading('22. Privacy Policy & Terms of Service', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Comprehensive sitemap listing all pages and breadcrumb navigation showing user location within site hierarchy.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Comprehensive legal pages covering privacy practices, data collection, cookie usage, and terms of service.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Clear navigation reduces frustration and helps visitors find information quickly, improving conversion rates.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Legal pages demonstrate professionalism and build trust. They reassure visitors that you take privacy and business practices seriously.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('XML sitemaps help search engines discover and index all your pages. Breadcrumbs provide additional internal linking and can appear in search results, improving click-through rates. Both are essential technical SEO elements.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Privacy policies are legally required for websites using analytics or collecting data. They\'re also trust signals for search engines and necessary for GDPR compliance, protecting you from legal liability.')
+    # Newsletter
+    doc.add_heading('24. Newsletter Signup & Email List Building', 2)
 
-# Sitemap
-doc.add_heading('23. Complete XML Sitemap & Breadcrumb Navigation', 2)
+    p = doc.add_paragraph()
+    p.add_run('What We Will Build: ').bold = True
+    p.add_run('Email capture form with validation and success confirmation, enabling ongoing communication with prospects and customers.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Comprehensive sitemap listing all pages and breadcrumb navigation showing user location within site hierarchy.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Marketing Reason: ').bold = True
+    p.add_run('Email marketing delivers $42 return for every $1 spent. Building an email list creates an owned marketing channel independent of advertising platforms. Regular newsletters keep you top-of-mind for future projects and referrals.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Clear navigation reduces frustration and helps visitors find information quickly, improving conversion rates.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('Digital/SEO Reason: ').bold = True
+    p.add_run('Email list building supports long-term customer relationship management. It enables remarketing to engaged audiences and provides a direct communication channel.')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('XML sitemaps help search engines discover and index all your pages. Breadcrumbs provide additional internal linking and can appear in search results, improving click-through rates. Both are essential technical SEO elements.')
+    # Technical Excellence
+    doc.add_heading('Technical Excellence & Performance Optimization', 1)
 
-# Newsletter
-doc.add_heading('24. Newsletter Signup & Email List Building', 2)
+    doc.add_heading('Core Web Vitals Optimization', 2)
+    p = doc.add_paragraph()
+    p.add_run('The entire website will be built with Google\'s Core Web Vitals in mind—the performance metrics that directly impact search rankings:\n\n')
 
-p = doc.add_paragraph()
-p.add_run('What We Will Build: ').bold = True
-p.add_run('Email capture form with validation and success confirmation, enabling ongoing communication with prospects and customers.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('• Largest Contentful Paint (LCP): ').bold = True
+    p.add_run('Optimized image loading and video compression will ensure the hero section loads in under 2.5 seconds.\n')
 
-p = doc.add_paragraph()
-p.add_run('Marketing Reason: ').bold = True
-p.add_run('Email marketing delivers $42 return for every $1 spent. Building an email list creates an owned marketing channel independent of advertising platforms. Regular newsletters keep you top-of-mind for future projects and referrals.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('• First Input Delay (FID): ').bold = True
+    p.add_run('Minimal JavaScript and efficient code execution will provide instant interactivity.\n')
 
-p = doc.add_paragraph()
-p.add_run('Digital/SEO Reason: ').bold = True
-p.add_run('Email list building supports long-term customer relationship management. It enables remarketing to engaged audiences and provides a direct communication channel.')
+    p = doc.add_paragraph()
+    p.add_run('• Cumulative Layout Shift (CLS): ').bold = True
+    p.add_run('Proper image dimensions and reserved space will prevent content jumping during load.\n\n')
 
-# Technical Excellence
-doc.add_heading('Technical Excellence & Performance Optimization', 1)
+    doc.add_heading('Mobile-First Responsive Design', 2)
+    p = doc.add_paragraph()
+    p.add_run('With over 60% of web traffic coming from mobile devices, the entire site will be built mobile-first. Every element will adapt perfectly to smartphones, tablets, and desktops. Google\'s mobile-first indexing means your mobile site IS your search ranking, making this critical for SEO.')
 
-doc.add_heading('Core Web Vitals Optimization', 2)
-p = doc.add_paragraph()
-p.add_run('The entire website will be built with Google\'s Core Web Vitals in mind—the performance metrics that directly impact search rankings:\n\n')
+    doc.add_heading('WebP Image Format & Lazy Loading', 2)
+    p = doc.add_paragraph()
+    p.add_run('All images will use modern WebP format, reducing file sizes by 30% compared to JPEG while maintaining quality. Lazy loading will ensure images only download when needed, dramatically improving initial page load speed.')
 
-p = doc.add_paragraph()
-p.add_run('• Largest Contentful Paint (LCP): ').bold = True
-p.add_run('Optimized image loading and video compression will ensure the hero section loads in under 2.5 seconds.\n')
+    doc.add_heading('Accessibility Compliance', 2)
+    p = doc.add_paragraph()
+    p.add_run('The site will follow WCAG accessibility guidelines with proper heading hierarchy, alt text for all images, keyboard navigation support, and sufficient color contrast. Accessibility is both ethically important and a ranking factor for search engines.')
 
-p = doc.add_paragraph()
-p.add_run('• First Input Delay (FID): ').bold = True
-p.add_run('Minimal JavaScript and efficient code execution will provide instant interactivity.\n')
+    # Value Proposition
+    doc.add_heading('Investment Value & Market Comparison', 1)
 
-p = doc.add_paragraph()
-p.add_run('• Cumulative Layout Shift (CLS): ').bold = True
-p.add_run('Proper image dimensions and reserved space will prevent content jumping during load.\n\n')
+    doc.add_heading('Professional Development Cost: $15,000+', 2)
+    p = doc.add_paragraph()
+    p.add_run('A website of this caliber, built by a professional agency, would typically cost between $15,000 and $25,000. This estimate includes:\n\n')
 
-doc.add_heading('Mobile-First Responsive Design', 2)
-p = doc.add_paragraph()
-p.add_run('With over 60% of web traffic coming from mobile devices, the entire site will be built mobile-first. Every element will adapt perfectly to smartphones, tablets, and desktops. Google\'s mobile-first indexing means your mobile site IS your search ranking, making this critical for SEO.')
+    items = [
+        'Custom design and branding: $3,000-$5,000',
+        'Responsive development (20+ pages): $5,000-$8,000',
+        'Content creation (blog articles, service descriptions): $2,000-$3,000',
+        'Advanced features (maps, forms, galleries): $2,000-$4,000',
+        'SEO optimization and schema implementation: $1,500-$2,500',
+        'Multi-language integration: $1,000-$2,000',
+        'Analytics setup and documentation: $500-$1,000'
+    ]
 
-doc.add_heading('WebP Image Format & Lazy Loading', 2)
-p = doc.add_paragraph()
-p.add_run('All images will use modern WebP format, reducing file sizes by 30% compared to JPEG while maintaining quality. Lazy loading will ensure images only download when needed, dramatically improving initial page load speed.')
+    for item in items:
+        p = doc.add_paragraph(item, style='List Bullet')
 
-doc.add_heading('Accessibility Compliance', 2)
-p = doc.add_paragraph()
-p.add_run('The site will follow WCAG accessibility guidelines with proper heading hierarchy, alt text for all images, keyboard navigation support, and sufficient color contrast. Accessibility is both ethically important and a ranking factor for search engines.')
+    doc.add_paragraph()
 
-# Value Proposition
-doc.add_heading('Investment Value & Market Comparison', 1)
+    doc.add_heading('Enterprise-Level Comparison: $100,000+', 2)
+    p = doc.add_paragraph()
+    p.add_run('For context on what enterprise-level web development costs, consider ')
+    add_hyperlink(p, 'https://liquiddeath.com', 'LiquidDeath.com')
+    p.add_run('. This beverage company\'s website features:\n\n')
 
-doc.add_heading('Professional Development Cost: $15,000+', 2)
-p = doc.add_paragraph()
-p.add_run('A website of this caliber, built by a professional agency, would typically cost between $15,000 and $25,000. This estimate includes:\n\n')
+    items = [
+        'Custom 3D animations and interactive elements',
+        'Advanced e-commerce integration',
+        'Custom CMS and content management',
+        'Video production and motion graphics',
+        'Complex user account systems',
+        'Multi-region deployment and CDN optimization'
+    ]
 
-items = [
-    'Custom design and branding: $3,000-$5,000',
-    'Responsive development (20+ pages): $5,000-$8,000',
-    'Content creation (blog articles, service descriptions): $2,000-$3,000',
-    'Advanced features (maps, forms, galleries): $2,000-$4,000',
-    'SEO optimization and schema implementation: $1,500-$2,500',
-    'Multi-language integration: $1,000-$2,000',
-    'Analytics setup and documentation: $500-$1,000'
-]
+    for item in items:
+        p = doc.add_paragraph(item, style='List Bullet')
 
-for item in items:
-    p = doc.add_paragraph(item, style='List Bullet')
+    doc.add_paragraph()
 
-doc.add_paragraph()
+    p = doc.add_paragraph()
+    p.add_run('Sites at this level typically cost $100,000-$250,000 and require teams of designers, developers, and content creators working for months. While your site will be appropriately scoped for a local service business, it will incorporate many of the same premium features and professional standards found in enterprise websites.')
 
-doc.add_heading('Enterprise-Level Comparison: $100,000+', 2)
-p = doc.add_paragraph()
-p.add_run('For context on what enterprise-level web development costs, consider ')
-add_hyperlink(p, 'https://liquiddeath.com', 'LiquidDeath.com')
-p.add_run('. This beverage company\'s website features:\n\n')
+    doc.add_heading('Cascadia Managing Brands\' Commitment', 2)
+    p = doc.add_paragraph()
+    p.add_run('We will be providing this exceptional website to Dependable Home Improvement at no charge. This represents our commitment to supporting quality businesses in our community and our confidence in building long-term partnerships. The value we will be delivering—over $15,000 in professional web development—is our investment in your success.')
 
-items = [
-    'Custom 3D animations and interactive elements',
-    'Advanced e-commerce integration',
-    'Custom CMS and content management',
-    'Video production and motion graphics',
-    'Complex user account systems',
-    'Multi-region deployment and CDN optimization'
-]
+    # Ongoing Benefits
+    doc.add_heading('Long-Term Benefits & Strategic Value', 1)
 
-for item in items:
-    p = doc.add_paragraph(item, style='List Bullet')
+    doc.add_heading('Continuous SEO Improvement', 2)
+    p = doc.add_paragraph()
+    p.add_run('Unlike traditional advertising that stops working when you stop paying, SEO compounds over time. Every blog post, every review, every page we build will continue attracting organic traffic for years. The structured data and optimization we implement will position you to dominate local search results.')
 
-doc.add_paragraph()
+    doc.add_heading('Scalable Foundation', 2)
+    p = doc.add_paragraph()
+    p.add_run('The website architecture will support easy expansion. Adding new services, locations, team members, or features will require minimal effort. The JSON-based testimonials system and blog structure will allow you to update content without developer assistance.')
 
-p = doc.add_paragraph()
-p.add_run('Sites at this level typically cost $100,000-$250,000 and require teams of designers, developers, and content creators working for months. While your site will be appropriately scoped for a local service business, it will incorporate many of the same premium features and professional standards found in enterprise websites.')
+    doc.add_heading('Competitive Advantage', 2)
+    p = doc.add_paragraph()
+    p.add_run('Most home improvement contractors have basic, outdated websites or rely solely on directory listings. Your premium website will immediately differentiate you as a professional, established business. When prospects compare you to competitors, your digital presence will be the deciding factor.')
 
-doc.add_heading('Cascadia Managing Brands\' Commitment', 2)
-p = doc.add_paragraph()
-p.add_run('We will be providing this exceptional website to Dependable Home Improvement at no charge. This represents our commitment to supporting quality businesses in our community and our confidence in building long-term partnerships. The value we will be delivering—over $15,000 in professional web development—is our investment in your success.')
+    doc.add_heading('Lead Generation Engine', 2)
+    p = doc.add_paragraph()
+    p.add_run('Every feature will be designed to convert visitors into leads: multiple contact forms, click-to-call buttons, WhatsApp integration, newsletter signups, and referral program. The multi-step contact form will qualify leads automatically, saving you time and focusing your efforts on serious prospects.')
 
-# Ongoing Benefits
-doc.add_heading('Long-Term Benefits & Strategic Value', 1)
+    # Implementation Timeline
+    doc.add_heading('Implementation Approach', 1)
 
-doc.add_heading('Continuous SEO Improvement', 2)
-p = doc.add_paragraph()
-p.add_run('Unlike traditional advertising that stops working when you stop paying, SEO compounds over time. Every blog post, every review, every page we build will continue attracting organic traffic for years. The structured data and optimization we implement will position you to dominate local search results.')
+    p = doc.add_paragraph()
+    p.add_run('Our development process will ensure a smooth, efficient build:\n\n')
 
-doc.add_heading('Scalable Foundation', 2)
-p = doc.add_paragraph()
-p.add_run('The website architecture will support easy expansion. Adding new services, locations, team members, or features will require minimal effort. The JSON-based testimonials system and blog structure will allow you to update content without developer assistance.')
+    p = doc.add_paragraph()
+    p.add_run('Phase 1 - Discovery & Planning: ').bold = True
+    p.add_run('We will gather all necessary content, photos, and brand materials. We\'ll finalize the color scheme, review your existing project portfolio, and establish the site architecture.\n\n')
 
-doc.add_heading('Competitive Advantage', 2)
-p = doc.add_paragraph()
-p.add_run('Most home improvement contractors have basic, outdated websites or rely solely on directory listings. Your premium website will immediately differentiate you as a professional, established business. When prospects compare you to competitors, your digital presence will be the deciding factor.')
+    p = doc.add_paragraph()
+    p.add_run('Phase 2 - Design & Development: ').bold = True
+    p.add_run('We will build the core website structure, implement all 24 features outlined in this proposal, and optimize for performance and SEO.\n\n')
 
-doc.add_heading('Lead Generation Engine', 2)
-p = doc.add_paragraph()
-p.add_run('Every feature will be designed to convert visitors into leads: multiple contact forms, click-to-call buttons, WhatsApp integration, newsletter signups, and referral program. The multi-step contact form will qualify leads automatically, saving you time and focusing your efforts on serious prospects.')
+    p = doc.add_paragraph()
+    p.add_run('Phase 3 - Content Integration: ').bold = True
+    p.add_run('We will populate the site with your actual project photos, testimonials, service descriptions, and blog content.\n\n')
 
-# Implementation Timeline
-doc.add_heading('Implementation Approach', 1)
+    p = doc.add_paragraph()
+    p.add_run('Phase 4 - Testing & Launch: ').bold = True
+    p.add_run('We will conduct thorough testing across all devices and browsers, set up analytics tracking, and launch your new digital presence.')
 
-p = doc.add_paragraph()
-p.add_run('Our development process will ensure a smooth, efficient build:\n\n')
+    # Next Steps
+    doc.add_heading('Recommended Next Steps', 1)
 
-p = doc.add_paragraph()
-p.add_run('Phase 1 - Discovery & Planning: ').bold = True
-p.add_run('We will gather all necessary content, photos, and brand materials. We\'ll finalize the color scheme, review your existing project portfolio, and establish the site architecture.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('To move forward with this premium website redesign, we recommend:\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Phase 2 - Design & Development: ').bold = True
-p.add_run('We will build the core website structure, implement all 24 features outlined in this proposal, and optimize for performance and SEO.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('1. Provide Content Assets: ').bold = True
+    p.add_run('Share high-resolution photos of completed projects, team photos, and any existing marketing materials.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Phase 3 - Content Integration: ').bold = True
-p.add_run('We will populate the site with your actual project photos, testimonials, service descriptions, and blog content.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('2. Review & Approve Design Direction: ').bold = True
+    p.add_run('Confirm the brown and gold color scheme and overall design philosophy outlined in this proposal.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('Phase 4 - Testing & Launch: ').bold = True
-p.add_run('We will conduct thorough testing across all devices and browsers, set up analytics tracking, and launch your new digital presence.')
+    p = doc.add_paragraph()
+    p.add_run('3. Gather Testimonials: ').bold = True
+    p.add_run('Compile customer reviews and testimonials that we can feature prominently on the site.\n\n')
 
-# Next Steps
-doc.add_heading('Recommended Next Steps', 1)
-
-p = doc.add_paragraph()
-p.add_run('To move forward with this premium website redesign, we recommend:\n\n')
+    p = doc.add_paragraph()
+    p.add_run('4. Provide Social Media Links: ').bold = True
+    p.add_run('Share your Facebook, Instagram, LinkedIn, and Yelp profile URLs for integration.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('1. Provide Content Assets: ').bold = True
-p.add_run('Share high-resolution photos of completed projects, team photos, and any existing marketing materials.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('5. Prepare Analytics Accounts: ').bold = True
+    p.add_run('We will provide guidance on setting up Google Analytics 4 and Hotjar for comprehensive tracking.')
 
-p = doc.add_paragraph()
-p.add_run('2. Review & Approve Design Direction: ').bold = True
-p.add_run('Confirm the brown and gold color scheme and overall design philosophy outlined in this proposal.\n\n')
-
-p = doc.add_paragraph()
-p.add_run('3. Gather Testimonials: ').bold = True
-p.add_run('Compile customer reviews and testimonials that we can feature prominently on the site.\n\n')
-
-p = doc.add_paragraph()
-p.add_run('4. Provide Social Media Links: ').bold = True
-p.add_run('Share your Facebook, Instagram, LinkedIn, and Yelp profile URLs for integration.\n\n')
+    # Conclusion
+    doc.add_heading('Conclusion', 1)
 
-p = doc.add_paragraph()
-p.add_run('5. Prepare Analytics Accounts: ').bold = True
-p.add_run('We will provide guidance on setting up Google Analytics 4 and Hotjar for comprehensive tracking.')
+    p = doc.add_paragraph()
+    p.add_run('This proposal outlines a comprehensive digital transformation for Dependable Home Improvement. Every design choice, every feature, and every line of code will serve a specific marketing or technical purpose. The result will be a sophisticated, conversion-optimized platform that positions you as the premier home improvement service in Bergen County.\n\n')
 
-# Conclusion
-doc.add_heading('Conclusion', 1)
+    p = doc.add_paragraph()
+    p.add_run('The $15,000+ value we will be providing at no charge reflects our commitment to your success and our confidence in building a lasting partnership. We will create not just a website, but a powerful marketing asset that will generate leads, build credibility, and drive business growth for years to come.\n\n')
 
-p = doc.add_paragraph()
-p.add_run('This proposal outlines a comprehensive digital transformation for Dependable Home Improvement. Every design choice, every feature, and every line of code will serve a specific marketing or technical purpose. The result will be a sophisticated, conversion-optimized platform that positions you as the premier home improvement service in Bergen County.\n\n')
+    p = doc.add_paragraph()
+    p.add_run('We look forward to transforming your digital presence and helping Dependable Home Improvement reach new heights.')
 
-p = doc.add_paragraph()
-p.add_run('The $15,000+ value we will be providing at no charge reflects our commitment to your success and our confidence in building a lasting partnership. We will create not just a website, but a powerful marketing asset that will generate leads, build credibility, and drive business growth for years to come.\n\n')
+    # Add footer with Cascadia branding
+    doc.add_paragraph()
+    doc.add_paragraph()
+    footer = doc.add_paragraph()
+    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    footer.add_run('Prepared by Cascadia Managing Brands').bold = True
+    footer.runs[0].font.size = Pt(12)
+    footer.runs[0].font.color.rgb = RGBColor(76, 153, 76)  # Green color
 
-p = doc.add_paragraph()
-p.add_run('We look forward to transforming your digital presence and helping Dependable Home Improvement reach new heights.')
+    # Save document
+    doc.save(docx_file)
+    print("Proposal document created successfully!")
 
-# Add footer with Cascadia branding
-doc.add_paragraph()
-doc.add_paragraph()
-footer = doc.add_paragraph()
-footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
-footer.add_run('Prepared by Cascadia Managing Brands').bold = True
-footer.runs[0].font.size = Pt(12)
-footer.runs[0].font.color.rgb = RGBColor(76, 153, 76)  # Green color
 
-# Save document
-doc.save('Dependable_Home_Improvement_Website_Proposal.docx')
-print("Proposal document created successfully!")
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Review proof sheet and social cards from google-reviews.json and testimonials.json
+
+Every Google review and website testimonial becomes a social card, written
+to build/review-cards as
+
+    <source>-<id>.pdf    6in square vector card, for print and proofing
+    <source>-<id>.png    1080px square image, for posting
+
+and the proof sheet (Dependable_Home_Improvement_Review_Proofs.pdf) shows
+all of them on letter pages, marking the entries that are new or changed
+since the last run. It also checks the hand-maintained "summary" block of
+testimonials.json (HOW_TO_UPDATE_REVIEWS.md) against the reviews it sums up.
+
+Star ratings are drawn once per PDF: full, half and empty stars are form
+XObjects defined the first time a rating is drawn on a canvas, and every
+rating after that references them. The PNG cards paste one star sprite,
+rendered once per process.
+
+.cache/review-cards.json records a hash of every entry's fields and the
+card recipe, so only the cards of new or edited entries are rendered again
+and the cards of removed entries are deleted. The proof sheet is always
+rebuilt; it is one small document.
+
+    python create_review_cards.py
+    python create_review_cards.py --clear     # remove every card and the index
+"""
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import sys
+import time
+from collections import namedtuple
+from xml.sax.saxutils import escape
+
+from PIL import Image as PILImage, ImageChops, ImageDraw, ImageFont
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfgen import canvas as pdf_canvas
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, KeepInFrame
+from reportlab.platypus.flowables import Flowable
+
+import asset_manifest
+import brand_canvas
+from brand_styles import BROWN, GOLD, CREAM, CHARCOAL, WHITE, HEADLINE_FONT, MARGIN, paragraph_style
+from create_final_corrected_brandbook import h1_style, note_style
+
+ROOT = asset_manifest.ROOT
+GOOGLE_REVIEWS_FILE = os.path.join(asset_manifest.PUBLIC_DIR, 'google-reviews.json')
+TESTIMONIALS_FILE = os.path.join(asset_manifest.PUBLIC_DIR, 'testimonials.json')
+OUTPUT_DIR = os.path.join(ROOT, 'build', 'review-cards')
+INDEX_FILE = os.path.join(ROOT, '.cache', 'review-cards.json')
+PDF_FILE = "Dependable_Home_Improvement_Review_Proofs.pdf"
+
+CARD_SIZE = 6 * inch
+PNG_SIZE = 1080
+WEBSITE = "prodependable.com"
+PHONE = "(201) 637-4345"
+# Part of every entry's hash, so changing the card layout re-renders them all
+RECIPE = f"cards-v1-{CARD_SIZE}-{PNG_SIZE}"
+
+# Brand colors as RGB, for the PNG cards
+BROWN_RGB = (0x65, 0x43, 0x21)
+GOLD_RGB = (0xB8, 0x86, 0x0B)
+CREAM_RGB = (0xF5, 0xF5, 0xDC)
+CHARCOAL_RGB = (0x36, 0x45, 0x4F)
+
+STAR_FORMS = ('StarFull', 'StarHalf', 'StarEmpty')
+# Horizontal distance between stars, in star widths
+STAR_PITCH = 1.15
+
+Review = namedtuple('Review', 'key source author rating date text service verified')
+
+card_quote = paragraph_style('CardQuote', fontSize=15, textColor=CHARCOAL, alignment=TA_CENTER,
+                             fontName='Helvetica-Oblique', leading=21)
+card_author = paragraph_style('CardAuthor', fontSize=13, textColor=BROWN, alignment=TA_CENTER,
+                              fontName='Helvetica-Bold', leading=16)
+card_detail = paragraph_style('CardDetail', fontSize=10, textColor=GOLD, alignment=TA_CENTER,
+                              fontName='Helvetica-Bold', leading=13)
+proof_quote = paragraph_style('ProofQuote', fontSize=9.5, textColor=CHARCOAL, fontName='Helvetica-Oblique',
+                              leading=13, spaceBefore=4, spaceAfter=4)
+proof_author = paragraph_style('ProofAuthor', fontSize=10, textColor=BROWN, fontName='Helvetica-Bold', leading=13)
+proof_detail = paragraph_style('ProofDetail', fontSize=8.5, textColor=CHARCOAL, fontName='Helvetica', leading=11)
+summary_style = paragraph_style('ProofSummary', fontSize=12, textColor=CHARCOAL, fontName='Helvetica', leading=16,
+                                spaceAfter=6)
+
+
+def load_reviews():
+    """Google reviews then testimonials, as Review tuples"""
+    reviews = []
+    with open(GOOGLE_REVIEWS_FILE, encoding='utf-8') as f:
+        for entry in json.load(f):
+            reviews.append(Review(f"google-{entry['id']}", entry.get('source', 'Google'), entry['author'],
+                                  entry['rating'], entry.get('date'), entry['text'], None,
+                                  entry.get('verified', False)))
+    with open(TESTIMONIALS_FILE, encoding='utf-8') as f:
+        for entry in json.load(f)['reviews']:
+            reviews.append(Review(f"testimonial-{entry['id']}", 'Testimonial', entry['name'], entry['rating'],
+                                  entry.get('date'), entry['text'], entry.get('service'),
+                                  entry.get('verified', False)))
+    return reviews
+
+
+def summary_problems():
+    """Where testimonials.json's summary block disagrees with its reviews"""
+    with open(TESTIMONIALS_FILE, encoding='utf-8') as f:
+        data = json.load(f)
+    reviews, summary = data['reviews'], data.get('summary') or {}
+    problems = []
+    if summary.get('totalReviews') != len(reviews):
+        problems.append(f"totalReviews is {summary.get('totalReviews')} but there are {len(reviews)} reviews")
+    if reviews:
+        average = round(sum(review['rating'] for review in reviews) / len(reviews), 1)
+        if summary.get('averageRating') != average:
+            problems.append(f"averageRating is {summary.get('averageRating')} but the reviews average {average}")
+    return problems
+
+
+def entry_hash(review):
+    return hashlib.sha256(json.dumps([RECIPE, review._asdict()], sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def details(review):
+    parts = [review.service or review.source, review.date]
+    if review.verified:
+        parts.append("Verified")
+    return ' · '.join(part for part in parts if part)
+
+
+# ============= STAR RATINGS =============
+
+def _star_path(canvas):
+    """Five-pointed star in the unit square"""
+    path = canvas.beginPath()
+    for point in range(10):
+        radius = 0.5 if point % 2 == 0 else 0.2
+        angle = math.pi / 2 + point * math.pi / 5
+        x, y = 0.5 + radius * math.cos(angle), 0.55 + radius * math.sin(angle)
+        if point:
+            path.lineTo(x, y)
+        else:
+            path.moveTo(x, y)
+    path.close()
+    return path
+
+
+def define_star_forms(canvas):
+    """Define the full, half and empty star forms on a canvas, once"""
+    if canvas.hasForm(STAR_FORMS[0]):
+        return
+    for name, fill in zip(STAR_FORMS, (1.0, 0.5, 0.0)):
+        canvas.beginForm(name, 0, 0, 1, 1)
+        if fill:
+            canvas.saveState()
+            clip = canvas.beginPath()
+            clip.rect(0, 0, fill, 1)
+            canvas.clipPath(clip, stroke=0, fill=0)
+            canvas.setFillColor(GOLD)
+            canvas.drawPath(_star_path(canvas), stroke=0, fill=1)
+            canvas.restoreState()
+        canvas.setStrokeColor(GOLD)
+        canvas.setLineWidth(0.04)
+        canvas.setLineJoin(1)
+        canvas.drawPath(_star_path(canvas), stroke=1, fill=0)
+        canvas.endForm()
+
+
+def draw_stars(canvas, x, y, rating, size, count=5):
+    """Draw a rating as `count` stars of `size` points from (x, y)"""
+    define_star_forms(canvas)
+    for star in range(count):
+        fill = rating - star
+        name = STAR_FORMS[0] if fill >= 0.75 else STAR_FORMS[1] if fill >= 0.25 else STAR_FORMS[2]
+        canvas.saveState()
+        canvas.translate(x + star * size * STAR_PITCH, y)
+        canvas.scale(size, size)
+        canvas.doForm(name)
+        canvas.restoreState()
+
+
+def stars_width(size, count=5):
+    return size * (STAR_PITCH * (count - 1) + 1)
+
+
+class StarRating(Flowable):
+    """A rating drawn with the shared star forms"""
+
+    def __init__(self, rating, size=12):
+        Flowable.__init__(self)
+        self.rating = rating
+        self.size = size
+
+    def wrap(self, availWidth, availHeight):
+        return stars_width(self.size), self.size
+
+    def draw(self):
+        draw_stars(self.canv, 0, 0, self.rating, self.size)
+
+
+# ============= SOCIAL CARDS =============
+
+def render_pdf_card(review, path):
+    canvas = pdf_canvas.Canvas(path, pagesize=(CARD_SIZE, CARD_SIZE))
+    canvas.setTitle(f"Review by {review.author}")
+    band = 0.9 * inch
+    canvas.setFillColor(CREAM)
+    canvas.rect(0, 0, CARD_SIZE, CARD_SIZE, stroke=0, fill=1)
+    canvas.setFillColor(BROWN)
+    canvas.rect(0, CARD_SIZE - band, CARD_SIZE, band, stroke=0, fill=1)
+    canvas.setFillColor(GOLD)
+    canvas.rect(0, CARD_SIZE - band - 4, CARD_SIZE, 4, stroke=0, fill=1)
+    canvas.setFillColor(WHITE)
+    canvas.setFont(HEADLINE_FONT, 20)
+    canvas.drawCentredString(CARD_SIZE / 2, CARD_SIZE - band / 2 - 7, "Dependable Home Improvement")
+
+    star_size = 0.42 * inch
+    draw_stars(canvas, (CARD_SIZE - stars_width(star_size)) / 2, CARD_SIZE - band - 0.85 * inch,
+               review.rating, star_size)
+
+    margin = 0.55 * inch
+    content = KeepInFrame(CARD_SIZE - 2 * margin, 3.1 * inch, [
+        Paragraph(f"“{escape(review.text)}”", card_quote),
+        Spacer(1, 0.2 * inch),
+        Paragraph(f"— {escape(review.author)}", card_author),
+        Paragraph(escape(details(review)), card_detail),
+    ], mode='shrink')
+    width, height = content.wrapOn(canvas, CARD_SIZE - 2 * margin, 3.1 * inch)
+    content.drawOn(canvas, margin, 0.8 * inch + (3.1 * inch - height) / 2)
+
+    canvas.setFillColor(CHARCOAL)
+    canvas.setFont('Helvetica', 10)
+    canvas.drawCentredString(CARD_SIZE / 2, 0.4 * inch, f"{WEBSITE}  ·  {PHONE}")
+    canvas.showPage()
+    canvas.save()
+
+
+_star_sprites = {}
+
+
+def star_sprite(size, fill):
+    """RGBA star of `size` px, `fill` (0, 0.5 or 1) of it gold; rendered once per process"""
+    key = (size, fill)
+    sprite = _star_sprites.get(key)
+    if sprite is None:
+        scale = 4
+        big = size * scale
+        points = []
+        for point in range(10):
+            radius = (0.5 if point % 2 == 0 else 0.2) * big
+            angle = math.pi / 2 + point * math.pi / 5
+            points.append((big / 2 + radius * math.cos(angle), big * 0.45 - radius * math.sin(angle)))
+        outline = PILImage.new('L', (big, big), 0)
+        ImageDraw.Draw(outline).polygon(points, outline=255, width=max(1, round(big * 0.04)))
+        filled = PILImage.new('L', (big, big), 0)
+        ImageDraw.Draw(filled).polygon(points, fill=255)
+        filled.paste(0, (round(big * fill), 0, big, big))
+        sprite = PILImage.new('RGBA', (big, big), GOLD_RGB + (0,))
+        sprite.putalpha(ImageChops.lighter(outline, filled))
+        sprite = _star_sprites[key] = sprite.resize((size, size), PILImage.LANCZOS)
+    return sprite
+
+
+def _wrapped(draw, text, font, width):
+    lines, line = [], ''
+    for word in text.split():
+        candidate = f"{line} {word}".strip()
+        if line and draw.textlength(candidate, font=font) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    return lines + [line] if line else lines
+
+
+def render_png_card(review, path):
+    image = PILImage.new('RGB', (PNG_SIZE, PNG_SIZE), CREAM_RGB)
+    draw = ImageDraw.Draw(image)
+    band = 160
+    draw.rectangle((0, 0, PNG_SIZE, band), fill=BROWN_RGB)
+    draw.rectangle((0, band, PNG_SIZE, band + 8), fill=GOLD_RGB)
+    title_font = ImageFont.load_default(size=52)
+    draw.text((PNG_SIZE / 2, band / 2), "Dependable Home Improvement", fill=(255, 255, 255), font=title_font,
+              anchor='mm')
+
+    star_size = 96
+    left = (PNG_SIZE - round(star_size * (STAR_PITCH * 4 + 1))) // 2
+    for star in range(5):
+        fill = review.rating - star
+        fill = 1 if fill >= 0.75 else 0.5 if fill >= 0.25 else 0
+        sprite = star_sprite(star_size, fill)
+        image.paste(sprite, (left + round(star * star_size * STAR_PITCH), band + 60), sprite)
+
+    margin = 100
+    top, bottom = band + 60 + star_size + 60, PNG_SIZE - 120
+    for size in (46, 40, 34, 29, 25):
+        quote_font = ImageFont.load_default(size=size)
+        lines = _wrapped(draw, f"“{review.text}”", quote_font, PNG_SIZE - 2 * margin)
+        line_height = round(size * 1.35)
+        if len(lines) * line_height + 130 <= bottom - top:
+            break
+    y = top + (bottom - top - len(lines) * line_height - 130) // 2
+    for line in lines:
+        draw.text((PNG_SIZE / 2, y), line, fill=CHARCOAL_RGB, font=quote_font, anchor='ma')
+        y += line_height
+    draw.text((PNG_SIZE / 2, y + 40), f"— {review.author}", fill=BROWN_RGB,
+              font=ImageFont.load_default(size=40), anchor='ma')
+    draw.text((PNG_SIZE / 2, y + 95), details(review), fill=GOLD_RGB,
+              font=ImageFont.load_default(size=28), anchor='ma')
+    draw.text((PNG_SIZE / 2, PNG_SIZE - 60), f"{WEBSITE}  ·  {PHONE}", fill=CHARCOAL_RGB,
+              font=ImageFont.load_default(size=28), anchor='mm')
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    image.save(tmp, 'PNG', optimize=True)
+    os.replace(tmp, path)
+
+
+def output_paths(key):
+    return {
+        'pdf': os.path.join(OUTPUT_DIR, f"{key}.pdf"),
+        'png': os.path.join(OUTPUT_DIR, f"{key}.png"),
+    }
+
+
+def load_index():
+    try:
+        with open(INDEX_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(index):
+    os.makedirs(os.path.dirname(INDEX_FILE), exist_ok=True)
+    tmp = f"{INDEX_FILE}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp, INDEX_FILE)
+
+
+def build_cards(reviews):
+    """Render the cards of new and changed entries; returns {key: 'new'|'changed'|'cached'|'removed'}"""
+    index = load_index()
+    status = {}
+    keys = {review.key for review in reviews}
+    for key in set(index) - keys:
+        for path in output_paths(key).values():
+            if os.path.exists(path):
+                os.remove(path)
+        del index[key]
+        status[key] = 'removed'
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    for review in reviews:
+        digest = entry_hash(review)
+        paths = output_paths(review.key)
+        if index.get(review.key) == digest and all(os.path.exists(path) for path in paths.values()):
+            status[review.key] = 'cached'
+            continue
+        status[review.key] = 'changed' if review.key in index else 'new'
+        tmp = f"{paths['pdf']}.{os.getpid()}.tmp"
+        render_pdf_card(review, tmp)
+        os.replace(tmp, paths['pdf'])
+        render_png_card(review, paths['png'])
+        index[review.key] = digest
+        # Saved as it goes, so an interrupted run keeps what it finished
+        save_index(index)
+    return status
+
+
+# ============= PROOF SHEET =============
+
+def proof_cell(review, state):
+    flag = {'new': "NEW", 'changed': "CHANGED"}.get(state)
+    header = escape(review.author) + (f"  <font color='#B8860B' size=8>{flag}</font>" if flag else '')
+    return [
+        StarRating(review.rating, size=11),
+        Paragraph(f"“{escape(review.text)}”", proof_quote),
+        Paragraph(header, proof_author),
+        Paragraph(f"{escape(details(review))} · {review.key}", proof_detail),
+    ]
+
+
+def build_story(reviews, status, problems):
+    story = [Paragraph("Review Proof Sheet", h1_style)]
+    average = sum(review.rating for review in reviews) / len(reviews) if reviews else 0
+    changed = sum(status.get(review.key) in ('new', 'changed') for review in reviews)
+    summary = Table([[StarRating(average, size=16),
+                      Paragraph(f"<b>{average:.1f}</b> average from {len(reviews)} reviews &middot; "
+                                f"{changed} new or changed card{'s' if changed != 1 else ''} this run",
+                                summary_style)]],
+                    colWidths=[stars_width(16) + 12, None])
+    summary.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'MIDDLE'), ('LEFTPADDING', (0, 0), (0, 0), 0)]))
+    story.append(summary)
+    for problem in problems:
+        story.append(Paragraph(f"<b>testimonials.json summary:</b> {escape(problem)}", note_style))
+    story.append(Spacer(1, 0.1 * inch))
+
+    column = (letter[0] - 2 * MARGIN) / 2
+    cells = [proof_cell(review, status.get(review.key)) for review in reviews]
+    cells += [''] * (len(cells) % 2)
+    table = Table([cells[i:i + 2] for i in range(0, len(cells), 2)], colWidths=[column] * 2)
+    table.setStyle(TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('BOX', (0, 0), (-1, -1), 1, GOLD),
+        ('INNERGRID', (0, 0), (-1, -1), 0.5, GOLD),
+        ('BACKGROUND', (0, 0), (-1, -1), CREAM),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ]))
+    story.append(table)
+    return story
+
+
+def build(pdf_file=PDF_FILE):
+    started = time.perf_counter()
+    reviews = load_reviews()
+    status = build_cards(reviews)
+    problems = summary_problems()
+
+    doc = SimpleDocTemplate(pdf_file, pagesize=letter, title="Review Proof Sheet", rightMargin=MARGIN,
+                            leftMargin=MARGIN, topMargin=MARGIN, bottomMargin=MARGIN)
+    doc.build(build_story(reviews, status, problems), canvasmaker=brand_canvas.NumberedCanvas)
+
+    for problem in problems:
+        print(f"⚠ testimonials.json summary: {problem}")
+    rendered = sum(state in ('new', 'changed') for state in status.values())
+    removed = sum(state == 'removed' for state in status.values())
+    print(f"✓ {rendered} of {len(reviews)} review cards rendered, {removed} removed, "
+          f"in {time.perf_counter() - started:.2f}s: {OUTPUT_DIR}")
+    print(f"✓ Proof sheet created successfully: {pdf_file}")
+    return status
+
+
+def clear():
+    if os.path.isdir(OUTPUT_DIR):
+        shutil.rmtree(OUTPUT_DIR)
+    if os.path.exists(INDEX_FILE):
+        os.remove(INDEX_FILE)
+
+
+if __name__ == "__main__":
+    if '--clear' in sys.argv[1:]:
+        clear()
+        print(f"✓ Cleared {OUTPUT_DIR}")
+    else:
+        build()
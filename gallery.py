@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+The website gallery (client/public/gallery) as before/after pairs and single photos
+
+Before/after shots are paired by file name: <project>-before.* with
+<project>-after.*, whatever the two extensions. Files like
+stair-before-after.png are finished composites and count as single photos,
+as does either side of a pair whose partner is missing. When a photo exists
+in several formats the asset manifest's preferred one is used.
+
+    python gallery.py             # list the pairs and single photos
+"""
+
+import os
+import re
+from collections import namedtuple
+
+import asset_manifest
+
+GALLERY_PREFIX = 'gallery/'
+
+Pair = namedtuple('Pair', 'slug title before after')
+Photo = namedtuple('Photo', 'title path')
+
+
+def project_title(stem):
+    """'deck-enhancement2' -> 'Deck Enhancement 2'"""
+    stem = re.sub(r'(?<=[a-z])(?=\d)', ' ', stem)
+    return ' '.join(word.capitalize() for word in stem.replace('-', ' ').replace('_', ' ').split())
+
+
+def gallery_assets():
+    """{file stem: path} for the gallery, one preferred format per photo"""
+    photos = {}
+    for entry in asset_manifest.manifest().values():
+        relpath = os.path.relpath(entry.path, asset_manifest.PUBLIC_DIR)
+        # Skip the name_ext variants; the bare name is the preferred format
+        if entry.name.startswith(GALLERY_PREFIX) and entry.name == asset_manifest.logical_name(relpath):
+            photos[os.path.splitext(os.path.basename(entry.path))[0]] = entry.path
+    return dict(sorted(photos.items()))
+
+
+def pair_photos(photos):
+    """Split {stem: path} into before/after Pairs and the remaining single Photos"""
+    sides, singles = {}, []
+    for stem, path in photos.items():
+        match = re.fullmatch(r'(.+)-(before|after)', stem)
+        # stair-before-after.png is a finished composite, not one side of a pair
+        if match and not stem.endswith('before-after'):
+            sides.setdefault(match.group(1), {})[match.group(2)] = path
+        else:
+            singles.append(Photo(project_title(stem), path))
+    pairs = []
+    for project, found in sides.items():
+        if len(found) == 2:
+            pairs.append(Pair(project, project_title(project), found['before'], found['after']))
+        else:
+            (side, path), = found.items()
+            singles.append(Photo(f"{project_title(project)} ({side.capitalize()})", path))
+    singles.sort(key=lambda photo: photo.title)
+    return pairs, singles
+
+
+if __name__ == "__main__":
+    pairs, singles = pair_photos(gallery_assets())
+    for pair in pairs:
+        print(f"{pair.title:<28} {os.path.basename(pair.before):<32} {os.path.basename(pair.after)}")
+    for photo in singles:
+        print(f"{photo.title:<28} {os.path.basename(photo.path)}")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+In-memory WeasyPrint rendering for the HTML brand books
+
+The HTML generators used to write html_content to brand_book_temp.html, load
+it back through HTML('brand_book_temp.html') and unlink it afterwards, so two
+builds running at once overwrote each other's file. Documents are now parsed
+straight from the string with an explicit base_url for the relative image
+paths, and the extra @page stylesheets, the FontConfiguration and the parsed
+HTML are cached per process, so repeated renders skip re-parsing them.
+
+Layout is the expensive stage, so a build lays the document out exactly
+once: the per-page text dump and the PNG page previews for review are both
+read back from the PDF bytes of that one layout, with pypdf and pypdfium2.
+WeasyPrint no longer writes PNGs itself, and pypdfium2 is only needed for
+review builds (pip install pypdfium2); asking for a review without it fails
+before the layout starts.
+"""
+
+import hashlib
+import io
+import os
+
+from pypdf import PdfReader
+from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_font_config = None
+_stylesheets = {}
+_documents = {}
+
+
+def font_configuration():
+    """The FontConfiguration shared by every render in this process"""
+    global _font_config
+    if _font_config is None:
+        _font_config = FontConfiguration()
+    return _font_config
+
+
+def stylesheet(css):
+    """Return the parsed CSS for a stylesheet string, parsed once per process"""
+    parsed = _stylesheets.get(css)
+    if parsed is None:
+        parsed = _stylesheets[css] = CSS(string=css, font_config=font_configuration())
+    return parsed
+
+
+def html_document(html, base_url=ROOT):
+    """Return the parsed HTML for a string, keyed by its content and base_url"""
+    key = (hashlib.sha256(html.encode('utf-8')).hexdigest(), base_url)
+    document = _documents.get(key)
+    if document is None:
+        document = _documents[key] = HTML(string=html, base_url=base_url)
+    return document
+
+
+def render(html, page_css=None, base_url=ROOT):
+    """Lay out an HTML string; relative URLs resolve against base_url"""
+    stylesheets = [stylesheet(page_css)] if page_css else []
+    return html_document(html, base_url).render(stylesheets=stylesheets, font_config=font_configuration())
+
+
+def page_text(page):
+    """Text of one PDF page, without blank lines"""
+    return '\n'.join(line.strip() for line in page.extract_text().splitlines() if line.strip())
+
+
+def write_text_dump(pdf_bytes, text_file):
+    with open(text_file, 'w', encoding='utf-8') as f:
+        for number, page in enumerate(PdfReader(io.BytesIO(pdf_bytes)).pages, 1):
+            f.write(f"===== Page {number} =====\n{page_text(page)}\n\n")
+
+
+def _pypdfium2():
+    try:
+        import pypdfium2
+    except ImportError as exc:
+        raise ImportError("PNG review previews need pypdfium2: pip install pypdfium2") from exc
+    return pypdfium2
+
+
+def write_previews(pdf_bytes, preview_dir, resolution=96):
+    """Rasterize every page of a rendered PDF to preview_dir/page-NNN.png"""
+    pypdfium2 = _pypdfium2()
+    os.makedirs(preview_dir, exist_ok=True)
+    pdf = pypdfium2.PdfDocument(pdf_bytes)
+    paths = []
+    for number, page in enumerate(pdf, 1):
+        path = os.path.join(preview_dir, f"page-{number:03d}.png")
+        page.render(scale=resolution / 72).to_pil().save(path)
+        paths.append(path)
+    return paths
+
+
+def write_pdf(html, pdf_file, page_css=None, base_url=ROOT, review_dir=None):
+    """Render an HTML string straight to a PDF file, without a temporary HTML file
+
+    With review_dir, the same layout also yields review_dir/pages.txt and a
+    PNG preview per page; that needs pypdfium2, and ImportError is raised
+    before any layout if it is missing. Returns the rendered document.
+    """
+    if review_dir:
+        _pypdfium2()
+    document = render(html, page_css, base_url)
+    pdf_bytes = document.write_pdf()
+    with open(pdf_file, 'wb') as f:
+        f.write(pdf_bytes)
+    if review_dir:
+        os.makedirs(review_dir, exist_ok=True)
+        write_text_dump(pdf_bytes, os.path.join(review_dir, 'pages.txt'))
+        write_previews(pdf_bytes, review_dir)
+    return document
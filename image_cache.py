@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of images resampled for the size they are placed at
+
+The generators used to hand full-resolution logos to Image(...), so a 1024px
+PNG shown at 2.5in was decoded and embedded in full. downsampled_path()
+resamples a source to the pixel size its placement needs at the target DPI
+and stores the result under .cache/images, keyed by the source content hash,
+the target pixel size and the DPI, so later builds reuse it.
+
+Every tool that decodes an image goes through decoded(), which keeps memory
+bounded: JPEGs are decoded at the smallest DCT scale (1/2, 1/4, 1/8) that
+still covers the size needed, only one image is decoded at a time per
+process, and an image whose decoded pixels would exceed DECODE_CEILING_MB
+raises DecodeCeilingError instead of being loaded.
+
+    python image_cache.py --clear     # drop every cached rendition
+"""
+
+import hashlib
+import math
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+from PIL import Image as PILImage
+
+import image_probe
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, '.cache', 'images')
+
+# Print resolution for the brand books; override with BRAND_IMAGE_DPI
+DEFAULT_DPI = int(os.environ.get('BRAND_IMAGE_DPI', 300))
+
+# Largest decoded image allowed in memory; override with BRAND_DECODE_CEILING_MB
+DECODE_CEILING_MB = float(os.environ.get('BRAND_DECODE_CEILING_MB', 256))
+
+_decode_lock = threading.Lock()
+
+_digests = {}
+# Rendition path -> the file it was resampled from
+_sources = {}
+
+
+# EXIF orientations that turn the stored image a quarter turn
+_QUARTER_TURNS = {5, 6, 7, 8}
+
+
+class DecodeCeilingError(MemoryError):
+    pass
+
+
+def _quarter_turned(im):
+    return im.getexif().get(0x0112) in _QUARTER_TURNS
+
+
+def displayed_size(path):
+    """(width, height) after ImageOps.exif_transpose, read without decoding"""
+    with PILImage.open(path) as im:
+        return (im.height, im.width) if _quarter_turned(im) else im.size
+
+
+@contextmanager
+def decoded(path, min_size=None, ceiling_mb=None, displayed=False):
+    """Open an image for decoding, no larger than needed and within the memory ceiling
+
+    min_size (width, height) lets JPEGs decode at a reduced DCT scale that
+    still covers it. With displayed=True min_size is the size after
+    ImageOps.exif_transpose, so it is turned to the stored orientation first.
+    Decoding happens inside the block, which holds the process-wide decode
+    lock; keep only reduced copies once it exits.
+    """
+    ceiling_mb = DECODE_CEILING_MB if ceiling_mb is None else ceiling_mb
+    with _decode_lock, PILImage.open(path) as im:
+        if min_size and im.format == 'JPEG':
+            if displayed and _quarter_turned(im):
+                min_size = min_size[::-1]
+            im.draft(im.mode, tuple(int(v) for v in min_size))
+        size_mb = im.width * im.height * len(im.getbands()) / 2**20
+        if size_mb > ceiling_mb:
+            raise DecodeCeilingError(f"{path} decodes to {size_mb:.0f} MB at {im.width}x{im.height}, "
+                                     f"over the {ceiling_mb:g} MB ceiling (BRAND_DECODE_CEILING_MB)")
+        yield im
+
+
+def file_digest(path):
+    """SHA-256 of a file's content, memoized per (path, size, mtime)"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    digest = _digests.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha.update(chunk)
+        digest = _digests[key] = sha.hexdigest()
+    return digest
+
+
+def source_path(path):
+    """The original file behind a path, which may be a cached rendition"""
+    path = os.path.abspath(path)
+    return _sources.get(path, path)
+
+
+def source_digest(path):
+    return file_digest(source_path(path))
+
+
+def target_pixels(width, height, dpi=DEFAULT_DPI):
+    """Pixel size needed to show width x height points at dpi"""
+    return max(1, math.ceil(width / 72.0 * dpi)), max(1, math.ceil(height / 72.0 * dpi))
+
+
+def downsampled_path(path, width, height, dpi=DEFAULT_DPI):
+    """Return a file holding `path` resampled for a width x height point placement
+
+    Images that already fit are returned unchanged; nothing is ever upsampled.
+    """
+    target_w, target_h = target_pixels(width, height, dpi)
+    info = image_probe.probe(path)
+    if info.width <= target_w and info.height <= target_h:
+        return path
+    is_jpeg = info.format == 'JPEG'
+    key = f"{file_digest(path)[:32]}-{target_w}x{target_h}-{dpi}"
+    cached = os.path.join(CACHE_DIR, key + ('.jpg' if is_jpeg else '.png'))
+    _sources[os.path.abspath(cached)] = os.path.abspath(path)
+    if os.path.exists(cached):
+        return cached
+    with decoded(path, (target_w, target_h)) as im:
+        im = _resampled(im, (target_w, target_h))
+    _write(im, cached, is_jpeg)
+    return cached
+
+
+def _resampled(im, size):
+    if im.mode == 'P':
+        im = im.convert('RGBA' if 'transparency' in im.info else 'RGB')
+    elif im.mode not in ('RGB', 'RGBA', 'L', 'LA', 'CMYK'):
+        im = im.convert('RGBA')
+    # CMYK is converted after resampling so that only the small image is copied
+    im = im.resize(size, PILImage.LANCZOS, reducing_gap=3.0)
+    if im.mode == 'CMYK':
+        # ReportLab assumes Adobe-inverted CMYK JPEGs; RGB avoids the ambiguity
+        im = im.convert('RGB')
+    return im
+
+
+def _write(im, cached, is_jpeg):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f"{cached}.{os.getpid()}.tmp"
+    if is_jpeg:
+        im.save(tmp, 'JPEG', quality=90, optimize=True)
+    else:
+        im.save(tmp, 'PNG', optimize=True)
+    os.replace(tmp, cached)
+
+
+def clear():
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+
+if __name__ == "__main__":
+    if '--clear' in sys.argv[1:]:
+        clear()
+        print(f"✓ Cleared {CACHE_DIR}")
+    else:
+        print(__doc__.strip())
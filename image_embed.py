@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Embed JPEG and PNG files without decoding them where the format allows it
+
+ReportLab decodes a PNG to raw pixels and deflates them again, and wraps
+every JPEG in ASCII85, however well compressed the file already is.
+image_xobject() takes the fast path when it can:
+
+    jpeg  the DCT stream is copied into the PDF byte for byte (baseline or
+          progressive, grey, RGB or CMYK)
+    png   the IDAT data is concatenated and embedded as FlateDecode with
+          the PNG predictor parameters (/Predictor 15), so PDF readers undo
+          the same row filters the PNG used; this needs a non-interlaced grey
+          or RGB PNG without transparency
+
+and falls back to ReportLab's own decoding ("decoded") for everything else:
+alpha channels, palettes, interlacing and explicit masks. The route each
+image took is part of the ImageDedupCanvas report (brand_engine.py
+--image-report).
+
+For the Word documents, docx_picture() hands python-docx the file itself
+when it can read it. JPEGs it cannot identify (no JFIF or EXIF header)
+get a JFIF header spliced in, which keeps the DCT data untouched; CMYK
+JPEGs, which Word does not display reliably, are converted to RGB once
+and cached.
+
+    python image_embed.py FILE...     # show the route each file would take
+"""
+
+import io
+import mmap
+import os
+import struct
+import sys
+
+from reportlab.pdfbase import pdfdoc
+
+import image_cache
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Frame types PDF's DCTDecode handles: baseline, extended sequential, progressive
+DCT_FRAMES = (0xC0, 0xC1, 0xC2)
+JFIF_SEGMENT = b'\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+
+ROUTES = {'jpeg': "JPEG passthrough", 'png': "PNG IDAT reuse", 'decoded': "decoded"}
+
+
+class PassthroughImageXObject(pdfdoc.PDFImageXObject):
+    """Image XObject over already-compressed data, with optional DecodeParms"""
+
+    def __init__(self, name, width, height, bits, color_space, filters, data, decode=None, decode_parms=None):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.bitsPerComponent = bits
+        self.colorSpace = color_space
+        self._filters = filters
+        self._decode = decode
+        self.decodeParms = decode_parms
+        self.streamContent = data
+        self.mask = None
+
+    def format(self, document):
+        stream = pdfdoc.PDFStream(content=self.streamContent)
+        stream.dictionary["Type"] = pdfdoc.PDFName("XObject")
+        stream.dictionary["Subtype"] = pdfdoc.PDFName("Image")
+        stream.dictionary["Width"] = self.width
+        stream.dictionary["Height"] = self.height
+        stream.dictionary["BitsPerComponent"] = self.bitsPerComponent
+        stream.dictionary["ColorSpace"] = pdfdoc.PDFName(self.colorSpace)
+        if self._decode:
+            stream.dictionary["Decode"] = pdfdoc.PDFArray(self._decode)
+        stream.dictionary["Filter"] = pdfdoc.PDFArray([pdfdoc.PDFName(f) for f in self._filters])
+        if self.decodeParms:
+            stream.dictionary["DecodeParms"] = pdfdoc.PDFDictionary(self.decodeParms)
+        stream.dictionary["Length"] = len(self.streamContent)
+        return stream.format(document)
+
+
+def jpeg_frame(data):
+    """(width, height, components, adobe) from a JPEG's frame header, or None if DCTDecode cannot take it"""
+    pos, adobe = 2, False
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        length = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+        if marker == 0xEE and data[pos + 4:pos + 9] == b'Adobe':
+            adobe = True
+        elif 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if marker not in DCT_FRAMES or data[pos + 4] != 8:
+                return None
+            height, width, components = struct.unpack('>HHB', data[pos + 5:pos + 10])
+            return width, height, components, adobe
+        pos += 2 + length
+    return None
+
+
+def png_chunks(data):
+    """Yield (type, payload) for each chunk of a PNG"""
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        yield kind, data[pos + 8:pos + 8 + length]
+        if kind == b'IEND':
+            return
+        pos += length + 12
+
+
+def _jpeg_xobject(name, data):
+    frame = jpeg_frame(data)
+    if frame is None or frame[2] not in (1, 3, 4):
+        return None
+    width, height, components, adobe = frame
+    color_space = {1: 'DeviceGray', 3: 'DeviceRGB', 4: 'DeviceCMYK'}[components]
+    # Adobe writes CMYK JPEGs inverted
+    decode = [1, 0] * 4 if components == 4 and adobe else None
+    return PassthroughImageXObject(name, width, height, 8, color_space, ('DCTDecode',), bytes(data), decode=decode)
+
+
+def _png_xobject(name, data):
+    header, idat = None, []
+    for kind, payload in png_chunks(data):
+        if kind == b'IHDR':
+            header = struct.unpack('>IIBBBBB', payload[:13])
+        elif kind == b'tRNS':
+            return None
+        elif kind == b'IDAT':
+            idat.append(payload)
+    if header is None or not idat:
+        return None
+    width, height, bits, color_type, _, _, interlace = header
+    if interlace or color_type not in (0, 2):
+        return None
+    colors = 1 if color_type == 0 else 3
+    color_space = 'DeviceGray' if colors == 1 else 'DeviceRGB'
+    parms = {'Predictor': 15, 'Colors': colors, 'BitsPerComponent': bits, 'Columns': width}
+    return PassthroughImageXObject(name, width, height, bits, color_space, ('FlateDecode',), b''.join(idat),
+                                   decode_parms=parms)
+
+
+def image_xobject(name, path, mask='auto'):
+    """(image XObject, route) for an image file; route is 'jpeg', 'png' or 'decoded'
+
+    The file is memory-mapped while it is parsed, so only the compressed
+    data that goes into the PDF is copied. The decoded route is subject to
+    image_cache's decode lock and memory ceiling.
+    """
+    if mask in ('auto', None) and os.path.getsize(path):
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            image_obj, route = None, None
+            if data[:2] == b'\xff\xd8':
+                image_obj, route = _jpeg_xobject(name, data), 'jpeg'
+            elif data[:8] == PNG_SIGNATURE:
+                image_obj, route = _png_xobject(name, data), 'png'
+        if image_obj is not None:
+            return image_obj, route
+    with image_cache.decoded(path):
+        return pdfdoc.PDFImageXObject(name, path, mask=mask), 'decoded'
+
+
+def docx_picture(document, path, **kwargs):
+    """document.add_picture() for an image file, avoiding a re-encode where possible
+
+    Returns (InlineShape, route); route is 'as-is', 'jfif-header' or 'decoded'.
+    """
+    from docx.image.exceptions import UnrecognizedImageError
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        return document.add_picture(io.BytesIO(data), **kwargs), 'as-is'
+    except UnrecognizedImageError:
+        frame = jpeg_frame(data) if data.startswith(b'\xff\xd8') else None
+        if frame is None:
+            raise
+    if frame[2] in (1, 3):
+        return document.add_picture(io.BytesIO(data[:2] + JFIF_SEGMENT + data[2:]), **kwargs), 'jfif-header'
+    return document.add_picture(_rgb_jpeg(path), **kwargs), 'decoded'
+
+
+def _rgb_jpeg(path):
+    """Path of an RGB copy of a CMYK JPEG, cached by content hash"""
+    cached = os.path.join(image_cache.CACHE_DIR, f"{image_cache.file_digest(path)[:32]}-rgb.jpg")
+    if not os.path.exists(cached):
+        os.makedirs(image_cache.CACHE_DIR, exist_ok=True)
+        with image_cache.decoded(path) as im:
+            tmp = f"{cached}.{os.getpid()}.tmp"
+            im.convert('RGB').save(tmp, 'JPEG', quality=92, optimize=True)
+        os.replace(tmp, cached)
+    return cached
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        image_obj, route = image_xobject('Probe', path)
+        print(f"{os.path.basename(path):<40} {ROUTES[route]:<18} {len(image_obj.streamContent):>10,} bytes")
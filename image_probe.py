@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Header-only size and DPI probing for PNG, JPEG, WebP and SVG files
+
+Layout only needs an image's intrinsic size, yet sizing a flowable from it
+used to mean opening the image with an ImageReader, or else hardcoding the
+aspect ratio in the script (2.8*inch/1.79167, width / 1.294, ...), which
+distorts the logo as soon as the file changes. probe() reads just the file
+header: the PNG IHDR and pHYs chunks, the JPEG SOF and JFIF segments, the
+WebP VP8/VP8L/VP8X header, or the root element of an SVG. Nothing is
+decoded, and nothing past the header is read: results are cached per
+(path, size, mtime) for the lifetime of the process, so a changed file is
+probed again without hashing its content.
+
+    python image_probe.py FILE...
+"""
+
+import os
+import re
+import struct
+import sys
+from collections import namedtuple
+from xml.etree import ElementTree
+
+ImageInfo = namedtuple('ImageInfo', 'format width height dpi')
+
+DEFAULT_DPI = (72.0, 72.0)
+
+# Bytes read ahead of parsing; headers of the files in this repo fit easily
+HEADER_BYTES = 64 * 1024
+
+# CSS units in points, for SVG width/height attributes
+SVG_UNITS = {'': 0.75, 'px': 0.75, 'pt': 1.0, 'pc': 12.0, 'in': 72.0, 'cm': 72 / 2.54, 'mm': 72 / 25.4}
+
+_probes = {}
+
+
+class ProbeError(ValueError):
+    pass
+
+
+def probe(path):
+    """ImageInfo(format, width, height, dpi) read from the file header
+
+    Raster sizes are in pixels; SVG sizes are in points, with dpi 72.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    info = _probes.get(key)
+    if info is None:
+        with open(path, 'rb') as f:
+            head = f.read(HEADER_BYTES)
+        info = _probes[key] = _parse(head, path)
+    return info
+
+
+def aspect_ratio(path):
+    """Width divided by height"""
+    info = probe(path)
+    return info.width / info.height
+
+
+def size_in_points(path):
+    """Natural size at the image's own DPI"""
+    info = probe(path)
+    return info.width * 72.0 / info.dpi[0], info.height * 72.0 / info.dpi[1]
+
+
+def _parse(head, path):
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return _parse_png(head)
+    if head.startswith(b'\xff\xd8'):
+        return _parse_jpeg(head, path)
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return _parse_webp(head)
+    if b'<svg' in head:
+        return _parse_svg(path)
+    raise ProbeError(f"Unrecognised image format: {path}")
+
+
+def _parse_png(head):
+    width, height = struct.unpack('>II', head[16:24])
+    dpi = DEFAULT_DPI
+    pos = 8
+    while pos + 8 <= len(head):
+        length, chunk = struct.unpack('>I4s', head[pos:pos + 8])
+        if chunk == b'pHYs' and pos + 17 <= len(head):
+            ppu_x, ppu_y, unit = struct.unpack('>IIB', head[pos + 8:pos + 17])
+            if unit == 1 and ppu_x and ppu_y:
+                dpi = (round(ppu_x * 0.0254, 2), round(ppu_y * 0.0254, 2))
+            break
+        if chunk in (b'IDAT', b'IEND'):
+            break
+        pos += length + 12
+    return ImageInfo('PNG', width, height, dpi)
+
+
+def _parse_jpeg(head, path):
+    dpi = DEFAULT_DPI
+    pos = 2
+    while True:
+        if pos + 16 > len(head):
+            # Large APP segments (EXIF thumbnails, ICC profiles) can push the
+            # frame header past the first read; carry on from the file
+            with open(path, 'rb') as f:
+                f.seek(len(head))
+                head += f.read(max(HEADER_BYTES, pos + 16 - len(head)))
+            if pos + 9 > len(head):
+                raise ProbeError(f"No JPEG frame header: {path}")
+        if head[pos] != 0xFF:
+            raise ProbeError(f"Corrupt JPEG marker at byte {pos}: {path}")
+        marker = head[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        length = struct.unpack('>H', head[pos + 2:pos + 4])[0]
+        if marker == 0xE0 and head[pos + 4:pos + 9] == b'JFIF\x00':
+            unit, x_density, y_density = struct.unpack('>BHH', head[pos + 11:pos + 16])
+            if x_density and y_density and unit in (1, 2):
+                scale = 1.0 if unit == 1 else 2.54
+                dpi = (x_density * scale, y_density * scale)
+        elif marker == 0xE1 and head[pos + 4:pos + 10] == b'Exif\x00\x00' and dpi == DEFAULT_DPI:
+            dpi = _exif_dpi(head[pos + 10:pos + 2 + length]) or dpi
+        elif 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack('>HH', head[pos + 5:pos + 9])
+            return ImageInfo('JPEG', width, height, dpi)
+        pos += 2 + length
+
+
+def _exif_dpi(tiff):
+    """X/YResolution from the first IFD of an EXIF block, or None"""
+    if len(tiff) < 8 or tiff[:2] not in (b'II', b'MM'):
+        return None
+    order = '<' if tiff[:2] == b'II' else '>'
+    ifd = struct.unpack(order + 'I', tiff[4:8])[0]
+    if ifd + 2 > len(tiff):
+        return None
+    resolution, unit = {}, 2
+    for index in range(struct.unpack(order + 'H', tiff[ifd:ifd + 2])[0]):
+        entry = tiff[ifd + 2 + index * 12:ifd + 14 + index * 12]
+        if len(entry) < 12:
+            break
+        tag, kind, _, value = struct.unpack(order + 'HHI4s', entry)
+        if tag in (0x011A, 0x011B) and kind == 5:
+            offset = struct.unpack(order + 'I', value)[0]
+            if offset + 8 <= len(tiff):
+                numerator, denominator = struct.unpack(order + 'II', tiff[offset:offset + 8])
+                resolution[tag] = numerator / denominator if denominator else 0
+        elif tag == 0x0128:
+            unit = struct.unpack(order + 'H', value[:2])[0]
+    x, y = resolution.get(0x011A), resolution.get(0x011B)
+    if not x or not y or unit not in (2, 3):
+        return None
+    scale = 1.0 if unit == 2 else 2.54
+    return (x * scale, y * scale)
+
+
+def _parse_webp(head):
+    chunk = head[12:16]
+    if chunk == b'VP8 ':
+        width, height = struct.unpack('<HH', head[26:30])
+        return ImageInfo('WEBP', width & 0x3FFF, height & 0x3FFF, DEFAULT_DPI)
+    if chunk == b'VP8L':
+        bits = int.from_bytes(head[21:25], 'little')
+        return ImageInfo('WEBP', (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, DEFAULT_DPI)
+    if chunk == b'VP8X':
+        width = int.from_bytes(head[24:27], 'little') + 1
+        height = int.from_bytes(head[27:30], 'little') + 1
+        return ImageInfo('WEBP', width, height, DEFAULT_DPI)
+    raise ProbeError(f"Unknown WebP chunk {chunk!r}")
+
+
+def _svg_length(value):
+    match = re.fullmatch(r'\s*([0-9.]+)\s*([a-z]*)\s*', value or '')
+    if not match or match.group(2) not in SVG_UNITS:
+        return None
+    return float(match.group(1)) * SVG_UNITS[match.group(2)]
+
+
+def _parse_svg(path):
+    # Only the start tag of the root element is parsed
+    for _, element in ElementTree.iterparse(path, events=('start',)):
+        width = _svg_length(element.get('width'))
+        height = _svg_length(element.get('height'))
+        view_box = element.get('viewBox')
+        if view_box and (width is None or height is None):
+            _, _, box_width, box_height = (float(v) for v in re.split(r'[\s,]+', view_box.strip()))
+            if width is None and height is None:
+                width, height = box_width * 0.75, box_height * 0.75
+            elif width is None:
+                width = height * box_width / box_height
+            else:
+                height = width * box_height / box_width
+        if width is None or height is None:
+            raise ProbeError(f"SVG without a usable size: {path}")
+        return ImageInfo('SVG', width, height, DEFAULT_DPI)
+    raise ProbeError(f"Empty SVG: {path}")
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        info = probe(path)
+        print(f"{os.path.basename(path):<40} {info.format:<5} {info.width:>8g} x {info.height:<8g} "
+              f"dpi {info.dpi[0]:g}x{info.dpi[1]:g}")
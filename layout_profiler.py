@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Opt-in per-flowable layout profiling for ReportLab doc.build() calls
+
+    with layout_profiler.profiling() as profiler:
+        create_complete_brandbook.build('build/complete.pdf')
+    profiler.print_report()
+    profiler.write_chrome_trace('build/complete.trace.json')
+
+While profiling() is active every doc.build() instruments its flowables
+before laying them out, recording the time spent in wrap, split and draw
+and the number of split attempts for each one. Flowables are tagged with the
+section they belong to: the story is divided at PageBreaks and each part is
+named after its first paragraph, which is the section heading in the brand
+books. Parts produced by splitting a flowable are charged to the original.
+
+The Chrome trace opens in chrome://tracing or https://ui.perfetto.dev.
+
+    python layout_profiler.py complete           # profile one brand_engine variant
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from reportlab.platypus import BaseDocTemplate, PageBreak, Paragraph, Table, Image
+
+PHASES = ('wrap', 'split', 'draw')
+
+
+def describe(flowable):
+    """Short label telling flowables of one section apart"""
+    name = type(flowable).__name__
+    if isinstance(flowable, Paragraph):
+        text = ' '.join(flowable.getPlainText().split())
+        return f"{name} {text[:40]!r}"
+    if isinstance(flowable, Table):
+        return f"{name} {flowable._ncols} cols x {flowable._nrows} rows"
+    if isinstance(flowable, Image):
+        return f"{name} {os.path.basename(str(flowable.filename))}"
+    return name
+
+
+class FlowableStats:
+    def __init__(self, section, label):
+        self.section = section
+        self.label = label
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.calls = dict.fromkeys(PHASES, 0)
+
+    @property
+    def total(self):
+        return sum(self.seconds.values())
+
+    @property
+    def split_retries(self):
+        # The first split of a flowable is ordinary pagination; more are retries
+        return max(0, self.calls['split'] - 1)
+
+
+class LayoutProfiler:
+    def __init__(self):
+        self.stats = []
+        self.events = []
+        self._started = time.perf_counter()
+
+    def instrument(self, flowables):
+        """Wrap the layout methods of each flowable, tagging it with its section"""
+        part, section = [], None
+        for flowable in flowables:
+            if isinstance(flowable, PageBreak):
+                part, section = [], None
+            stats = FlowableStats('untitled', describe(flowable))
+            if section is None and isinstance(flowable, Paragraph):
+                section = ' '.join(flowable.getPlainText().split())[:40]
+                # Logos and spacers ahead of the heading belong to its section
+                for earlier in part:
+                    earlier.section = section
+            stats.section = section or stats.section
+            part.append(stats)
+            self.stats.append(stats)
+            self._instrument(flowable, stats)
+
+    def _instrument(self, flowable, stats):
+        for phase, method in (('wrap', 'wrap'), ('split', 'split'), ('draw', 'drawOn')):
+            setattr(flowable, method, self._timed(getattr(flowable, method), phase, stats))
+
+    def _timed(self, method, phase, stats):
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            result = method(*args, **kwargs)
+            seconds = time.perf_counter() - started
+            stats.seconds[phase] += seconds
+            stats.calls[phase] += 1
+            self.events.append({
+                'name': f"{phase} {stats.label}",
+                'cat': stats.section,
+                'ph': 'X',
+                'ts': round((started - self._started) * 1e6, 1),
+                'dur': round(seconds * 1e6, 1),
+                'pid': os.getpid(),
+                'tid': 0,
+            })
+            if phase == 'split':
+                for part in result:
+                    self._instrument(part, stats)
+            return result
+        return timed
+
+    def sections(self):
+        """{section: seconds}, slowest first"""
+        totals = {}
+        for stats in self.stats:
+            totals[stats.section] = totals.get(stats.section, 0.0) + stats.total
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def print_report(self, limit=25, file=None):
+        file = file or sys.stdout
+        ranked = sorted(self.stats, key=lambda stats: -stats.total)
+        print(f"{'total ms':>9} {'wrap':>8} {'split':>8} {'draw':>8} {'retries':>7}  section / flowable", file=file)
+        for stats in ranked[:limit]:
+            print(f"{stats.total * 1e3:9.2f} {stats.seconds['wrap'] * 1e3:8.2f} {stats.seconds['split'] * 1e3:8.2f} "
+                  f"{stats.seconds['draw'] * 1e3:8.2f} {stats.split_retries:7d}  {stats.section} / {stats.label}",
+                  file=file)
+        print("\nBy section:", file=file)
+        for section, seconds in self.sections().items():
+            print(f"{seconds * 1e3:9.2f}  {section}", file=file)
+
+    def write_chrome_trace(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+
+
+@contextmanager
+def profiling(profiler=None):
+    """Instrument every doc.build() made inside the block"""
+    profiler = profiler or LayoutProfiler()
+    original_build = BaseDocTemplate.build
+
+    def build(doc, flowables, *args, **kwargs):
+        profiler.instrument(flowables)
+        return original_build(doc, flowables, *args, **kwargs)
+
+    BaseDocTemplate.build = build
+    try:
+        yield profiler
+    finally:
+        BaseDocTemplate.build = original_build
+
+
+if __name__ == "__main__":
+    import brand_engine
+
+    name = sys.argv[1] if len(sys.argv) > 1 else 'complete'
+    os.chdir(brand_engine.ROOT)
+    module = brand_engine.load_variant(name)
+    pdf_file = brand_engine.output_path(name)
+    os.makedirs(os.path.dirname(pdf_file), exist_ok=True)
+    with profiling() as profiler:
+        module.build(pdf_file)
+    print()
+    profiler.print_report()
+    trace = os.path.splitext(pdf_file)[0] + '.trace.json'
+    profiler.write_chrome_trace(trace)
+    print(f"\n✓ Chrome trace written to {trace}")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Concatenate PDF files into one without holding the result in memory
+
+pypdf's PdfWriter keeps every page of the output until write(), so stitching
+N fragments costs memory in proportion to N. StreamingPdfWriter instead
+copies each appended file's objects to the output as soon as the file is
+read: page content and image streams are copied still compressed, object
+numbers are remapped on the way, and the source file is released before the
+next one is opened. What stays in memory is one offset per object and one
+reference per page, plus the outline entries.
+
+    with open(pdf_file, 'wb') as f:
+        writer = StreamingPdfWriter(f)
+        writer.append('front.pdf')
+        first = writer.append('chapter-1.pdf', outline="Chapter 1")
+        writer.close(info={'/Title': "Book"})
+"""
+
+from pypdf import PdfReader
+from pypdf.generic import (ArrayObject, DictionaryObject, IndirectObject, NameObject, NumberObject,
+                           StreamObject, TextStringObject)
+
+
+class StreamingPdfWriter:
+    """Write PDFs one after another into an open binary file"""
+
+    def __init__(self, f):
+        self.f = f
+        self._offsets = [None]
+        self._pages_ref = self._reserve()
+        self._page_refs = []
+        self._outline = []
+        f.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    @property
+    def page_count(self):
+        return len(self._page_refs)
+
+    def _reserve(self):
+        self._offsets.append(None)
+        return IndirectObject(len(self._offsets) - 1, 0, None)
+
+    def _write(self, ref, obj):
+        self._offsets[ref.idnum] = self.f.tell()
+        self.f.write(f"{ref.idnum} 0 obj\n".encode('ascii'))
+        obj.write_to_stream(self.f)
+        self.f.write(b"\nendobj\n")
+
+    def append(self, path, outline=None):
+        """Copy every page of a PDF file; returns the 0-based index of its first page
+
+        outline adds a bookmark with that title pointing at the first page.
+        """
+        reader = PdfReader(path)
+        mapping, pending = {}, []
+
+        def ref(indirect):
+            key = (indirect.idnum, indirect.generation)
+            if key not in mapping:
+                mapping[key] = self._reserve()
+                pending.append(indirect)
+            return mapping[key]
+
+        page_ids = set()
+        first_page = len(self._page_refs)
+        for page in reader.pages:
+            page_ids.add(page.indirect_reference.idnum)
+            self._page_refs.append(ref(page.indirect_reference))
+        while pending:
+            indirect = pending.pop()
+            obj = indirect.get_object()
+            if indirect.idnum in page_ids:
+                # The page's /Parent becomes this writer's page tree, not the source's
+                obj = _remapped(DictionaryObject({key: value for key, value in obj.items() if key != '/Parent'}), ref)
+                obj[NameObject('/Parent')] = self._pages_ref
+            else:
+                obj = _remapped(obj, ref)
+            self._write(mapping[(indirect.idnum, indirect.generation)], obj)
+        if outline is not None and len(self._page_refs) > first_page:
+            self._outline.append((outline, self._page_refs[first_page]))
+        return first_page
+
+    def close(self, info=None):
+        """Write the page tree, outline, document info and cross-reference table"""
+        pages = DictionaryObject({
+            NameObject('/Type'): NameObject('/Pages'),
+            NameObject('/Kids'): ArrayObject(self._page_refs),
+            NameObject('/Count'): NumberObject(len(self._page_refs)),
+        })
+        self._write(self._pages_ref, pages)
+
+        catalog = DictionaryObject({
+            NameObject('/Type'): NameObject('/Catalog'),
+            NameObject('/Pages'): self._pages_ref,
+        })
+        if self._outline:
+            catalog[NameObject('/Outlines')] = self._write_outline()
+            catalog[NameObject('/PageMode')] = NameObject('/UseOutlines')
+        catalog_ref = self._reserve()
+        self._write(catalog_ref, catalog)
+
+        trailer = DictionaryObject({
+            NameObject('/Size'): NumberObject(len(self._offsets)),
+            NameObject('/Root'): catalog_ref,
+        })
+        if info:
+            info_ref = self._reserve()
+            self._write(info_ref, DictionaryObject({NameObject(key): TextStringObject(str(value))
+                                                    for key, value in info.items()}))
+            trailer[NameObject('/Info')] = info_ref
+            trailer[NameObject('/Size')] = NumberObject(len(self._offsets))
+
+        xref = self.f.tell()
+        self.f.write(f"xref\n0 {len(self._offsets)}\n0000000000 65535 f \n".encode('ascii'))
+        for offset in self._offsets[1:]:
+            self.f.write(f"{offset:010d} 00000 n \n".encode('ascii'))
+        self.f.write(b"trailer\n")
+        trailer.write_to_stream(self.f)
+        self.f.write(f"\nstartxref\n{xref}\n%%EOF\n".encode('ascii'))
+
+    def _write_outline(self):
+        root = self._reserve()
+        items = [self._reserve() for _ in self._outline]
+        for index, ((title, page_ref), item) in enumerate(zip(self._outline, items)):
+            entry = DictionaryObject({
+                NameObject('/Title'): TextStringObject(title),
+                NameObject('/Parent'): root,
+                NameObject('/Dest'): ArrayObject([page_ref, NameObject('/Fit')]),
+            })
+            if index:
+                entry[NameObject('/Prev')] = items[index - 1]
+            if index + 1 < len(items):
+                entry[NameObject('/Next')] = items[index + 1]
+            self._write(item, entry)
+        self._write(root, DictionaryObject({
+            NameObject('/Type'): NameObject('/Outlines'),
+            NameObject('/First'): items[0],
+            NameObject('/Last'): items[-1],
+            NameObject('/Count'): NumberObject(len(items)),
+        }))
+        return root
+
+
+def _remapped(obj, ref):
+    """Copy of a PDF object with every indirect reference passed through ref()"""
+    if isinstance(obj, IndirectObject):
+        return ref(obj)
+    if isinstance(obj, StreamObject):
+        copy = StreamObject()
+        copy._data = obj._data
+        copy.update({key: _remapped(value, ref) for key, value in obj.items() if key != '/Length'})
+        return copy
+    if isinstance(obj, DictionaryObject):
+        return DictionaryObject({key: _remapped(value, ref) for key, value in obj.items()})
+    if isinstance(obj, ArrayObject):
+        return ArrayObject(_remapped(value, ref) for value in obj)
+    return obj
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Low-quality image placeholders (LQIP) for the blog, case study and gallery images
+
+Nothing is painted where a blog or case study photo will appear until the
+full-size file has loaded. This tool computes a tiny blurred placeholder for
+every image the site data points at and stores it as a data: URI the front
+end can show straight away, e.g. as the <img> background:
+
+    blog-posts.json       posts[].image            -> posts[].imagePlaceholder
+    case-studies.json     [].images.before/.after  -> [].imagePlaceholders.before/.after
+    gallery/              every photo              -> gallery-placeholders.json {url: placeholder}
+
+The downsampling is vectorized NumPy: the image is cropped to a multiple of
+the target size and averaged block by block, in linear light so dark and
+bright areas mix as they would when the eye blurs them, then softened with a
+small separable blur before the PLACEHOLDER_SIZE px WebP is encoded.
+Placeholders are cached in .cache/placeholders.json by image hash, so a
+re-run only decodes images that are new or changed.
+
+    python placeholders.py             # update the JSON files
+    python placeholders.py --check     # report what would change, write nothing
+    python placeholders.py --clear     # drop the placeholder cache
+"""
+
+import base64
+import io
+import json
+import os
+import sys
+
+import numpy as np
+from PIL import Image as PILImage, ImageOps
+
+import asset_manifest
+import image_cache
+from color_space import to_linear, to_srgb
+
+ROOT = asset_manifest.ROOT
+PUBLIC_DIR = asset_manifest.PUBLIC_DIR
+CACHE_FILE = os.path.join(ROOT, '.cache', 'placeholders.json')
+BLOG_FILE = os.path.join(PUBLIC_DIR, 'blog-posts.json')
+CASE_STUDIES_FILE = os.path.join(PUBLIC_DIR, 'case-studies.json')
+GALLERY_FILE = os.path.join(PUBLIC_DIR, 'gallery-placeholders.json')
+
+# Longest side of the placeholder, in pixels
+PLACEHOLDER_SIZE = 16
+WEBP_QUALITY = 50
+# Part of the cache key, so changing the recipe regenerates every placeholder
+RECIPE = f"lqip-v1-{PLACEHOLDER_SIZE}-{WEBP_QUALITY}"
+
+# Separable [1 2 1] blur kernel
+_KERNEL = np.array([0.25, 0.5, 0.25])
+
+
+def block_average(pixels, size):
+    """Average an (H, W, C) float array down to (size[1], size[0], C), one block per output pixel
+
+    A source smaller than size on either axis is first repeated up to it, so
+    every output pixel has at least one source pixel.
+    """
+    width, height = size
+    pixels = np.repeat(pixels, -(-height // pixels.shape[0]), axis=0)
+    pixels = np.repeat(pixels, -(-width // pixels.shape[1]), axis=1)
+    block_h, block_w = pixels.shape[0] // height, pixels.shape[1] // width
+    pixels = pixels[:block_h * height, :block_w * width]
+    return pixels.reshape(height, block_h, width, block_w, -1).mean(axis=(1, 3))
+
+
+def soften(pixels):
+    """Separable [1 2 1] blur with edge replication"""
+    for axis in (0, 1):
+        padded = np.pad(pixels, [(1, 1) if a == axis else (0, 0) for a in range(3)], mode='edge')
+        length = pixels.shape[axis]
+        pixels = sum(weight * np.take(padded, range(offset, offset + length), axis=axis)
+                     for offset, weight in enumerate(_KERNEL))
+    return pixels
+
+
+def placeholder(path):
+    """data:image/webp URI of a PLACEHOLDER_SIZE px blurred version of an image"""
+    # Decoding straight to a reduced size keeps large JPEGs cheap
+    with image_cache.decoded(path, (PLACEHOLDER_SIZE * 8, PLACEHOLDER_SIZE * 8)) as im:
+        im = ImageOps.exif_transpose(im).convert('RGB')
+        scale = PLACEHOLDER_SIZE / max(im.size)
+        size = (max(1, round(im.width * scale)), max(1, round(im.height * scale)))
+        pixels = to_linear(np.asarray(im, dtype=np.float64) / 255.0)
+    small = to_srgb(soften(block_average(pixels, size)))
+    small = PILImage.fromarray(np.clip(small * 255.0 + 0.5, 0, 255).astype(np.uint8), 'RGB')
+    buffer = io.BytesIO()
+    small.save(buffer, 'WEBP', quality=WEBP_QUALITY)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+class Placeholders:
+    """Placeholder lookup by public URL, backed by the hash-keyed cache"""
+
+    def __init__(self):
+        self.assets = {entry.path: entry for entry in asset_manifest.manifest().values()}
+        try:
+            with open(CACHE_FILE, encoding='utf-8') as f:
+                self.cache = json.load(f)
+        except (OSError, ValueError):
+            self.cache = {}
+        self.made = 0
+        self.missing = []
+
+    def get(self, url):
+        """Placeholder for a site URL such as /gallery/basement-after.jpg, or None if the file is missing"""
+        entry = self.assets.get(os.path.join(PUBLIC_DIR, *url.lstrip('/').split('/')))
+        if entry is None:
+            self.missing.append(url)
+            return None
+        key = f"{entry.sha256}-{RECIPE}"
+        if key not in self.cache:
+            self.cache[key] = placeholder(entry.path)
+            self.made += 1
+        return self.cache[key]
+
+    def save(self):
+        if self.made:
+            os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+            tmp = f"{CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.cache, f, indent=1, sort_keys=True)
+            os.replace(tmp, CACHE_FILE)
+
+
+def _set(record, field, value, after):
+    """Set record[field] right after the `after` key, or remove it when value is None"""
+    record.pop(field, None)
+    if value is None:
+        return record
+    items = []
+    for key, existing in record.items():
+        items.append((key, existing))
+        if key == after:
+            items.append((field, value))
+    record.clear()
+    record.update(items)
+    return record
+
+
+def update_blog(data, placeholders):
+    for post in data.get('posts', []):
+        if post.get('image'):
+            _set(post, 'imagePlaceholder', placeholders.get(post['image']), after='image')
+    return data
+
+
+def update_case_studies(data, placeholders):
+    for study in data:
+        images = study.get('images') or {}
+        found = {side: placeholders.get(url) for side, url in images.items() if url}
+        _set(study, 'imagePlaceholders', {side: value for side, value in found.items() if value} or None, after='images')
+    return data
+
+
+def gallery_placeholders(data, placeholders):
+    urls = set()
+    for entry in placeholders.assets.values():
+        relpath = os.path.relpath(entry.path, PUBLIC_DIR)
+        if entry.width and relpath.startswith('gallery' + os.sep):
+            urls.add('/' + relpath.replace(os.sep, '/'))
+    return {url: placeholders.get(url) for url in sorted(urls)}
+
+
+def rewrite_json(path, update, placeholders, check=False):
+    """Apply update(data, placeholders) to a JSON file, keeping its layout; returns True if it changed
+
+    A file that does not exist yet is created from update(None, placeholders).
+    """
+    raw = None
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            raw = f.read()
+    text = json.dumps(update(json.loads(raw) if raw else None, placeholders), indent=2)
+    if raw is None or raw.endswith('\n'):
+        text += '\n'
+    if text == raw:
+        return False
+    if not check:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+    return True
+
+
+def clear():
+    if os.path.exists(CACHE_FILE):
+        os.remove(CACHE_FILE)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if '--clear' in argv:
+        clear()
+        print(f"✓ Cleared {CACHE_FILE}")
+        return 0
+    check = '--check' in argv
+
+    placeholders = Placeholders()
+    changed = {
+        BLOG_FILE: rewrite_json(BLOG_FILE, update_blog, placeholders, check),
+        CASE_STUDIES_FILE: rewrite_json(CASE_STUDIES_FILE, update_case_studies, placeholders, check),
+        GALLERY_FILE: rewrite_json(GALLERY_FILE, gallery_placeholders, placeholders, check),
+    }
+    if not check:
+        placeholders.save()
+
+    for url in sorted(set(placeholders.missing)):
+        print(f"⚠ {url} is referenced but not in client/public; no placeholder")
+    for path, was_changed in changed.items():
+        status = ("would change" if check else "updated") if was_changed else "up to date"
+        print(f"{'✓' if not (check and was_changed) else '⚠'} {os.path.relpath(path, ROOT)}: {status}")
+    print(f"{placeholders.made} placeholder(s) computed, the rest came from the cache")
+    return 1 if check and any(changed.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Width-stepped WebP and AVIF variants of the website images, for srcset
+
+client/public serves hero-background.jpg, the gallery PNGs and the blog
+photos at their original size. This build step resamples every raster image
+under client/public to the widths in WIDTHS (never wider than the original,
+which is always included when it is narrower than the widest step) and
+encodes each width as WebP and AVIF into client/public/responsive, mirroring
+the source layout:
+
+    gallery/basement-after.jpg -> responsive/gallery/basement-after-480.webp
+                                  responsive/gallery/basement-after-480.avif ...
+
+The source hashes come from the asset manifest. .cache/responsive.json
+records, per source, the hash and encoder settings its variants were made
+with, so a rebuild only re-encodes new or changed images and removes the
+variants of deleted ones. Images are encoded in a process pool, one task per
+source, largest first.
+
+responsive/srcset.json maps each public URL to its intrinsic size and a
+ready-made srcset string per format, for the front end's <picture> sources:
+
+    {"/gallery/basement-after.jpg": {"width": 1200, "height": 900,
+        "srcset": {"avif": "/responsive/gallery/basement-after-480.avif 480w, ...",
+                   "webp": "..."}}}
+
+`pnpm build` runs this first (the "images" package script), so vite copies
+client/public/responsive into dist/public with the rest of the public files.
+The variants are not committed, so every build machine, Vercel's included,
+needs Python 3 with Pillow built with AVIF support.
+
+    python responsive_images.py                 # build what changed
+    python responsive_images.py --workers 4
+    python responsive_images.py --clear         # drop every variant and the cache
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PIL import Image as PILImage, ImageOps
+
+import asset_manifest
+import image_cache
+
+ROOT = asset_manifest.ROOT
+PUBLIC_DIR = asset_manifest.PUBLIC_DIR
+OUTPUT_DIR = asset_manifest.RESPONSIVE_DIR
+SRCSET_FILE = os.path.join(OUTPUT_DIR, 'srcset.json')
+CACHE_FILE = os.path.join(ROOT, '.cache', 'responsive.json')
+
+WIDTHS = (480, 960, 1600)
+# Format -> Pillow save options
+FORMATS = {
+    'avif': {'quality': 60},
+    'webp': {'quality': 80, 'method': 6},
+}
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+
+def settings_key():
+    """Changes whenever the variants of an unchanged source would come out differently"""
+    return json.dumps([WIDTHS, FORMATS], sort_keys=True)
+
+
+def variant_widths(width):
+    widths = [step for step in WIDTHS if step < width]
+    if width <= WIDTHS[-1]:
+        widths.append(width)
+    return widths
+
+
+def variant_relpath(relpath, width, fmt):
+    return f"{os.path.splitext(relpath)[0]}-{width}.{fmt}"
+
+
+def public_url(relpath):
+    return '/' + relpath.replace(os.sep, '/')
+
+
+def sources():
+    """({relpath: Asset}, {relpath: encoded relpath}) for the raster images the site serves
+
+    An image present in several formats (patio-door-1.png and .webp) is
+    encoded once, from the manifest's preferred format; the second map
+    points every format's path at the one that was encoded.
+    """
+    found, served = {}, {}
+    for entry in asset_manifest.manifest().values():
+        if not entry.path.startswith(PUBLIC_DIR + os.sep) or not entry.width:
+            continue
+        relpath = os.path.relpath(entry.path, PUBLIC_DIR)
+        if os.path.splitext(relpath)[1].lower() not in SOURCE_EXTENSIONS:
+            continue
+        preferred = asset_manifest.asset(asset_manifest.logical_name(relpath))
+        served[relpath] = os.path.relpath(preferred.path, PUBLIC_DIR)
+        found[served[relpath]] = preferred
+    return dict(sorted(found.items())), dict(sorted(served.items()))
+
+
+def encode(path, relpath):
+    """Worker body: write every variant of one source; returns (relpath, widths, variant relpaths, seconds)"""
+    started = time.perf_counter()
+    written = []
+    # The widest variant is at most WIDTHS[-1], so large JPEGs can decode reduced
+    with image_cache.decoded(path, (WIDTHS[-1], 1), displayed=True) as im:
+        im = ImageOps.exif_transpose(im)
+        if im.mode == 'P':
+            im = im.convert('RGBA' if 'transparency' in im.info else 'RGB')
+        elif im.mode not in ('RGB', 'RGBA'):
+            im = im.convert('RGBA' if 'A' in im.getbands() else 'RGB')
+        im.load()
+    widths = variant_widths(im.width)
+    for width in widths:
+        height = max(1, round(im.height * width / im.width))
+        resized = im if width == im.width else im.resize((width, height), PILImage.LANCZOS)
+        for fmt, options in FORMATS.items():
+            out_relpath = variant_relpath(relpath, width, fmt)
+            out_path = os.path.join(OUTPUT_DIR, out_relpath)
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+            tmp = f"{out_path}.{os.getpid()}.tmp"
+            resized.save(tmp, fmt.upper(), **options)
+            os.replace(tmp, out_path)
+            written.append(out_relpath)
+    return relpath, widths, written, time.perf_counter() - started
+
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def srcset_map(found, served, cache):
+    images = {}
+    for url_relpath, relpath in served.items():
+        entry = found[relpath]
+        widths = cache[relpath]['widths']
+        srcset = {fmt: ', '.join(f"{public_url(os.path.join('responsive', variant_relpath(relpath, width, fmt)))} {width}w"
+                                 for width in widths)
+                  for fmt in FORMATS}
+        images[public_url(url_relpath)] = {'width': entry.width, 'height': entry.height, 'srcset': srcset}
+    return images
+
+
+def build(workers=None):
+    """Encode the variants of new and changed images; returns a report dict"""
+    found, served = sources()
+    cache = load_cache()
+    key = settings_key()
+
+    stale = [relpath for relpath in cache if relpath not in found]
+    for relpath in stale:
+        for variant in cache.pop(relpath)['variants']:
+            path = os.path.join(OUTPUT_DIR, variant)
+            if os.path.exists(path):
+                os.remove(path)
+    if stale:
+        write_json(CACHE_FILE, cache)
+
+    pending = []
+    for relpath, entry in found.items():
+        record = cache.get(relpath)
+        up_to_date = (record and record['sha256'] == entry.sha256 and record['settings'] == key
+                      and all(os.path.exists(os.path.join(OUTPUT_DIR, v)) for v in record['variants']))
+        if not up_to_date:
+            pending.append((entry.path, relpath))
+
+    timings = {}
+    if pending:
+        pending.sort(key=lambda item: -os.path.getsize(item[0]))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(encode, path, relpath) for path, relpath in pending]
+            for future in as_completed(futures):
+                relpath, widths, written, seconds = future.result()
+                timings[relpath] = seconds
+                cache[relpath] = {'sha256': found[relpath].sha256, 'settings': key,
+                                  'widths': widths, 'variants': written}
+                print(f"  {relpath:<48} {len(written):>2} variants {seconds:6.2f}s")
+                # Saved as it goes, so an interrupted run keeps what it finished
+                write_json(CACHE_FILE, cache)
+
+    write_json(SRCSET_FILE, srcset_map(found, served, cache))
+    return {'sources': len(found), 'encoded': len(timings), 'removed': len(stale), 'timings': timings}
+
+
+def clear():
+    if os.path.isdir(OUTPUT_DIR):
+        shutil.rmtree(OUTPUT_DIR)
+    if os.path.exists(CACHE_FILE):
+        os.remove(CACHE_FILE)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build responsive WebP/AVIF variants of the website images")
+    parser.add_argument('--workers', type=int, default=None, help="encoder processes (default: one per core)")
+    parser.add_argument('--clear', action='store_true', help="remove every variant and the hash cache")
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        clear()
+        print(f"✓ Cleared {OUTPUT_DIR}")
+        return 0
+
+    started = time.perf_counter()
+    report = build(args.workers)
+    wall = time.perf_counter() - started
+    print(f"✓ {report['encoded']} of {report['sources']} images re-encoded, "
+          f"{report['removed']} removed, in {wall:.2f}s")
+    if report['timings']:
+        print(f"  {sum(report['timings'].values()):.2f}s of encoding spread over the pool")
+    print(f"✓ srcset map written to {SRCSET_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Incremental section-level builds for the ReportLab brand books
+
+A book given as (name, flowables) sections, each starting on a new page, is
+rendered one section at a time into .cache/sections/<hash>.pdf. The hash
+covers everything that affects the section's layout: paragraph text and
+styles, table data and table styles, image content and placement, and the
+page template. Editing one bullet therefore re-renders only its section.
+
+The cached fragments are stitched together with pypdf, and the page-number
+footers are stamped over the assembled book with the document's own
+canvasmaker, so the result matches a full doc.build().
+
+build_parallel() lays the sections out at the same time in a process pool.
+Once every fragment's page count is known, the table of contents is laid
+out again with the real page numbers; that and the footer overlay are the
+only serial work left after the pool. build_incremental() numbers the
+contents the same way. A full doc.build() (build_numbered) sets the contents
+with the page map of the previous build, kept next to the fragments, and
+lays the book out again only if the sections have moved, as
+create_faq_handbook.py does; every build mode makes the same book.
+
+    python section_cache.py              # incremental build of create_complete_brandbook
+    python section_cache.py --parallel   # same, rendering changed sections in a process pool
+    python section_cache.py --clear      # drop every cached fragment
+"""
+
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+
+import reportlab
+from reportlab.platypus import SimpleDocTemplate, Image
+
+import brand_canvas
+import image_cache
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, '.cache', 'sections')
+
+# Bump when the fragment rendering itself changes
+CACHE_VERSION = 1
+
+
+def fingerprint(obj, _sha=None, _seen=None):
+    """Stable SHA-256 over a flowable tree: text, styles, table data, images"""
+    sha = _sha or hashlib.sha256()
+    seen = _seen if _seen is not None else set()
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        sha.update(repr(obj).encode('utf-8'))
+    elif isinstance(obj, (list, tuple)):
+        sha.update(b'[')
+        for item in obj:
+            fingerprint(item, sha, seen)
+        sha.update(b']')
+    elif isinstance(obj, dict):
+        sha.update(b'{')
+        for key in sorted(obj, key=repr):
+            sha.update(repr(key).encode('utf-8'))
+            fingerprint(obj[key], sha, seen)
+        sha.update(b'}')
+    elif isinstance(obj, (set, frozenset)):
+        fingerprint(sorted(obj, key=repr), sha, seen)
+    elif isinstance(obj, (type, types.FunctionType, types.BuiltinFunctionType, types.MethodType)):
+        sha.update(f"{obj.__module__}.{obj.__qualname__}".encode('utf-8'))
+    elif id(obj) in seen:
+        sha.update(b'<cycle>')
+    else:
+        seen.add(id(obj))
+        sha.update(type(obj).__qualname__.encode('utf-8'))
+        if isinstance(obj, Image) and isinstance(obj.filename, str):
+            # The file name says nothing about the pixels behind it
+            sha.update(image_cache.file_digest(obj.filename).encode('ascii'))
+        fingerprint({k: v for k, v in vars(obj).items() if k not in ('_img', '_file')}, sha, seen)
+    return sha
+
+
+def section_key(flowables, doc_options):
+    sha = hashlib.sha256()
+    fingerprint((CACHE_VERSION, reportlab.Version, doc_options), sha)
+    fingerprint(flowables, sha)
+    return sha.hexdigest()
+
+
+def render_section(flowables, path, doc_options):
+    """Lay out one section on its own into a PDF fragment"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    SimpleDocTemplate(tmp, **doc_options).build(list(flowables))
+    os.replace(tmp, path)
+
+
+def fragment_path(flowables, doc_options, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, section_key(flowables, doc_options) + '.pdf')
+
+
+def page_count(path):
+    from pypdf import PdfReader
+
+    return len(PdfReader(path).pages)
+
+
+def stitch(fragment_paths, pdf_file, canvasmaker=None):
+    """Concatenate fragments and stamp page numbers over the assembled book"""
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    for path in fragment_paths:
+        writer.append(path)
+    metadata = PdfReader(fragment_paths[0]).metadata
+    if metadata:
+        writer.add_metadata(metadata)
+    if canvasmaker is not None:
+        page_sizes = [(float(page.mediabox.width), float(page.mediabox.height)) for page in writer.pages]
+        overlay = PdfReader(io.BytesIO(brand_canvas.page_number_overlay(canvasmaker, page_sizes)))
+        for page, footer in zip(writer.pages, overlay.pages):
+            page.merge_page(footer)
+    writer.compress_identical_objects()
+    with open(pdf_file, 'wb') as f:
+        writer.write(f)
+    return len(writer.pages)
+
+
+class SectionDocTemplate(SimpleDocTemplate):
+    """Records the page each section's first flowable lands on
+
+    page_map is {section name: first page} once the build has finished.
+    """
+
+    def __init__(self, filename, sections, **kwargs):
+        SimpleDocTemplate.__init__(self, filename, **kwargs)
+        self.starts = {id(flowables[0]): name for name, flowables in sections if flowables}
+        self.page_map = {}
+
+    def afterFlowable(self, flowable):
+        name = self.starts.get(id(flowable))
+        if name is not None:
+            self.page_map.setdefault(name, self.page)
+
+
+def page_map_path(module_name, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, f"{module_name}-page-map.json")
+
+
+def load_page_map(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_page_map(path, page_map):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(page_map, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def build_numbered(build_sections, pdf_file, doc_options, canvasmaker=None, page_map_file=None, max_passes=4):
+    """Lay the whole book out with doc.build(), its contents numbered; returns the passes taken
+
+    build_sections(page_map) returns the book's sections. The first pass
+    uses the page map saved by the previous build, so an unchanged book is
+    laid out once; only if the sections land elsewhere is it laid out again.
+    """
+    cached = page_map = load_page_map(page_map_file) if page_map_file else {}
+    tmp = f"{pdf_file}.{os.getpid()}.tmp"
+    for passes in range(1, max_passes + 1):
+        sections = build_sections(page_map)
+        doc = SectionDocTemplate(tmp, sections, **doc_options)
+        doc.build([flowable for _, flowables in sections for flowable in flowables], canvasmaker=canvasmaker)
+        if doc.page_map == page_map:
+            break
+        page_map = doc.page_map
+    else:
+        os.remove(tmp)
+        raise RuntimeError(f"contents page numbers still changing after {max_passes} layout passes")
+    os.replace(tmp, pdf_file)
+    if page_map_file and page_map != cached:
+        save_page_map(page_map_file, page_map)
+    return passes
+
+
+def fragments_page_map(sections, paths):
+    """{section name: first page} from the page counts of rendered fragments"""
+    page_map, page = {}, 1
+    for (name, _), path in zip(sections, paths):
+        page_map[name] = page
+        page += page_count(path)
+    return page_map
+
+
+def renumber_contents(sections, paths, report, build_sections, doc_options, toc_section, cache_dir=CACHE_DIR):
+    """Swap the contents fragment for one laid out with the real page numbers
+
+    build_sections(page_map) returns the book's sections with the numbers
+    in the contents; paths and report are updated in place.
+    """
+    names = [name for name, _ in sections]
+    if toc_section not in names:
+        return
+    started = time.perf_counter()
+    index = names.index(toc_section)
+    flowables = dict(build_sections(fragments_page_map(sections, paths)))[toc_section]
+    path = fragment_path(flowables, doc_options, cache_dir)
+    status = 'cached'
+    if not os.path.exists(path):
+        render_section(flowables, path, doc_options)
+        status = 'rendered'
+    if page_count(path) != page_count(paths[index]):
+        raise ValueError(f"{toc_section} changed length once page numbers were added")
+    paths[index] = path
+    report[index] = (toc_section, status, report[index][2] + time.perf_counter() - started)
+
+
+def build_incremental(sections, pdf_file, doc_options, canvasmaker=None, cache_dir=CACHE_DIR,
+                      build_sections=None, toc_section="Table of Contents"):
+    """Render only the sections whose content changed, then stitch the book
+
+    With build_sections(page_map), the toc_section is then laid out again
+    with the real page numbers, as build_parallel() does. Returns
+    [(name, 'cached' | 'rendered', seconds)] in section order.
+    """
+    report, fragments = [], []
+    for name, flowables in sections:
+        started = time.perf_counter()
+        path = fragment_path(flowables, doc_options, cache_dir)
+        if os.path.exists(path):
+            status = 'cached'
+        else:
+            render_section(flowables, path, doc_options)
+            status = 'rendered'
+        fragments.append(path)
+        report.append((name, status, time.perf_counter() - started))
+    if build_sections is not None:
+        renumber_contents(sections, fragments, report, build_sections, doc_options, toc_section, cache_dir)
+    stitch(fragments, pdf_file, canvasmaker)
+    return report
+
+
+# Sections of the module a pool worker renders from, built once per worker
+_worker_sections = None
+
+
+def _init_worker(module_name):
+    global _worker_sections
+    _worker_sections = importlib.import_module(module_name).build_sections()
+
+
+def _render_in_worker(index, path, doc_options):
+    started = time.perf_counter()
+    render_section(_worker_sections[index][1], path, doc_options)
+    return time.perf_counter() - started
+
+
+def build_parallel(module_name, pdf_file, canvasmaker=None, workers=None,
+                   toc_section="Table of Contents", cache_dir=CACHE_DIR):
+    """Render a book module's changed sections in a process pool, then stitch it
+
+    The module provides DOC_OPTIONS and build_sections(page_map=None); pool
+    workers import it and build the sections themselves, so no flowables
+    cross process boundaries. After the pool, build_sections() is called
+    again with {section name: first page} and the toc_section is re-rendered
+    with those page numbers. Returns [(name, status, seconds)] like
+    build_incremental().
+    """
+    module = importlib.import_module(module_name)
+    doc_options = module.DOC_OPTIONS
+    sections = module.build_sections()
+    paths = [fragment_path(flowables, doc_options, cache_dir) for _, flowables in sections]
+    report = [(name, 'cached', 0.0) for name, _ in sections]
+
+    pending = {}
+    for index, path in enumerate(paths):
+        if not os.path.exists(path):
+            pending.setdefault(path, index)
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(module_name,)) as pool:
+            futures = {index: pool.submit(_render_in_worker, index, path, doc_options)
+                       for path, index in pending.items()}
+            for index, future in futures.items():
+                report[index] = (sections[index][0], 'rendered', future.result())
+
+    renumber_contents(sections, paths, report, module.build_sections, doc_options, toc_section, cache_dir)
+    stitch(paths, pdf_file, canvasmaker)
+    return report
+
+
+def print_report(report):
+    rendered = [name for name, status, _ in report if status == 'rendered']
+    for name, status, seconds in report:
+        print(f"  {'↻' if status == 'rendered' else '·'} {name:<34} {status:<9} {seconds:5.2f}s")
+    print(f"✓ Re-rendered {len(rendered)} of {len(report)} sections")
+
+
+def clear(cache_dir=CACHE_DIR):
+    if os.path.isdir(cache_dir):
+        for name in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, name))
+
+
+if __name__ == "__main__":
+    if '--clear' in sys.argv[1:]:
+        clear()
+        print(f"✓ Cleared {CACHE_DIR}")
+    else:
+        import create_complete_brandbook
+        create_complete_brandbook.build(incremental=True, parallel='--parallel' in sys.argv[1:])
@@ -0,0 +1,83 @@
+"""NumberedCanvas page numbering keeps memory flat as the page count grows"""
+
+import io
+import tracemalloc
+
+from reportlab.lib.pagesizes import landscape, letter
+from reportlab.lib.units import inch
+from reportlab.pdfgen import canvas
+
+from brand_canvas import NumberedCanvas
+
+# Allowed numbering overhead over a canvas that knows the total up front
+OVERHEAD_LIMIT = 64 * 1024
+
+
+class SnapshotCanvas(NumberedCanvas):
+    """The previous per-page __dict__ snapshot canvas, for comparison"""
+
+    def __init__(self, *args, **kwargs):
+        NumberedCanvas.__init__(self, *args, **kwargs)
+        self._saved_page_states = []
+
+    def showPage(self):
+        self._saved_page_states.append(dict(self.__dict__))
+        self._startPage()
+
+    def save(self):
+        page_count = len(self._saved_page_states)
+        for page_num, state in enumerate(self._saved_page_states, 1):
+            self.__dict__.update(state)
+            if page_num > 1:
+                self.draw_page_number(page_num, page_count, self._pagesize[0])
+            canvas.Canvas.showPage(self)
+        canvas.Canvas.save(self)
+
+
+class KnownTotalCanvas(NumberedCanvas):
+    """Baseline that already knows the page count and stamps footers inline"""
+
+    page_count = 0
+
+    def showPage(self):
+        page_num = self.getPageNumber()
+        if page_num > 1:
+            self.draw_page_number(page_num, self.page_count, self._pagesize[0])
+        canvas.Canvas.showPage(self)
+
+    def _stamp_page_numbers(self):
+        pass
+
+
+def peak_memory(canvasmaker, page_count, lines_per_page=10):
+    """Peak traced bytes for drawing and saving a synthetic document"""
+    tracemalloc.start()
+    try:
+        c = canvasmaker(io.BytesIO(), pagesize=landscape(letter))
+        for _ in range(page_count):
+            c.setFont("Helvetica", 11)
+            for line in range(lines_per_page):
+                c.drawString(inch, 7.5 * inch - line * 12, "Crafting Excellence. Building Trust. " * 2)
+            c.showPage()
+        c.save()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def overhead(canvasmaker, page_count):
+    KnownTotalCanvas.page_count = page_count
+    baseline = peak_memory(KnownTotalCanvas, page_count)
+    return peak_memory(canvasmaker, page_count) - baseline
+
+
+def test_numbering_overhead_stays_flat():
+    peak_memory(NumberedCanvas, 1)  # warm font and module caches
+    for page_count in (10, 100, 500, 2000):
+        assert overhead(NumberedCanvas, page_count) < OVERHEAD_LIMIT, f"{page_count} pages"
+
+
+def test_snapshot_overhead_grows():
+    # Shows the check can fail: the old snapshot canvas's overhead is per page
+    peak_memory(SnapshotCanvas, 1)
+    assert overhead(SnapshotCanvas, 500) > OVERHEAD_LIMIT
@@ -0,0 +1,61 @@
+"""image_cache.decoded() keeps decodes reduced and within the memory ceiling"""
+
+import math
+
+import pytest
+from PIL import Image as PILImage, ImageOps
+from PIL.JpegImagePlugin import JpegImageFile
+
+import image_cache
+from image_cache import DecodeCeilingError
+
+SIZE = (2000, 1500)
+
+
+@pytest.fixture
+def jpeg(tmp_path):
+    path = tmp_path / "photo.jpg"
+    PILImage.new('RGB', SIZE, (0x65, 0x43, 0x21)).save(path, quality=80)
+    return str(path)
+
+
+def test_image_over_the_ceiling_is_refused(jpeg, monkeypatch):
+    # 2000 x 1500 RGB decodes to about 8.6 MB
+    monkeypatch.setattr(image_cache, 'DECODE_CEILING_MB', 4)
+    with pytest.raises(DecodeCeilingError, match="over the 4 MB ceiling"):
+        with image_cache.decoded(jpeg):
+            pass
+    with pytest.raises(MemoryError):
+        with image_cache.decoded(jpeg, ceiling_mb=1):
+            pass
+
+
+def test_small_bound_decodes_jpeg_at_reduced_scale(jpeg, monkeypatch):
+    drafts = []
+    draft = JpegImageFile.draft
+
+    def recording_draft(self, mode, size):
+        drafts.append(size)
+        return draft(self, mode, size)
+
+    monkeypatch.setattr(JpegImageFile, 'draft', recording_draft)
+    # Reduced to 1/8 scale the same photo is well inside a 4 MB ceiling
+    with image_cache.decoded(jpeg, (200, 150), ceiling_mb=4) as im:
+        im.load()
+        assert drafts == [(200, 150)]
+        # 1/8 DCT scale, rounded up
+        assert im.size == (math.ceil(SIZE[0] / 8), math.ceil(SIZE[1] / 8))
+
+
+def test_draft_size_follows_exif_rotation(tmp_path):
+    # Stored 2000 x 1500, shown 1500 x 2000 after a quarter turn (orientation 6)
+    path = str(tmp_path / "rotated.jpg")
+    exif = PILImage.Exif()
+    exif[0x0112] = 6
+    PILImage.new('RGB', SIZE, (0x65, 0x43, 0x21)).save(path, quality=80, exif=exif)
+    assert image_cache.displayed_size(path) == (SIZE[1], SIZE[0])
+    # 1000 px wide as displayed is 1000 px tall as stored, which half scale
+    # (750 px) would not cover
+    with image_cache.decoded(path, (1000, 1), displayed=True) as im:
+        im.load()
+        assert ImageOps.exif_transpose(im).width >= 1000
@@ -0,0 +1,26 @@
+"""placeholders copes with images smaller than the placeholder itself"""
+
+import base64
+import io
+
+import numpy as np
+from PIL import Image as PILImage
+
+import placeholders
+from placeholders import PLACEHOLDER_SIZE, block_average
+
+
+def test_block_average_repeats_a_small_source():
+    pixels = np.arange(4 * 4 * 3, dtype=np.float64).reshape(4, 4, 3)
+    small = block_average(pixels, (PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    assert small.shape == (PLACEHOLDER_SIZE, PLACEHOLDER_SIZE, 3)
+    assert np.array_equal(small[:4, :4], np.broadcast_to(pixels[0, 0], (4, 4, 3)))
+
+
+def test_placeholder_of_a_4x4_image(tmp_path):
+    path = tmp_path / "tiny.png"
+    PILImage.new('RGB', (4, 4), (0x65, 0x43, 0x21)).save(path)
+    uri = placeholders.placeholder(str(path))
+    data = base64.b64decode(uri.split(',', 1)[1])
+    with PILImage.open(io.BytesIO(data)) as im:
+        assert im.size == (PLACEHOLDER_SIZE, PLACEHOLDER_SIZE)